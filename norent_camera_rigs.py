@@ -3,45 +3,26 @@ import bmesh
 from mathutils import Vector, Euler
 from mathutils.noise import noise
 from bpy.types import Operator
-from bpy.props import FloatProperty, IntProperty, EnumProperty, BoolProperty
+from bpy.app.handlers import persistent
+from bpy.props import FloatProperty, IntProperty, EnumProperty, BoolProperty, StringProperty, FloatVectorProperty
 import math
+import numpy as np
+
+from .rig_builder import build_rig
 
 class NORENT_OT_CameraAddBasic(Operator):
     """Add basic camera rig with null controls"""
     bl_idname = "norent.camera_add_basic"
     bl_label = "Add Basic Camera Rig"
     bl_description = "Create camera with control empty for easy animation"
+    bl_options = {'REGISTER', 'UNDO'}
     
     def execute(self, context):
-        # Create camera
-        bpy.ops.object.camera_add()
-        camera = context.object
-        camera.name = "NORENT_Camera"
-        
-        # Position camera
-        camera.location = (7, -7, 5)
-        camera.rotation_euler = (1.1, 0, 0.785)
-        
-        # Create control empty
-        bpy.ops.object.empty_add(type='PLAIN_AXES', location=(0, 0, 0))
-        control_empty = context.object
-        control_empty.name = "NORENT_Camera_Control"
-        control_empty.empty_display_size = 2.0
-        
-        # Parent camera to control
-        camera.parent = control_empty
-        camera.parent_type = 'OBJECT'
+        camera, _ = build_rig(context.scene, 'BASIC', context.collection)
         
         # Set as active camera
         context.scene.camera = camera
         
-        # Add custom properties for easy animation
-        control_empty["orbit_distance"] = 10.0
-        control_empty["height"] = 5.0
-        control_empty["target_x"] = 0.0
-        control_empty["target_y"] = 0.0
-        control_empty["target_z"] = 0.0
-        
         self.report({'INFO'}, "Basic camera rig created")
         return {'FINISHED'}
 
@@ -50,6 +31,7 @@ class NORENT_OT_CameraAddHandheld(Operator):
     bl_idname = "norent.camera_add_handheld"
     bl_label = "Add Handheld Camera"
     bl_description = "Create camera with built-in handheld shake"
+    bl_options = {'REGISTER', 'UNDO'}
     
     shake_strength: FloatProperty(
         name="Shake Strength",
@@ -68,52 +50,16 @@ class NORENT_OT_CameraAddHandheld(Operator):
     )
     
     def execute(self, context):
-        # Create basic rig first
-        bpy.ops.norent.camera_add_basic()
-        camera = bpy.data.objects["NORENT_Camera"]
-        
-        # Rename for handheld
-        camera.name = "NORENT_Handheld_Camera"
-        
-        # Add noise modifiers for shake
-        self.add_handheld_shake(camera, self.shake_strength, self.shake_speed)
+        # Basic rig plus noise drivers, built in one pass
+        camera, _ = build_rig(
+            context.scene, 'HANDHELD', context.collection,
+            strength=round(self.shake_strength, 4), speed=round(self.shake_speed, 4)
+        )
+        context.scene.camera = camera
         
         self.report({'INFO'}, f"Handheld camera created (shake: {self.shake_strength})")
         return {'FINISHED'}
     
-    def add_handheld_shake(self, camera, strength, speed):
-        """Add noise-based shake to camera"""
-        # Add noise modifier to location
-        for i, axis in enumerate(['X', 'Y', 'Z']):
-            # Create driver for each axis
-            driver = camera.driver_add("location", i).driver
-            driver.type = 'SCRIPTED'
-            
-            # Add noise expression
-            noise_expr = f"noise(frame * {speed} * 0.1 + {i * 10}) * {strength}"
-            driver.expression = noise_expr
-            
-            # Add frame variable
-            var = driver.variables.new()
-            var.name = "frame"
-            var.type = 'SINGLE_PROP'
-            var.targets[0].id = bpy.context.scene
-            var.targets[0].data_path = "frame_current"
-        
-        # Add subtle rotation shake
-        for i, axis in enumerate(['X', 'Y', 'Z']):
-            driver = camera.driver_add("rotation_euler", i).driver
-            driver.type = 'SCRIPTED'
-            
-            noise_expr = f"noise(frame * {speed} * 0.08 + {i * 15}) * {strength * 0.1}"
-            driver.expression = noise_expr
-            
-            var = driver.variables.new()
-            var.name = "frame"
-            var.type = 'SINGLE_PROP'
-            var.targets[0].id = bpy.context.scene
-            var.targets[0].data_path = "frame_current"
-    
     def invoke(self, context, event):
         return context.window_manager.invoke_props_dialog(self)
 
@@ -122,6 +68,7 @@ class NORENT_OT_CameraAddDolly(Operator):
     bl_idname = "norent.camera_add_dolly"
     bl_label = "Add Dolly Track"
     bl_description = "Create camera on a curved dolly track"
+    bl_options = {'REGISTER', 'UNDO'}
     
     track_length: FloatProperty(
         name="Track Length",
@@ -132,38 +79,7 @@ class NORENT_OT_CameraAddDolly(Operator):
     )
     
     def execute(self, context):
-        # Create curve for dolly track
-        bpy.ops.curve.primitive_nurbs_path_add()
-        curve = context.object
-        curve.name = "NORENT_Dolly_Track"
-        
-        # Scale and position track
-        curve.scale = (self.track_length / 2, self.track_length / 2, 1)
-        curve.location = (0, 0, 2)
-        
-        # Create camera
-        bpy.ops.object.camera_add()
-        camera = context.object
-        camera.name = "NORENT_Dolly_Camera"
-        
-        # Add follow path constraint
-        constraint = camera.constraints.new(type='FOLLOW_PATH')
-        constraint.target = curve
-        constraint.use_curve_follow = True
-        constraint.use_curve_radius = False
-        
-        # Add custom property for animation
-        camera["dolly_position"] = 0.0
-        
-        # Create driver to control position
-        driver = constraint.driver_add("offset_factor").driver
-        driver.type = 'AVERAGE'
-        
-        var = driver.variables.new()
-        var.name = "position"
-        var.type = 'SINGLE_PROP'
-        var.targets[0].id = camera
-        var.targets[0].data_path = '["dolly_position"]'
+        camera, _ = build_rig(context.scene, 'DOLLY', context.collection, track_length=round(self.track_length, 4))
         
         # Set as active camera
         context.scene.camera = camera
@@ -239,11 +155,207 @@ class NORENT_OT_CameraPushIn(Operator):
     def invoke(self, context, event):
         return context.window_manager.invoke_props_dialog(self)
 
+def is_rig_object(obj):
+    return obj.get("norent_rig") is not None
+
+def rig_objects(camera):
+    """Collect the objects of a camera rig: the camera's parent chain plus NORENT rig objects it evaluates.
+    
+    Constraint and driver targets are only followed into objects tagged
+    norent_rig, so a logo the camera tracks is never treated as rig.
+    """
+    members = []
+    pending = [camera]
+    parent = camera.parent
+    while parent:
+        pending.append(parent)
+        parent = parent.parent
+    while pending:
+        obj = pending.pop()
+        if obj is None or obj in members:
+            continue
+        members.append(obj)
+        if obj.parent and is_rig_object(obj.parent):
+            pending.append(obj.parent)
+        
+        targets = [getattr(constraint, "target", None) for constraint in obj.constraints]
+        if obj.animation_data:
+            for fcurve in obj.animation_data.drivers:
+                for var in fcurve.driver.variables:
+                    targets.extend(target.id for target in var.targets)
+        pending.extend(
+            target for target in targets if isinstance(target, bpy.types.Object) and is_rig_object(target)
+        )
+    return members
+
+# Rig objects muted by shot switching or the transform cache:
+# object name -> {"owners": set, "drivers": [indices], "constraints": [names]}
+_muted_rigs = {}
+
+def mute_rig_object(obj, owner):
+    """Stop a rig object's drivers and constraints from evaluating"""
+    state = _muted_rigs.get(obj.name)
+    if state:
+        state["owners"].add(owner)
+        return
+    
+    drivers = []
+    if obj.animation_data:
+        for i, fcurve in enumerate(obj.animation_data.drivers):
+            if not fcurve.mute:
+                fcurve.mute = True
+                drivers.append(i)
+    constraints = []
+    for constraint in obj.constraints:
+        if constraint.enabled:
+            constraint.enabled = False
+            constraints.append(constraint.name)
+    _muted_rigs[obj.name] = {"owners": {owner}, "drivers": drivers, "constraints": constraints}
+
+def unmute_rig_object(obj, owner):
+    """Release one owner's mute; restores the object once no owner is left"""
+    state = _muted_rigs.get(obj.name)
+    if not state:
+        return
+    state["owners"].discard(owner)
+    if state["owners"]:
+        return
+    del _muted_rigs[obj.name]
+    
+    if obj.animation_data:
+        drivers = obj.animation_data.drivers
+        for i in state["drivers"]:
+            if i < len(drivers):
+                drivers[i].mute = False
+    for name in state["constraints"]:
+        constraint = obj.constraints.get(name)
+        if constraint:
+            constraint.enabled = True
+
+@persistent
+def muted_rigs_load_handler(dummy):
+    # Mute states belong to the previous file
+    _muted_rigs.clear()
+
+def unmute_all(owner):
+    """Release every mute held by owner"""
+    for name in [n for n, state in _muted_rigs.items() if owner in state["owners"]]:
+        obj = bpy.data.objects.get(name)
+        if obj:
+            unmute_rig_object(obj, owner)
+        else:
+            del _muted_rigs[name]
+
+# Procedural orbit rig
+ORBIT_RIG_NAME = "NORENT_Orbit_Rig"
+
+ORBIT_EASING_ITEMS = [
+    ('LINEAR', "Linear", "Constant angular speed"),
+    ('EASE_IN', "Ease In", "Slow start, fast end"),
+    ('EASE_OUT', "Ease Out", "Fast start, slow end"),
+    ('EASE_IN_OUT', "Ease In-Out", "Slow start and end")
+]
+
+def orbit_ease(t, easing):
+    """Closed-form easing of normalized time t (float or numpy array)"""
+    if easing == 'EASE_IN':
+        return t * t
+    elif easing == 'EASE_OUT':
+        return t * (2 - t)
+    elif easing == 'EASE_IN_OUT':
+        return t * t * (3 - 2 * t)
+    return t
+
+def orbit_driver_expression(frame_start, frame_end, angle_start, angle_end, easing):
+    """Build the orbit angle as a Blender simple expression (no Python evaluation)"""
+    span = max(frame_end - frame_start, 1)
+    t = f"min(max((frame - {frame_start}) / {span}, 0), 1)"
+    if easing == 'EASE_IN':
+        eased = f"{t} * {t}"
+    elif easing == 'EASE_OUT':
+        eased = f"{t} * (2 - {t})"
+    elif easing == 'EASE_IN_OUT':
+        eased = f"{t} * {t} * (3 - 2 * {t})"
+    else:
+        eased = t
+    return f"{angle_start:.6f} + {angle_end - angle_start:.6f} * ({eased})"
+
+def get_orbit_rig(camera):
+    """Return the orbit rig driving this camera, if any"""
+    parent = camera.parent
+    if parent and parent.get("norent_rig") == 'ORBIT':
+        return parent
+    return None
+
+def ensure_orbit_rig(context, camera):
+    """Reuse the camera's orbit rig or create a single new one"""
+    rig = get_orbit_rig(camera)
+    if rig:
+        return rig
+    
+    rig = bpy.data.objects.new(ORBIT_RIG_NAME, None)
+    rig.empty_display_type = 'SPHERE'
+    rig.empty_display_size = 0.5
+    rig["norent_rig"] = 'ORBIT'
+    
+    collection = camera.users_collection[0] if camera.users_collection else context.scene.collection
+    collection.objects.link(rig)
+    
+    camera.parent = rig
+    camera.parent_type = 'OBJECT'
+    camera.matrix_parent_inverse.identity()
+    return rig
+
+def set_orbit_driver(rig):
+    """(Re)build the single rotation driver from the rig's orbit properties"""
+    rig.driver_remove("rotation_euler", 2)
+    
+    driver = rig.driver_add("rotation_euler", 2).driver
+    driver.type = 'SCRIPTED'
+    driver.expression = orbit_driver_expression(
+        rig["frame_start"], rig["frame_end"],
+        rig["angle_start"], rig["angle_end"], rig["easing"]
+    )
+    return driver
+
+def bake_orbit_rig(rig):
+    """Replace the orbit driver with keyframes computed in bulk"""
+    frame_start = rig["frame_start"]
+    frame_end = rig["frame_end"]
+    
+    frames = np.arange(frame_start, frame_end + 1, dtype=np.float32)
+    span = max(frame_end - frame_start, 1)
+    t = np.clip((frames - frame_start) / span, 0.0, 1.0)
+    angles = rig["angle_start"] + (rig["angle_end"] - rig["angle_start"]) * orbit_ease(t, rig["easing"])
+    
+    rig.driver_remove("rotation_euler", 2)
+    if not rig.animation_data:
+        rig.animation_data_create()
+    if not rig.animation_data.action:
+        rig.animation_data.action = bpy.data.actions.new(name=f"{rig.name}_Action")
+    
+    action = rig.animation_data.action
+    fcurve = action.fcurves.find("rotation_euler", index=2)
+    if fcurve:
+        action.fcurves.remove(fcurve)
+    fcurve = action.fcurves.new("rotation_euler", index=2)
+    
+    # Write every sample in one call instead of keyframe_insert per frame
+    fcurve.keyframe_points.add(len(frames))
+    co = np.empty(len(frames) * 2, dtype=np.float32)
+    co[0::2] = frames
+    co[1::2] = angles
+    fcurve.keyframe_points.foreach_set("co", co)
+    fcurve.keyframe_points.foreach_set("interpolation", np.ones(len(frames), dtype=np.int32))  # LINEAR
+    fcurve.update()
+    return len(frames)
+
 class NORENT_OT_CameraRotate(Operator):
     """Add orbit rotation around target"""
     bl_idname = "norent.camera_rotate"
     bl_label = "Camera Rotate Around"
-    bl_description = "Animate camera orbiting around target"
+    bl_description = "Animate camera orbiting around target with a procedural orbit rig"
+    bl_options = {'REGISTER', 'UNDO'}
     
     duration: IntProperty(
         name="Duration (frames)",
@@ -261,15 +373,46 @@ class NORENT_OT_CameraRotate(Operator):
         max=360.0
     )
     
-    axis: EnumProperty(
-        name="Rotation Axis",
-        description="Axis to rotate around",
-        items=[
-            ('Z', "Z (Up)", "Rotate around Z axis"),
-            ('Y', "Y (Forward)", "Rotate around Y axis"),
-            ('X', "X (Right)", "Rotate around X axis")
-        ],
-        default='Z'
+    center: FloatVectorProperty(
+        name="Center",
+        description="Point the camera orbits around",
+        default=(0.0, 0.0, 0.0),
+        subtype='TRANSLATION'
+    )
+    
+    radius: FloatProperty(
+        name="Radius",
+        description="Orbit distance from center",
+        default=10.0,
+        min=0.1,
+        max=1000.0
+    )
+    
+    height: FloatProperty(
+        name="Height",
+        description="Camera height above center",
+        default=5.0,
+        min=-1000.0,
+        max=1000.0
+    )
+    
+    easing: EnumProperty(
+        name="Easing",
+        description="Easing of the orbit angle",
+        items=ORBIT_EASING_ITEMS,
+        default='EASE_IN_OUT'
+    )
+    
+    target: StringProperty(
+        name="Look-At Target",
+        description="Object the camera looks at (empty to look at the orbit center)",
+        default=""
+    )
+    
+    bake: BoolProperty(
+        name="Bake Keyframes",
+        description="Bake the orbit into keyframes instead of a live driver",
+        default=False
     )
     
     def execute(self, context):
@@ -278,62 +421,61 @@ class NORENT_OT_CameraRotate(Operator):
             self.report({'ERROR'}, "No active camera found")
             return {'CANCELLED'}
         
-        # Create empty at scene center for rotation pivot
-        bpy.ops.object.empty_add(type='PLAIN_AXES', location=(0, 0, 0))
-        pivot = context.object
-        pivot.name = "NORENT_Camera_Pivot"
+        rig = ensure_orbit_rig(context, camera)
+        rig.location = self.center
+        rig.rotation_euler = (0.0, 0.0, 0.0)
         
-        # Parent camera to pivot (keep transforms)
-        camera.parent = pivot
-        camera.parent_type = 'OBJECT'
+        # Start from the camera's current bearing so the orbit doesn't jump
+        offset = camera.matrix_world.translation - Vector(self.center)
+        angle_start = math.atan2(offset.y, offset.x) if offset.xy.length > 1e-6 else 0.0
         
         current_frame = context.scene.frame_current
-        angle_rad = math.radians(self.angle)
-        
-        # Get current rotation
-        current_rotation = pivot.rotation_euler.copy()
-        
-        # Calculate end rotation based on axis
-        end_rotation = current_rotation.copy()
-        if self.axis == 'X':
-            end_rotation.x += angle_rad
-        elif self.axis == 'Y':
-            end_rotation.y += angle_rad
-        else:  # Z
-            end_rotation.z += angle_rad
-        
-        # Clear existing rotation keyframes
-        if pivot.animation_data:
-            for fcurve in pivot.animation_data.action.fcurves:
-                if "rotation" in fcurve.data_path:
-                    pivot.animation_data.action.fcurves.remove(fcurve)
-        
-        # Set keyframes
-        pivot.rotation_euler = current_rotation
-        pivot.keyframe_insert(data_path="rotation_euler", frame=current_frame)
-        
-        pivot.rotation_euler = end_rotation
-        pivot.keyframe_insert(data_path="rotation_euler", frame=current_frame + self.duration)
-        
-        # Apply easing
-        self.apply_ease_in_out(pivot, "rotation_euler")
-        
-        self.report({'INFO'}, f"Orbit animation added ({self.angle}° around {self.axis})")
+        rig["frame_start"] = current_frame
+        rig["frame_end"] = current_frame + self.duration
+        rig["angle_start"] = angle_start
+        rig["angle_end"] = angle_start + math.radians(self.angle)
+        rig["easing"] = self.easing
+        
+        # Camera sits at a fixed local offset; only the rig rotates
+        camera.location = (self.radius, 0.0, self.height)
+        
+        look_at = camera.constraints.get("NORENT_Orbit_LookAt")
+        if not look_at:
+            look_at = camera.constraints.new(type='TRACK_TO')
+            look_at.name = "NORENT_Orbit_LookAt"
+            look_at.track_axis = 'TRACK_NEGATIVE_Z'
+            look_at.up_axis = 'UP_Y'
+        look_at.target = bpy.data.objects.get(self.target) or rig
+        
+        if self.bake:
+            count = bake_orbit_rig(rig)
+            self.report({'INFO'}, f"Orbit baked ({count} keyframes, {self.angle}°)")
+        else:
+            set_orbit_driver(rig)
+            self.report({'INFO'}, f"Orbit animation added ({self.angle}° over {self.duration} frames)")
         return {'FINISHED'}
     
-    def apply_ease_in_out(self, obj, data_path):
-        """Apply ease in/out to keyframes"""
-        if obj.animation_data and obj.animation_data.action:
-            for fcurve in obj.animation_data.action.fcurves:
-                if data_path in fcurve.data_path:
-                    for keyframe in fcurve.keyframe_points:
-                        keyframe.interpolation = 'BEZIER'
-                        keyframe.handle_left_type = 'AUTO'
-                        keyframe.handle_right_type = 'AUTO'
-    
     def invoke(self, context, event):
         return context.window_manager.invoke_props_dialog(self)
 
+class NORENT_OT_CameraOrbitBake(Operator):
+    """Bake the orbit rig driver into keyframes"""
+    bl_idname = "norent.camera_orbit_bake"
+    bl_label = "Bake Orbit"
+    bl_description = "Bake the active camera's orbit rig into keyframes"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        camera = context.scene.camera
+        rig = get_orbit_rig(camera) if camera else None
+        if not rig:
+            self.report({'ERROR'}, "Active camera has no orbit rig")
+            return {'CANCELLED'}
+        
+        count = bake_orbit_rig(rig)
+        self.report({'INFO'}, f"Orbit baked ({count} keyframes)")
+        return {'FINISHED'}
+
 class NORENT_OT_CameraShake(Operator):
     """Add camera shake to existing camera"""
     bl_idname = "norent.camera_shake"
@@ -491,6 +633,7 @@ classes = [
     NORENT_OT_CameraAddDolly,
     NORENT_OT_CameraPushIn,
     NORENT_OT_CameraRotate,
+    NORENT_OT_CameraOrbitBake,
     NORENT_OT_CameraShake,
     NORENT_OT_CameraFocusPull,
 ]
@@ -498,7 +641,11 @@ classes = [
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
+    
+    bpy.app.handlers.load_post.append(muted_rigs_load_handler)
 
 def unregister():
+    bpy.app.handlers.load_post.remove(muted_rigs_load_handler)
+    
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
\ No newline at end of file
@@ -0,0 +1,299 @@
+import bpy
+from array import array
+from bisect import bisect_right, insort
+from bpy.types import Operator, PropertyGroup
+from bpy.props import IntProperty, BoolProperty, PointerProperty, CollectionProperty
+from bpy.app.handlers import persistent
+
+from .camera_rigs import rig_objects, mute_rig_object, unmute_rig_object, unmute_all
+
+MARKER_PREFIX = "NORENT_Shot"
+
+# Compiled cut lists per scene: built once after an edit, read every frame
+_shot_tables = {}
+
+def _poll_camera(self, obj):
+    return obj.type == 'CAMERA'
+
+def _tag_dirty(self, context):
+    _shot_tables.pop(context.scene.name, None)
+
+def _toggle_switching(self, context):
+    _shot_tables.pop(context.scene.name, None)
+    unmute_all("shots")
+
+class NorentShot(PropertyGroup):
+    frame: IntProperty(
+        name="Frame",
+        description="Frame where this shot starts",
+        default=1,
+        update=_tag_dirty
+    )
+    
+    camera: PointerProperty(
+        name="Camera",
+        description="Camera rig used for this shot",
+        type=bpy.types.Object,
+        poll=_poll_camera,
+        update=_tag_dirty
+    )
+
+class NorentShotList(PropertyGroup):
+    shots: CollectionProperty(type=NorentShot)
+    
+    active_index: IntProperty(
+        name="Active Shot",
+        default=0
+    )
+    
+    use_shot_switching: BoolProperty(
+        name="Switch Cameras",
+        description="Switch the active camera from the shot list on frame change",
+        default=False,
+        update=_toggle_switching
+    )
+    
+    disable_inactive_rigs: BoolProperty(
+        name="Disable Inactive Rigs",
+        description="Mute drivers and constraints of rigs outside the current shot",
+        default=True,
+        update=_toggle_switching
+    )
+
+def renders(obj):
+    """True for objects that put something in the image (geometry, lights, instancers)"""
+    if obj.hide_render:
+        return False
+    return obj.type not in {'CAMERA', 'EMPTY'} or obj.instance_type != 'NONE'
+
+class ShotTable:
+    """Sorted (frame, camera) cuts plus a dense frame -> shot lookup"""
+    
+    def __init__(self, scene):
+        cuts = sorted((shot.frame, shot.camera.name) for shot in scene.norent_shots.shots if shot.camera)
+        self.frames = array('i', (frame for frame, _ in cuts))
+        self.cameras = [name for _, name in cuts]
+        
+        # One entry per frame of the edit so lookups never search
+        self.base = min(scene.frame_start, self.frames[0]) if self.frames else scene.frame_start
+        self.last = max(scene.frame_end, self.frames[-1]) if self.frames else scene.frame_end
+        self.index = array('H' if len(self.cameras) < 0xFFFF else 'I')
+        for frame in range(self.base, self.last + 1):
+            self.index.append(max(bisect_right(self.frames, frame) - 1, 0))
+    
+    def shot_at(self, frame):
+        """Return the shot index active at frame in constant time"""
+        if not self.cameras:
+            return -1
+        frame = min(max(frame, self.base), self.last)
+        return self.index[frame - self.base]
+    
+    def rig_names(self):
+        """Map each shot camera to the names of its rig objects.
+        
+        Objects that render themselves are left out: muting them would
+        freeze what is on screen, not just an idle rig.
+        """
+        rigs = {}
+        for name in set(self.cameras):
+            camera = bpy.data.objects.get(name)
+            if camera:
+                rigs[name] = {obj.name for obj in rig_objects(camera) if not renders(obj)}
+        return rigs
+
+def get_shot_table(scene):
+    """Return the compiled shot table, rebuilding it after edits"""
+    table = _shot_tables.get(scene.name)
+    if table is None:
+        table = ShotTable(scene)
+        table.rigs = table.rig_names()
+        table.current = None
+        _shot_tables[scene.name] = table
+    return table
+
+def switch_to_shot(scene, table, shot):
+    """Activate one shot's camera and only evaluate its rig"""
+    camera = bpy.data.objects.get(table.cameras[shot])
+    if camera and scene.camera != camera:
+        scene.camera = camera
+    
+    if not scene.norent_shots.disable_inactive_rigs:
+        return
+    active = table.rigs.get(table.cameras[shot], set())
+    for name, members in table.rigs.items():
+        for member in members - active:
+            obj = bpy.data.objects.get(member)
+            if obj:
+                mute_rig_object(obj, "shots")
+    for member in active:
+        obj = bpy.data.objects.get(member)
+        if obj:
+            unmute_rig_object(obj, "shots")
+
+@persistent
+def shot_frame_change_handler(scene, depsgraph=None):
+    shots = getattr(scene, "norent_shots", None)
+    if not shots or not shots.use_shot_switching:
+        return
+    table = get_shot_table(scene)
+    shot = table.shot_at(scene.frame_current)
+    # Only touch cameras and rigs on an actual cut
+    if shot < 0 or shot == table.current:
+        return
+    table.current = shot
+    switch_to_shot(scene, table, shot)
+
+@persistent
+def shot_load_handler(dummy):
+    _shot_tables.clear()
+
+@persistent
+def shot_undo_handler(dummy):
+    # Undo/redo can restore or drop shots without firing any update callback
+    _shot_tables.clear()
+
+@persistent
+def shot_save_handler(dummy):
+    # Never save rigs muted; the next cut mutes them again
+    unmute_all("shots")
+    _shot_tables.clear()
+
+class NORENT_OT_ShotAdd(Operator):
+    """Add a cut to the shot list"""
+    bl_idname = "norent.shot_add"
+    bl_label = "Add Shot"
+    bl_description = "Cut to the active camera at the current frame"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        scene = context.scene
+        camera = context.object if context.object and context.object.type == 'CAMERA' else scene.camera
+        if not camera:
+            self.report({'ERROR'}, "No camera to cut to")
+            return {'CANCELLED'}
+        
+        shots = scene.norent_shots.shots
+        existing = next((shot for shot in shots if shot.frame == scene.frame_current), None)
+        shot = existing or shots.add()
+        shot.frame = scene.frame_current
+        shot.camera = camera
+        
+        sort_shots(scene)
+        sync_markers(scene)
+        self.report({'INFO'}, f"Cut to {camera.name} at frame {scene.frame_current}")
+        return {'FINISHED'}
+
+class NORENT_OT_ShotRemove(Operator):
+    """Remove the active cut from the shot list"""
+    bl_idname = "norent.shot_remove"
+    bl_label = "Remove Shot"
+    bl_description = "Remove the selected cut"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        scene = context.scene
+        shot_list = scene.norent_shots
+        if not shot_list.shots:
+            return {'CANCELLED'}
+        
+        shot_list.shots.remove(shot_list.active_index)
+        shot_list.active_index = max(min(shot_list.active_index, len(shot_list.shots) - 1), 0)
+        _shot_tables.pop(scene.name, None)
+        
+        sync_markers(scene)
+        return {'FINISHED'}
+
+class NORENT_OT_ShotsFromMarkers(Operator):
+    """Build the shot list from camera-bound timeline markers"""
+    bl_idname = "norent.shots_from_markers"
+    bl_label = "Shots From Markers"
+    bl_description = "Read cuts from timeline markers bound to cameras"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        scene = context.scene
+        shots = scene.norent_shots.shots
+        shots.clear()
+        
+        for marker in sorted(scene.timeline_markers, key=lambda m: m.frame):
+            if marker.camera:
+                shot = shots.add()
+                shot.frame = marker.frame
+                shot.camera = marker.camera
+        
+        _shot_tables.pop(scene.name, None)
+        self.report({'INFO'}, f"Read {len(shots)} shots from markers")
+        return {'FINISHED'}
+
+class NORENT_OT_ShotsToMarkers(Operator):
+    """Write the shot list to camera-bound timeline markers"""
+    bl_idname = "norent.shots_to_markers"
+    bl_label = "Shots To Markers"
+    bl_description = "Write cuts as timeline markers bound to cameras"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        count = sync_markers(context.scene)
+        self.report({'INFO'}, f"Synced {count} shot markers")
+        return {'FINISHED'}
+
+def sort_shots(scene):
+    """Keep the stored cut list ordered by frame"""
+    shots = scene.norent_shots.shots
+    ordered = []
+    for shot in shots:
+        insort(ordered, (shot.frame, shot.camera.name if shot.camera else ""))
+    for i, (frame, name) in enumerate(ordered):
+        shots[i].frame = frame
+        shots[i].camera = bpy.data.objects.get(name)
+    _shot_tables.pop(scene.name, None)
+
+def sync_markers(scene):
+    """Replace NORENT shot markers with one camera-bound marker per cut"""
+    markers = scene.timeline_markers
+    for marker in [m for m in markers if m.name.startswith(MARKER_PREFIX)]:
+        markers.remove(marker)
+    
+    count = 0
+    for i, shot in enumerate(scene.norent_shots.shots):
+        if not shot.camera:
+            continue
+        marker = markers.new(f"{MARKER_PREFIX}_{i + 1:03d}", frame=shot.frame)
+        marker.camera = shot.camera
+        count += 1
+    return count
+
+# Registration
+classes = [
+    NorentShot,
+    NorentShotList,
+    NORENT_OT_ShotAdd,
+    NORENT_OT_ShotRemove,
+    NORENT_OT_ShotsFromMarkers,
+    NORENT_OT_ShotsToMarkers,
+]
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    
+    bpy.types.Scene.norent_shots = PointerProperty(type=NorentShotList)
+    bpy.app.handlers.frame_change_pre.append(shot_frame_change_handler)
+    bpy.app.handlers.load_post.append(shot_load_handler)
+    bpy.app.handlers.save_pre.append(shot_save_handler)
+    bpy.app.handlers.undo_post.append(shot_undo_handler)
+    bpy.app.handlers.redo_post.append(shot_undo_handler)
+
+def unregister():
+    bpy.app.handlers.redo_post.remove(shot_undo_handler)
+    bpy.app.handlers.undo_post.remove(shot_undo_handler)
+    bpy.app.handlers.save_pre.remove(shot_save_handler)
+    bpy.app.handlers.load_post.remove(shot_load_handler)
+    bpy.app.handlers.frame_change_pre.remove(shot_frame_change_handler)
+    unmute_all("shots")
+    _shot_tables.clear()
+    
+    del bpy.types.Scene.norent_shots
+    
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
\ No newline at end of file
@@ -0,0 +1,262 @@
+import bpy
+import argparse
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+# Headless entry point:
+#   blender -b file.blend [-S scene] -P norent_cli.py -- render --preset REEL --tier draft
+#   blender -b -P norent_cli.py -- batch shots/*.blend --jobs 8 -- export --format mp4
+# Blender runs this file as a script, not as part of the package, so the
+# add-on is imported by its directory name and registered if needed.
+
+RESULT_PREFIX = "NORENT_RESULT "
+OUTPUT_DIR_NAME = "NORENT_Renders"
+
+def load_addon():
+    """Import (and register, if the preferences didn't) the add-on package; returns its name"""
+    package_dir = os.path.dirname(os.path.realpath(__file__))
+    init_file = os.path.join(package_dir, "__init__.py")
+    for name, module in list(sys.modules.items()):
+        if os.path.realpath(getattr(module, "__file__", None) or "") == init_file:
+            break
+    else:
+        sys.path.append(os.path.dirname(package_dir))
+        name = os.path.basename(package_dir)
+        module = importlib.import_module(name)
+    if not hasattr(bpy.types.Scene, "norent"):
+        module.register()
+    return name
+
+def output_files(since):
+    """Files written to the NORENT output directory since a timestamp"""
+    output_dir = os.path.join(bpy.path.abspath("//"), OUTPUT_DIR_NAME)
+    if not os.path.isdir(output_dir):
+        return []
+    paths = (os.path.join(output_dir, name) for name in sorted(os.listdir(output_dir)))
+    return [path for path in paths if os.path.isfile(path) and os.path.getmtime(path) >= since]
+
+def run_operator(operator, **properties):
+    result = operator(**properties)
+    if 'FINISHED' not in result:
+        raise RuntimeError(f"{operator.idname_py()} returned {', '.join(sorted(result))}")
+
+def select_objects(context, names):
+    """Select the named objects (all animated objects when no names are given)"""
+    objects = [context.scene.objects[name] for name in names] if names else [
+        obj for obj in context.scene.objects if obj.animation_data and obj.animation_data.action
+    ]
+    for obj in context.view_layer.objects:
+        obj.select_set(obj in objects)
+    if objects:
+        context.view_layer.objects.active = objects[0]
+    return objects
+
+def apply_settings(scene, args):
+    if args.preset:
+        scene.norent.render_preset = args.preset.upper()
+    if args.tier:
+        scene.norent.quality_tier = args.tier.upper()
+    if args.start is not None:
+        scene.frame_start = args.start
+    if args.end is not None:
+        scene.frame_end = args.end
+
+def command_render(context, args):
+    scene = context.scene
+    apply_settings(scene, args)
+    if not args.still:
+        run_operator(bpy.ops.norent.render_animation, background=False, parallel=False, incremental=args.incremental)
+        return
+    if args.frame is not None:
+        scene.frame_set(args.frame)
+    run_operator(bpy.ops.norent.render_still)
+    # Render Still leaves the image in Render Result; headless runs need it on disk
+    output_dir = os.path.join(bpy.path.abspath("//"), OUTPUT_DIR_NAME)
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, f"NORENT_{scene.norent.render_preset}_{scene.name}_{scene.frame_current:04d}.png")
+    bpy.data.images["Render Result"].save_render(path, scene=scene)
+
+def command_export(context, args):
+    apply_settings(context.scene, args)
+    if args.format == 'mp4':
+        run_operator(bpy.ops.norent.export_mp4, background=False)
+    elif args.format == 'gif':
+        run_operator(bpy.ops.norent.export_gif, background=False, quality=args.gif_quality.upper())
+    elif args.format == 'deliver':
+        run_operator(bpy.ops.norent.deliver)
+    elif args.format == 'aspects':
+        run_operator(bpy.ops.norent.deliver_aspects)
+
+def command_template(context, args):
+    run_operator(bpy.ops.norent.load_template, template_name=args.name.upper(), replace_scene=args.replace)
+    for assignment in args.text:
+        name, _, body = assignment.partition("=")
+        obj = context.scene.objects.get(name)
+        if obj is None or obj.type != 'FONT':
+            raise ValueError(f"No text object named '{name}'")
+        obj.data.body = body
+
+def command_ease(context, args):
+    if not select_objects(context, args.objects):
+        raise ValueError("No animated objects to ease")
+    run_operator(bpy.ops.norent.apply_easing, easing_type=args.type.upper(), strength=args.strength)
+
+def command_bake(context, args):
+    if args.target == 'orbit':
+        run_operator(bpy.ops.norent.camera_orbit_bake)
+    else:
+        run_operator(bpy.ops.norent.transform_cache_bake)
+
+def batch_command(args, path, summary_path):
+    """Blender command line running one CLI command on one file"""
+    command = [args.blender, "-b", path]
+    if args.scene:
+        command += ["-S", args.scene]
+    command += ["-P", os.path.realpath(__file__)]
+    if args.threads:
+        command += ["-t", str(args.threads)]
+    return command + ["--"] + args.command + ["--summary", summary_path]
+
+def run_one(args, path):
+    """Process one file in its own Blender so a crash only loses that file"""
+    handle, summary_path = tempfile.mkstemp(prefix="norent_cli_", suffix=".json")
+    os.close(handle)
+    start = time.time()
+    try:
+        process = subprocess.run(
+            batch_command(args, path, summary_path), stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            stdin=subprocess.DEVNULL, universal_newlines=True
+        )
+        try:
+            with open(summary_path) as summary:
+                return json.load(summary)
+        except ValueError:
+            return {
+                "file": path, "command": args.command[0] if args.command else None, "status": "error",
+                "error": f"Blender exited with code {process.returncode}", "log": process.stdout.splitlines()[-20:],
+                "elapsed": round(time.time() - start, 2), "outputs": [],
+            }
+    finally:
+        os.remove(summary_path)
+
+def command_batch(args):
+    jobs = args.jobs or max(1, (os.cpu_count() or 1) // max(args.threads, 1))
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        results = list(pool.map(lambda path: run_one(args, path), args.files))
+    summary = {
+        "command": args.command, "jobs": jobs, "elapsed": round(time.time() - start, 2),
+        "succeeded": sum(result["status"] == "ok" for result in results),
+        "failed": sum(result["status"] != "ok" for result in results),
+        "results": results,
+    }
+    return summary
+
+COMMANDS = {
+    "render": command_render,
+    "export": command_export,
+    "template": command_template,
+    "ease": command_ease,
+    "bake": command_bake,
+}
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="norent_cli", description="Run NORENT operations headless")
+    commands = parser.add_subparsers(dest="name", required=True)
+    
+    def add(name, help_text):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument("--save", nargs="?", const="", metavar="PATH", help="Save the file afterwards (in place without a path)")
+        command.add_argument("--summary", help="Write the JSON result here as well as to stdout")
+        return command
+    
+    def add_settings(command):
+        command.add_argument("--preset", choices=["REEL", "SQUARE", "STORY", "LANDSCAPE", "CUSTOM"], type=str.upper)
+        command.add_argument("--tier", choices=["DRAFT", "REVIEW", "FINAL"], type=str.upper)
+        command.add_argument("--start", type=int, help="First frame")
+        command.add_argument("--end", type=int, help="Last frame")
+    
+    render = add("render", "Render the animation or a still")
+    add_settings(render)
+    render.add_argument("--still", action="store_true", help="Render one frame to PNG")
+    render.add_argument("--frame", type=int, help="Frame for --still")
+    render.add_argument("--incremental", action="store_true", help="Reuse cached frames that haven't changed")
+    
+    export = add("export", "Export MP4/GIF or run a delivery")
+    add_settings(export)
+    export.add_argument("--format", choices=["mp4", "gif", "deliver", "aspects"], default="mp4", type=str.lower)
+    export.add_argument("--gif-quality", choices=["high", "medium", "low"], default="medium", type=str.lower)
+    
+    template = add("template", "Append a template and fill in its text")
+    template.add_argument("--name", required=True, help="LOWER_THIRD, LYRIC_VIDEO, INTRO_SPLASH, TRANSITION or LOGO_REVEAL")
+    template.add_argument("--replace", action="store_true", help="Delete the scene's objects first")
+    template.add_argument("--text", action="append", default=[], metavar="OBJECT=TEXT", help="Set a text object's body")
+    
+    ease = add("ease", "Apply an easing preset to animated objects")
+    ease.add_argument("--type", default="EASE_IN_OUT", type=str.upper)
+    ease.add_argument("--strength", type=float, default=1.0)
+    ease.add_argument("--objects", nargs="*", default=[], help="Objects to ease (default: every animated object)")
+    
+    bake = add("bake", "Bake rigs to keyframes")
+    bake.add_argument("target", choices=["orbit", "transform"], help="orbit: the camera's orbit rig; transform: the scrub cache")
+    
+    batch = commands.add_parser("batch", help="Run a command on many files in parallel Blender processes")
+    batch.add_argument("files", nargs="+", help=".blend files")
+    batch.add_argument("--jobs", type=int, default=0, help="Files processed at once (0 = cores / threads)")
+    batch.add_argument("--threads", type=int, default=0, help="Render threads per Blender")
+    batch.add_argument("--scene", help="Scene to use in every file (Blender's -S)")
+    batch.add_argument("--blender", default=bpy.app.binary_path, help="Blender executable")
+    batch.add_argument("--summary", help="Write the combined JSON summary here")
+    return parser
+
+def parse_args(argv):
+    """Split off the batch sub-command (after a second '--') before argparse sees it"""
+    argv = argv[argv.index("--") + 1:] if "--" in argv else []
+    command = []
+    if argv and argv[0] == "batch" and "--" in argv:
+        split = argv.index("--")
+        argv, command = argv[:split], argv[split + 1:]
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.name == "batch" and not command:
+        parser.error("batch needs a command after a second '--', e.g. batch *.blend -- render --tier draft")
+    args.command = command
+    return args
+
+def run(args):
+    """Run one command on the open file; returns its JSON summary"""
+    start = time.time()
+    summary = {"file": bpy.data.filepath, "command": args.name, "status": "ok", "outputs": []}
+    try:
+        load_addon()
+        context = bpy.context
+        summary["scene"] = context.scene.name
+        COMMANDS[args.name](context, args)
+        summary["outputs"] = output_files(start)
+        if args.save is not None:
+            bpy.ops.wm.save_as_mainfile(filepath=bpy.path.abspath(args.save) if args.save else bpy.data.filepath)
+    except Exception as error:
+        summary.update(status="error", error=f"{type(error).__name__}: {error}", traceback=traceback.format_exc())
+    summary["elapsed"] = round(time.time() - start, 2)
+    return summary
+
+def main():
+    args = parse_args(sys.argv)
+    summary = command_batch(args) if args.name == "batch" else run(args)
+    text = json.dumps(summary, indent=None)
+    print(RESULT_PREFIX + text, flush=True)
+    if args.summary:
+        with open(args.summary, "w") as output:
+            output.write(text)
+    failed = summary.get("status") == "error" or summary.get("failed")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,105 @@
+import bpy
+from bpy.types import Operator
+
+from .fingerprint import Fingerprinter
+
+# Images first so materials and groups see their textures already merged;
+# the content digest doesn't depend on that, but the purge order does
+DEDUP_TYPES = ('images', 'node_groups', 'materials')
+
+def snapshot():
+    """Pointers of the local datablocks that exist before an append"""
+    return {
+        attr: {block.as_pointer() for block in getattr(bpy.data, attr)}
+        for attr in DEDUP_TYPES
+    }
+
+def added_since(before):
+    """Local datablocks created since snapshot(), directly or indirectly appended"""
+    return {
+        attr: [block for block in getattr(bpy.data, attr)
+               if not block.library and block.as_pointer() not in before[attr]]
+        for attr in DEDUP_TYPES
+    }
+
+def local_blocks():
+    return {
+        attr: [block for block in getattr(bpy.data, attr) if not block.library]
+        for attr in DEDUP_TYPES
+    }
+
+def deduplicate(incoming):
+    """Merge incoming datablocks into identical ones already in the file.
+    
+    incoming maps a bpy.data collection name to the datablocks to check.
+    Each duplicate has its users remapped to the first datablock with the
+    same content digest and is then removed. Returns {attr: removed count}.
+    """
+    fingerprinter = Fingerprinter(content=True)
+    removed = {}
+    for attr in DEDUP_TYPES:
+        blocks = incoming.get(attr, [])
+        if not blocks:
+            continue
+        pending = {block.as_pointer() for block in blocks}
+        
+        # Existing datablocks are canonical; incoming ones only among themselves
+        canonical = {}
+        for block in getattr(bpy.data, attr):
+            if block.library or block.as_pointer() in pending:
+                continue
+            if attr == 'images' and block.type not in {'IMAGE', 'MULTILAYER'}:
+                continue
+            canonical.setdefault(fingerprinter.digest(block), block)
+        
+        duplicates = []
+        for block in blocks:
+            if attr == 'images' and block.type not in {'IMAGE', 'MULTILAYER'}:
+                continue
+            digest = fingerprinter.digest(block)
+            original = canonical.get(digest)
+            if original is None:
+                canonical[digest] = block
+            else:
+                duplicates.append((block, original))
+        
+        collection = getattr(bpy.data, attr)
+        for block, original in duplicates:
+            block.user_remap(original)
+            collection.remove(block)
+        if duplicates:
+            removed[attr] = len(duplicates)
+    return removed
+
+def format_removed(removed):
+    """Report line; every merged material is one Eevee shader compile saved"""
+    if not removed:
+        return "No duplicate datablocks"
+    counts = ", ".join(f"{count} {attr.replace('_', ' ')}" for attr, count in removed.items())
+    shaders = removed.get('materials', 0)
+    return f"Reused {counts}; {shaders} shader compiles avoided"
+
+class NORENT_OT_Deduplicate(Operator):
+    """Merge identical materials, node groups and images"""
+    bl_idname = "norent.deduplicate"
+    bl_label = "Merge Duplicate Materials"
+    bl_description = "Merge materials, node groups and images with identical content (e.g. NORENT_Red.001 into NORENT_Red) so each compiles once"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        removed = deduplicate(local_blocks())
+        self.report({'INFO'}, format_removed(removed))
+        return {'FINISHED'}
+
+# Registration
+classes = [
+    NORENT_OT_Deduplicate,
+]
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
\ No newline at end of file
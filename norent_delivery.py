@@ -0,0 +1,356 @@
+import bpy
+import os
+from bpy.types import Operator, PropertyGroup
+from bpy.props import BoolProperty, IntProperty, EnumProperty, FloatVectorProperty, CollectionProperty, PointerProperty
+
+from .render_jobs import BackgroundRenderMixin, find_ffmpeg, ffmpeg_input_args, format_duration, prepare_frames_dir
+from .render_cache import analyze_frames, plan_holds
+from .utils import apply_preset_resolution, quality_settings, RENDER_PRESETS
+
+# Encode profiles fanned out from the shared lossless sequence
+ENCODE_PROFILES = {
+    'MP4': {
+        "suffix": ".mp4",
+        "args": ["-c:v", "libx264", "-preset", "medium", "-crf", "18",
+                 "-pix_fmt", "yuv420p", "-movflags", "+faststart"],
+    },
+    'GIF': {
+        "suffix": ".gif",
+        "args": ["-filter_complex",
+                 "fps=15,scale=trunc(iw/4)*2:-2:flags=lanczos,split[a][b];"
+                 "[a]palettegen=stats_mode=diff[p];[b][p]paletteuse=dither=bayer:bayer_scale=3"],
+    },
+    'PREVIEW': {
+        "suffix": "_preview.mp4",
+        "args": ["-vf", "scale=trunc(iw/4)*2:trunc(ih/4)*2", "-c:v", "libx264", "-preset", "veryfast",
+                 "-crf", "28", "-pix_fmt", "yuv420p"],
+    },
+    'WEBM': {
+        "suffix": ".webm",
+        "args": ["-c:v", "libvpx-vp9", "-b:v", "0", "-crf", "32", "-row-mt", "1", "-pix_fmt", "yuva420p"],
+    },
+}
+
+def encode_commands(frames_dir, fps, output_base, formats):
+    """One ffmpeg command per delivery format, all reading the same frames"""
+    ffmpeg = find_ffmpeg()
+    commands = []
+    for name in formats:
+        profile = ENCODE_PROFILES[name]
+        commands.append(
+            [ffmpeg, "-y", "-loglevel", "error"] + ffmpeg_input_args(frames_dir, fps)
+            + profile["args"] + [output_base + profile["suffix"]]
+        )
+    return commands
+
+class NORENT_OT_Deliver(BackgroundRenderMixin, Operator):
+    """Render once and encode every delivery format"""
+    bl_idname = "norent.deliver"
+    bl_label = "Deliver All Formats"
+    bl_description = "Render one lossless sequence and encode MP4, GIF, preview and WebM from it in parallel"
+    
+    use_mp4: BoolProperty(name="MP4", description="H.264 master", default=True)
+    use_gif: BoolProperty(name="GIF", description="Palette-optimized GIF", default=True)
+    use_preview: BoolProperty(name="Preview", description="Half resolution preview MP4", default=True)
+    use_webm: BoolProperty(name="WebM", description="VP9 WebM with alpha", default=False)
+    
+    workers: IntProperty(
+        name="Render Workers",
+        description="Number of render worker processes (0 = fill all cores)",
+        default=0,
+        min=0,
+        max=128
+    )
+    
+    render_holds_once: BoolProperty(
+        name="Render Holds Once",
+        description="Render frames where nothing changes once and link the copies",
+        default=True
+    )
+    
+    def execute(self, context):
+        if not find_ffmpeg():
+            self.report({'ERROR'}, "ffmpeg not found on PATH")
+            return {'CANCELLED'}
+        
+        formats = [name for name, enabled in (
+            ('MP4', self.use_mp4), ('GIF', self.use_gif),
+            ('PREVIEW', self.use_preview), ('WEBM', self.use_webm),
+        ) if enabled]
+        if not formats:
+            self.report({'WARNING'}, "No delivery format selected")
+            return {'CANCELLED'}
+        
+        scene = context.scene
+        render = scene.render
+        original_filepath = render.filepath
+        apply_preset_resolution(scene)
+        
+        output_dir = os.path.join(bpy.path.abspath("//"), "NORENT_Exports")
+        if not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+        output_base = os.path.join(output_dir, f"NORENT_{scene.norent.render_preset}_{scene.name}")
+        render.filepath = output_base
+        
+        fps = render.fps / render.fps_base
+        self.outputs = [output_base + ENCODE_PROFILES[name]["suffix"] for name in formats]
+        frames = holds = None
+        if self.render_holds_once:
+            prepare_frames_dir(output_base + "_frames")
+            _, groups = analyze_frames(scene, range(scene.frame_start, scene.frame_end + 1, max(scene.frame_step, 1)))
+            frames, holds = plan_holds(groups)
+        restore = quality_settings(scene)
+        try:
+            return self.start_parallel_render(
+                context, "Delivery", self.workers,
+                encode=lambda frames_dir: encode_commands(frames_dir, fps, output_base, formats),
+                frames=frames, holds=holds
+            )
+        finally:
+            restore()
+            render.filepath = original_filepath
+    
+    def on_render_finished(self, context, job):
+        slowest = max((encoder.elapsed for encoder in job.encoders), default=0.0)
+        names = ", ".join(os.path.basename(path) for path in self.outputs)
+        self.report(
+            {'INFO'},
+            f"Delivered {names} | render {format_duration(job.render_time or 0)}, "
+            f"slowest encode {format_duration(slowest)}, {job.held_frames} held frames linked"
+        )
+    
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+# Multi-aspect delivery
+ASPECT_ITEMS = [
+    ('REEL', "Reel", "1080x1920 vertical"),
+    ('SQUARE', "Square", "1080x1080 square"),
+    ('STORY', "Story", "1080x1920 vertical"),
+    ('LANDSCAPE', "Landscape", "1920x1080 horizontal"),
+]
+DEFAULT_ASPECTS = ('REEL', 'SQUARE', 'LANDSCAPE')
+
+class NorentAspect(PropertyGroup):
+    preset: EnumProperty(
+        name="Preset",
+        description="Delivery aspect cut from the master",
+        items=ASPECT_ITEMS,
+        default='REEL'
+    )
+    
+    use: BoolProperty(
+        name="Deliver",
+        description="Encode this aspect",
+        default=True
+    )
+    
+    offset: FloatVectorProperty(
+        name="Reframe",
+        description="Crop offset as a fraction of the master frame (keyable, like a safe-area guide)",
+        size=2,
+        default=(0.0, 0.0),
+        min=-0.5,
+        max=0.5
+    )
+
+class NorentMultiAspect(PropertyGroup):
+    aspects: CollectionProperty(type=NorentAspect)
+
+def ensure_aspects(scene):
+    """Default REEL/SQUARE/LANDSCAPE entries for scenes that have none"""
+    aspects = scene.norent_multi_aspect.aspects
+    if not len(aspects):
+        for preset in DEFAULT_ASPECTS:
+            aspects.add().preset = preset
+    return aspects
+
+def _even(value):
+    return max(2, int(round(value / 2)) * 2)
+
+def aspect_extent(width, height, sensor_fit):
+    """Visible extent of a width x height frame, in units of the camera sensor"""
+    if sensor_fit == 'HORIZONTAL' or (sensor_fit == 'AUTO' and width >= height):
+        return 1.0, height / width
+    return width / height, 1.0
+
+def master_layout(sensor_fit, sizes):
+    """Master resolution covering every aspect, and each aspect's crop size in it.
+    
+    With the same camera and sensor fit, each aspect sees a centred window of
+    the sensor; the master spans the union of those windows at the highest
+    pixel density any aspect needs, so every crop only ever scales down.
+    """
+    extents = {name: aspect_extent(width, height, sensor_fit) for name, (width, height) in sizes.items()}
+    density = max(width / extents[name][0] for name, (width, height) in sizes.items())
+    master = (
+        _even(max(extent[0] for extent in extents.values()) * density),
+        _even(max(extent[1] for extent in extents.values()) * density),
+    )
+    crops = {name: (_even(extent[0] * density), _even(extent[1] * density)) for name, extent in extents.items()}
+    return master, crops
+
+def offset_curve(scene, index, frames):
+    """Per-frame reframe offsets of an aspect, following its keyframes"""
+    aspect = scene.norent_multi_aspect.aspects[index]
+    action = scene.animation_data.action if scene.animation_data else None
+    path = f"norent_multi_aspect.aspects[{index}].offset"
+    curves = [action.fcurves.find(path, index=axis) if action else None for axis in range(2)]
+    return [
+        tuple(curve.evaluate(frame) if curve else aspect.offset[axis] for axis, curve in enumerate(curves))
+        for frame in frames
+    ]
+
+def crop_origins(master, crop, offsets):
+    """Top-left pixel of the crop per frame; positive offsets move right and up"""
+    origins = []
+    for offset_x, offset_y in offsets:
+        x = (master[0] - crop[0]) / 2 + offset_x * master[0]
+        y = (master[1] - crop[1]) / 2 - offset_y * master[1]
+        origins.append((
+            int(min(max(x, 0), master[0] - crop[0])),
+            int(min(max(y, 0), master[1] - crop[1])),
+        ))
+    return origins
+
+def _filter_path(path):
+    # ffmpeg filter arguments treat ':' and '\\' specially
+    return "'" + path.replace("\\", "/").replace(":", "\\:") + "'"
+
+def reframe_command(frames_dir, fps, output_path, crop, size, origins):
+    """Encode one aspect from the master sequence: crop (panned per frame if keyed), then scale"""
+    x, y = origins[0]
+    filters = f"crop@reframe={crop[0]}:{crop[1]}:{x}:{y},scale={size[0]}:{size[1]}:flags=lanczos"
+    if len(set(origins)) > 1:
+        # Keyed reframing: move the crop window with timed filter commands,
+        # kept beside the sequence so they go when it is cleared
+        name = os.path.splitext(os.path.basename(output_path))[0]
+        commands_path = os.path.join(frames_dir, name + "_reframe.txt")
+        with open(commands_path, 'w') as f:
+            previous = None
+            for i, origin in enumerate(origins):
+                if origin != previous:
+                    f.write(f"{i / fps:.6f} crop@reframe x {origin[0]}, crop@reframe y {origin[1]};\n")
+                    previous = origin
+        filters = f"sendcmd=f={_filter_path(commands_path)}," + filters
+    return (
+        [find_ffmpeg(), "-y", "-loglevel", "error"] + ffmpeg_input_args(frames_dir, fps)
+        + ["-filter_complex", filters] + ENCODE_PROFILES['MP4']["args"] + [output_path]
+    )
+
+class NORENT_OT_DeliverAspects(BackgroundRenderMixin, Operator):
+    """Render one master framing and cut every aspect from it"""
+    bl_idname = "norent.deliver_aspects"
+    bl_label = "Deliver All Aspects"
+    bl_description = "Render one oversized master per frame and encode each aspect as a crop of it"
+    
+    workers: IntProperty(
+        name="Render Workers",
+        description="Number of render worker processes (0 = fill all cores)",
+        default=0,
+        min=0,
+        max=128
+    )
+    
+    render_holds_once: BoolProperty(
+        name="Render Holds Once",
+        description="Render frames where nothing changes once and link the copies",
+        default=True
+    )
+    
+    def execute(self, context):
+        if not find_ffmpeg():
+            self.report({'ERROR'}, "ffmpeg not found on PATH")
+            return {'CANCELLED'}
+        
+        scene = context.scene
+        aspects = [(i, aspect) for i, aspect in enumerate(ensure_aspects(scene)) if aspect.use]
+        if not aspects:
+            self.report({'WARNING'}, "No aspect selected")
+            return {'CANCELLED'}
+        
+        render = scene.render
+        sizes = {aspect.preset: RENDER_PRESETS[aspect.preset][:2] for _, aspect in aspects}
+        sensor_fit = scene.camera.data.sensor_fit if scene.camera else 'AUTO'
+        master, crops = master_layout(sensor_fit, sizes)
+        
+        output_dir = os.path.join(bpy.path.abspath("//"), "NORENT_Exports")
+        if not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+        output_base = os.path.join(output_dir, f"NORENT_Master_{scene.name}")
+        
+        frames = list(range(scene.frame_start, scene.frame_end + 1, max(scene.frame_step, 1)))
+        fps = render.fps / render.fps_base
+        jobs = []
+        for index, aspect in aspects:
+            origins = crop_origins(master, crops[aspect.preset], offset_curve(scene, index, frames))
+            path = os.path.join(output_dir, f"NORENT_{aspect.preset}_{scene.name}.mp4")
+            jobs.append((path, crops[aspect.preset], sizes[aspect.preset], origins))
+        self.outputs = [path for path, _, _, _ in jobs]
+        self.master = master
+        
+        saved = (render.filepath, render.resolution_x, render.resolution_y, render.resolution_percentage)
+        render.filepath = output_base
+        render.resolution_x, render.resolution_y = master
+        render.resolution_percentage = 100
+        
+        render_frames = holds = None
+        if self.render_holds_once:
+            prepare_frames_dir(output_base + "_frames")
+            _, groups = analyze_frames(scene, frames)
+            render_frames, holds = plan_holds(groups)
+        restore = quality_settings(scene)
+        try:
+            return self.start_parallel_render(
+                context, "Aspects", self.workers,
+                encode=lambda frames_dir: [
+                    reframe_command(frames_dir, fps, path, crop, size, origins)
+                    for path, crop, size, origins in jobs
+                ],
+                frames=render_frames, holds=holds
+            )
+        finally:
+            restore()
+            render.filepath, render.resolution_x, render.resolution_y, render.resolution_percentage = saved
+    
+    def on_render_finished(self, context, job):
+        names = ", ".join(os.path.basename(path) for path in self.outputs)
+        self.report(
+            {'INFO'},
+            f"Delivered {names} from one {self.master[0]}x{self.master[1]} master | "
+            f"render {format_duration(job.render_time or 0)}, {job.held_frames} held frames linked"
+        )
+    
+    def invoke(self, context, event):
+        ensure_aspects(context.scene)
+        return context.window_manager.invoke_props_dialog(self)
+    
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "workers")
+        layout.prop(self, "render_holds_once")
+        for aspect in context.scene.norent_multi_aspect.aspects:
+            row = layout.row(align=True)
+            row.prop(aspect, "use", text="")
+            row.prop(aspect, "preset", text="")
+            row.prop(aspect, "offset", text="")
+
+# Registration
+classes = [
+    NORENT_OT_Deliver,
+    NorentAspect,
+    NorentMultiAspect,
+    NORENT_OT_DeliverAspects,
+]
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    
+    bpy.types.Scene.norent_multi_aspect = PointerProperty(type=NorentMultiAspect)
+
+def unregister():
+    del bpy.types.Scene.norent_multi_aspect
+    
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
\ No newline at end of file
@@ -0,0 +1,373 @@
+import bpy
+import ast
+import time
+from bpy.types import Operator
+from bpy.props import BoolProperty, IntProperty
+
+AUDIT_TEXT_NAME = "NORENT_Driver_Audit"
+
+# Data collections whose datablocks can carry drivers
+DRIVER_COLLECTIONS = (
+    "objects", "cameras", "curves", "meshes", "materials", "node_groups",
+    "lights", "worlds", "scenes", "shape_keys", "armatures",
+)
+
+# Python spellings that have a direct simple-expression equivalent
+FRAME_PATHS = {
+    "bpy.context.scene.frame_current",
+    "bpy.context.scene.frame_current_final",
+    "C.scene.frame_current",
+}
+
+def iter_drivers():
+    """Yield (datablock, driver F-curve) for every driver in the file"""
+    for attr in DRIVER_COLLECTIONS:
+        for id_block in getattr(bpy.data, attr):
+            blocks = [id_block]
+            # Material and world node trees keep their own animation data
+            if getattr(id_block, "node_tree", None):
+                blocks.append(id_block.node_tree)
+            for block in blocks:
+                anim = block.animation_data
+                if anim:
+                    for fcurve in anim.drivers:
+                        yield block, fcurve
+
+def classify_driver(fcurve):
+    """Return 'BUILTIN', 'SIMPLE' or 'PYTHON' for a driver F-curve"""
+    driver = fcurve.driver
+    if driver.type != 'SCRIPTED':
+        return 'BUILTIN'
+    if driver.use_self or not driver.is_simple_expression:
+        return 'PYTHON'
+    return 'SIMPLE'
+
+def _variable_values(driver):
+    """Current values of a driver's variables, for timing its expression"""
+    values = {}
+    for var in driver.variables:
+        value = 0.0
+        target = var.targets[0]
+        if var.type == 'SINGLE_PROP' and target.id:
+            try:
+                value = target.id.path_resolve(target.data_path)
+            except (ValueError, TypeError):
+                pass
+        values[var.name] = value
+    return values
+
+def python_trusted():
+    """True when Blender itself would run Python from this file.
+    
+    Timing compiles and evaluates the expressions, so it must respect the
+    Auto Run Python Scripts setting like the drivers themselves do.
+    """
+    return not bpy.app.autoexec_fail and bpy.context.preferences.filepaths.use_scripts_auto_execute
+
+def expression_cost(fcurve, frame, repeats=200):
+    """Seconds one Python evaluation of a driver expression takes"""
+    driver = fcurve.driver
+    if driver.type != 'SCRIPTED':
+        return 0.0
+    try:
+        code = compile(driver.expression, "<driver>", "eval")
+    except SyntaxError:
+        return 0.0
+    
+    namespace = dict(bpy.app.driver_namespace)
+    namespace["frame"] = frame
+    namespace.update(_variable_values(driver))
+    
+    start = time.perf_counter()
+    try:
+        for _ in range(repeats):
+            eval(code, namespace)
+    except Exception:
+        return 0.0
+    return (time.perf_counter() - start) / repeats
+
+def frame_driver_time(scene, fcurves, frames):
+    """Average per-frame seconds spent on the given drivers (enabled minus muted)"""
+    def timed(mute):
+        states = [fcurve.mute for fcurve in fcurves]
+        for fcurve in fcurves:
+            fcurve.mute = mute or fcurve.mute
+        scene.frame_set(frames[0])
+        start = time.perf_counter()
+        for frame in frames:
+            scene.frame_set(frame)
+        elapsed = time.perf_counter() - start
+        for fcurve, state in zip(fcurves, states):
+            fcurve.mute = state
+        return elapsed / len(frames)
+    
+    return max(timed(False) - timed(True), 0.0)
+
+class _SimpleExpressionRewriter(ast.NodeTransformer):
+    """Rewrite common Python-only spellings into the simple-expression subset"""
+    
+    def visit_Attribute(self, node):
+        dotted = ast.unparse(node)
+        if dotted in FRAME_PATHS:
+            return ast.copy_location(ast.Name(id="frame", ctx=ast.Load()), node)
+        if isinstance(node.value, ast.Name) and node.value.id == "math":
+            return ast.copy_location(ast.Name(id=node.attr, ctx=ast.Load()), node)
+        return self.generic_visit(node)
+    
+    def visit_Call(self, node):
+        node = self.generic_visit(node)
+        # float(x) is a no-op for driver results
+        if isinstance(node.func, ast.Name) and node.func.id == "float" and len(node.args) == 1:
+            return node.args[0]
+        return node
+
+def rewrite_expression(expression):
+    """Return a simple-expression spelling of expression, or None"""
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except SyntaxError:
+        return None
+    original = ast.unparse(tree)
+    rewritten = ast.unparse(_SimpleExpressionRewriter().visit(tree))
+    return rewritten if rewritten != original else None
+
+def _constant(node):
+    """Evaluate a constant sub-expression, raising ValueError otherwise"""
+    try:
+        return float(eval(compile(ast.Expression(node), "<const>", "eval"), {"__builtins__": {}}))
+    except (NameError, TypeError, SyntaxError) as error:
+        raise ValueError(str(error))
+
+def _mult_factors(node):
+    """Flatten a chain of multiplications into its factors"""
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Mult):
+        return _mult_factors(node.left) + _mult_factors(node.right)
+    return [node]
+
+def _match_noise(expression):
+    """Match noise(<var> * a [+ b]) * c and return (var, a, b, c)"""
+    try:
+        factors = _mult_factors(ast.parse(expression, mode="eval").body)
+    except SyntaxError:
+        return None
+    calls = [f for f in factors if isinstance(f, ast.Call) and getattr(f.func, "id", None) == "noise"]
+    if len(calls) != 1 or len(calls[0].args) != 1:
+        return None
+    
+    try:
+        amplitude = 1.0
+        for factor in factors:
+            if factor is not calls[0]:
+                amplitude *= _constant(factor)
+        
+        arg = calls[0].args[0]
+        offset = 0.0
+        if isinstance(arg, ast.BinOp) and isinstance(arg.op, ast.Add):
+            offset = _constant(arg.right)
+            arg = arg.left
+        
+        # Time variable times constant rate factors
+        names = [f for f in _mult_factors(arg) if isinstance(f, ast.Name)]
+        if len(names) != 1:
+            return None
+        rate = 1.0
+        for factor in _mult_factors(arg):
+            if factor is not names[0]:
+                rate *= _constant(factor)
+    except ValueError:
+        return None
+    return names[0].id, rate, offset, amplitude
+
+def _is_frame_variable(driver, name):
+    if name == "frame" and not any(var.name == name for var in driver.variables):
+        return True
+    var = driver.variables.get(name)
+    return bool(var and var.type == 'SINGLE_PROP' and var.targets[0].data_path in ("frame_current", "frame_current_final"))
+
+def noise_match(fcurve):
+    """(var, rate, offset, amplitude) of a frame-based noise() driver, or None"""
+    match = _match_noise(fcurve.driver.expression)
+    if not match or not _is_frame_variable(fcurve.driver, match[0]) or match[1] == 0:
+        return None
+    return match
+
+def replace_noise_driver(id_block, fcurve):
+    """Swap a frame-based noise() driver for an approximately equivalent F-curve Noise modifier"""
+    match = noise_match(fcurve)
+    if not match:
+        return False
+    _, rate, offset, amplitude = match
+    data_path, index = fcurve.data_path, fcurve.array_index
+    
+    id_block.driver_remove(data_path, index)
+    anim = id_block.animation_data or id_block.animation_data_create()
+    if not anim.action:
+        anim.action = bpy.data.actions.new(name=f"{id_block.name}_Action")
+    action = anim.action
+    curve = action.fcurves.find(data_path, index=index) or action.fcurves.new(data_path, index=index)
+    if not curve.keyframe_points:
+        curve.keyframe_points.insert(0.0, 0.0)
+    
+    # Approximation: period, phase and amplitude are carried over, but the
+    # Noise modifier is a different noise function than the driver's noise()
+    modifier = curve.modifiers.new('NOISE')
+    modifier.scale = 1.0 / abs(rate)
+    modifier.offset = -offset / rate
+    modifier.strength = 2.0 * abs(amplitude)
+    modifier.blend_type = 'ADD'
+    return True
+
+def rewrite_driver(id_block, fcurve, approximate_noise=False):
+    """Move one Python driver to the simple-expression path; returns the action taken.
+    
+    Only exact rewrites happen by default. noise() drivers change shape when
+    swapped for a Noise modifier, so that needs approximate_noise.
+    """
+    driver = fcurve.driver
+    if driver.use_self:
+        return None
+    
+    if noise_match(fcurve):
+        if approximate_noise and replace_noise_driver(id_block, fcurve):
+            return 'F-CURVE NOISE (approximation)'
+        return None
+    
+    original = driver.expression
+    rewritten = rewrite_expression(original)
+    if rewritten is None:
+        return None
+    driver.expression = rewritten
+    
+    # A frame_current variable is redundant once the builtin frame is used
+    var = driver.variables.get("frame")
+    if var and _is_frame_variable(driver, "frame"):
+        driver.variables.remove(var)
+    
+    if driver.is_simple_expression:
+        return 'REWRITTEN'
+    driver.expression = original
+    return None
+
+def audit_drivers(scene, rewrite=False, sample_frames=24, approximate_noise=False):
+    """Classify, time and optionally rewrite every driver. Returns a report dict."""
+    original_frame = scene.frame_current
+    step = max((scene.frame_end - scene.frame_start) // max(sample_frames, 1), 1)
+    frames = list(range(scene.frame_start, scene.frame_end + 1, step))[:sample_frames] or [original_frame]
+    
+    trusted = python_trusted()
+    entries = []
+    for id_block, fcurve in iter_drivers():
+        kind = classify_driver(fcurve)
+        cost = 0.0
+        if kind == 'PYTHON':
+            # None marks an expression left untimed in an untrusted file
+            cost = expression_cost(fcurve, frames[0]) if trusted else None
+        entries.append({
+            "id": id_block,
+            "fcurve": fcurve,
+            "path": f"{id_block.name}.{fcurve.data_path}[{fcurve.array_index}]",
+            "expression": fcurve.driver.expression,
+            "kind": kind,
+            "cost": cost,
+            "noise": kind == 'PYTHON' and not fcurve.driver.use_self and noise_match(fcurve) is not None,
+            "action": None,
+        })
+    
+    before = frame_driver_time(scene, [e["fcurve"] for e in entries], frames) if entries else 0.0
+    
+    if rewrite:
+        for entry in entries:
+            if entry["kind"] == 'PYTHON':
+                entry["action"] = rewrite_driver(entry["id"], entry["fcurve"], approximate_noise)
+    
+    after = before
+    if rewrite:
+        remaining = [fcurve for _, fcurve in iter_drivers()]
+        after = frame_driver_time(scene, remaining, frames) if remaining else 0.0
+    
+    scene.frame_set(original_frame)
+    return {"entries": entries, "before": before, "after": after, "frames": len(frames)}
+
+def write_audit_text(report):
+    """Write the audit as a text datablock for the Text Editor"""
+    text = bpy.data.texts.get(AUDIT_TEXT_NAME) or bpy.data.texts.new(AUDIT_TEXT_NAME)
+    text.clear()
+    text.write("NORENT DRIVER AUDIT\n")
+    text.write("=" * 30 + "\n\n")
+    text.write(f"Sampled frames: {report['frames']}\n")
+    text.write(f"Driver time per frame before: {report['before'] * 1000:.3f} ms\n")
+    text.write(f"Driver time per frame after:  {report['after'] * 1000:.3f} ms\n\n")
+    for entry in report["entries"]:
+        text.write(f"[{entry['kind']}] {entry['path']}\n")
+        text.write(f"    expression: {entry['expression']}\n")
+        if entry["cost"] is None:
+            text.write("    python eval: untrusted (Auto Run Python Scripts is off), not timed\n")
+        elif entry["cost"]:
+            text.write(f"    python eval: {entry['cost'] * 1e6:.1f} us\n")
+        if entry["action"]:
+            text.write(f"    fixed: {entry['action']}\n")
+        elif entry["noise"]:
+            text.write("    approximate: would become an F-curve Noise modifier (changes the motion; enable Approximate Noise)\n")
+    return text
+
+class NORENT_OT_AuditDrivers(Operator):
+    """Audit every driver in the file"""
+    bl_idname = "norent.audit_drivers"
+    bl_label = "Audit Drivers"
+    bl_description = "Find drivers that force Python evaluation and optionally rewrite them"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    rewrite: BoolProperty(
+        name="Rewrite",
+        description="Rewrite Python drivers into equivalent simple expressions where possible",
+        default=True
+    )
+    
+    approximate_noise: BoolProperty(
+        name="Approximate Noise",
+        description="Also replace noise() drivers with an F-curve Noise modifier; the shake looks similar but not identical",
+        default=False
+    )
+    
+    sample_frames: IntProperty(
+        name="Sample Frames",
+        description="Frames to step through when timing drivers",
+        default=24,
+        min=2,
+        max=500
+    )
+    
+    def execute(self, context):
+        report = audit_drivers(context.scene, self.rewrite, self.sample_frames, self.approximate_noise)
+        write_audit_text(report)
+        
+        entries = report["entries"]
+        python_count = sum(1 for e in entries if e["kind"] == 'PYTHON')
+        fixed_count = sum(1 for e in entries if e["action"])
+        noise = [e["path"] for e in entries if e["noise"] and not e["action"]]
+        
+        if noise:
+            self.report({'INFO'}, f"Approximate Noise would change {len(noise)} noise() drivers: {', '.join(noise[:5])}")
+        self.report(
+            {'INFO'},
+            f"{len(entries)} drivers, {python_count} Python, {fixed_count} fixed | "
+            f"{report['before'] * 1000:.2f} ms -> {report['after'] * 1000:.2f} ms per frame "
+            f"(see '{AUDIT_TEXT_NAME}')"
+        )
+        return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+# Registration
+classes = [
+    NORENT_OT_AuditDrivers,
+]
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
\ No newline at end of file
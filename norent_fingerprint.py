@@ -0,0 +1,190 @@
+import bpy
+import hashlib
+import os
+import numpy as np
+
+# RNA value property types hashed directly
+VALUE_TYPES = {'BOOLEAN', 'INT', 'FLOAT', 'STRING', 'ENUM'}
+
+# Properties that never change the rendered or appended result
+SKIP_PROPERTIES = {
+    'rna_type', 'bl_rna', 'id_data', 'original', 'users', 'use_fake_user', 'use_extra_user',
+    'is_evaluated', 'is_runtime_data', 'is_embedded_data', 'is_missing', 'is_library_indirect',
+    'session_uid', 'tag', 'is_dirty', 'pixels', 'bindcode', 'preview', 'asset_data',
+    'select', 'hide_select', 'hide_viewport', 'show_expanded', 'is_active_output',
+    'filepath_raw', 'name_full', 'library_weak_reference', 'override_library',
+    # Back-references would make every object depend on its neighbours
+    'users_collection', 'users_scene', 'children', 'children_recursive',
+}
+
+# Node properties that only describe the node editor layout
+NODE_UI_PROPERTIES = {
+    'location', 'location_absolute', 'width', 'height', 'dimensions', 'width_hidden', 'hide',
+    'show_options', 'show_preview', 'show_texture', 'color', 'use_custom_color', 'parent',
+}
+
+# Mesh element collections, hashed in bulk instead of through RNA
+MESH_ARRAYS = (
+    ("vertices", "co", np.float32, 3),
+    ("loops", "vertex_index", np.int32, 1),
+    ("polygons", "loop_total", np.int32, 1),
+    ("polygons", "material_index", np.int32, 1),
+    ("polygons", "use_smooth", np.bool_, 1),
+)
+
+# ID properties that only say what a datablock is called or where it came from
+CONTENT_SKIP_PROPERTIES = {'name', 'filepath'}
+
+MAX_DEPTH = 4
+
+def id_key(id_block):
+    """Stable identity of a datablock across sessions"""
+    library = id_block.library.filepath if id_block.library else ""
+    return f"{type(id_block).__name__}:{id_block.name}:{library}"
+
+def file_hash(path):
+    digest = hashlib.sha1()
+    with open(path, "rb") as source:
+        for piece in iter(lambda: source.read(1 << 20), b""):
+            digest.update(piece)
+    return digest.hexdigest()
+
+def _value(value):
+    # Arrays, vectors and matrices come back as sequences
+    if hasattr(value, "__len__") and not isinstance(value, str):
+        return repr([_value(v) for v in value])
+    if isinstance(value, float):
+        return f"{value:.6g}"
+    return repr(value)
+
+class Fingerprinter:
+    """Content hashes of datablocks, including everything they reference.
+    
+    Each ID is hashed once per Fingerprinter (call reset() after edits or
+    frame changes). References to other IDs fold in the referenced ID's own
+    hash, so editing a shared material changes every object using it.
+    
+    With content=True names and file paths are left out and image files are
+    hashed by their bytes, so NORENT_Red and NORENT_Red.001 digest the same
+    when their node trees match.
+    """
+    
+    def __init__(self, content=False):
+        self.memo = {}
+        self.in_progress = set()
+        self.content = content
+    
+    def reset(self):
+        self.memo.clear()
+    
+    def digest(self, id_block):
+        """Hex digest of an ID and its dependencies"""
+        if id_block is None:
+            return "None"
+        pointer = id_block.as_pointer()
+        cached = self.memo.get(pointer)
+        if cached:
+            return cached
+        if pointer in self.in_progress:
+            # Reference cycle (e.g. parent/child): fall back to identity
+            return id_key(id_block)
+        
+        self.in_progress.add(pointer)
+        try:
+            seed = type(id_block).__name__ if self.content else id_key(id_block)
+            hasher = hashlib.sha1(seed.encode())
+            self.hash_struct(id_block, hasher, 0, set())
+            self._hash_special(id_block, hasher)
+            result = hasher.hexdigest()
+        finally:
+            self.in_progress.discard(pointer)
+        self.memo[pointer] = result
+        return result
+    
+    def struct_digest(self, struct, values_only=False):
+        """Hex digest of a non-ID struct such as scene.render"""
+        hasher = hashlib.sha1(type(struct).__name__.encode())
+        if values_only:
+            # Skip references, e.g. a view layer's object list
+            for prop in struct.bl_rna.properties:
+                if prop.type in VALUE_TYPES and prop.identifier not in SKIP_PROPERTIES:
+                    hasher.update(f"{prop.identifier}={_value(getattr(struct, prop.identifier))};".encode())
+        else:
+            self.hash_struct(struct, hasher, 0, set())
+        return hasher.hexdigest()
+    
+    def hash_struct(self, struct, hasher, depth, seen):
+        """Fold every render-relevant RNA property of a struct into hasher"""
+        seen.add(struct.as_pointer())
+        skip = SKIP_PROPERTIES
+        # Read-only values on an ID are runtime state (e.g. Image.has_data);
+        # in content mode the data itself is hashed by _hash_special
+        skip_readonly = False
+        if isinstance(struct, bpy.types.Node):
+            skip = SKIP_PROPERTIES | NODE_UI_PROPERTIES
+        elif self.content and isinstance(struct, bpy.types.ID):
+            skip = SKIP_PROPERTIES | CONTENT_SKIP_PROPERTIES
+            skip_readonly = True
+        is_mesh = isinstance(struct, bpy.types.Mesh)
+        
+        for prop in struct.bl_rna.properties:
+            identifier = prop.identifier
+            if identifier in skip or (skip_readonly and prop.is_readonly and prop.type in VALUE_TYPES):
+                continue
+            try:
+                value = getattr(struct, identifier)
+            except (AttributeError, RuntimeError, TypeError):
+                continue
+            
+            if prop.type in VALUE_TYPES:
+                hasher.update(f"{identifier}={_value(value)};".encode())
+            elif prop.type == 'POINTER':
+                self._hash_reference(identifier, value, hasher, depth, seen)
+            elif prop.type == 'COLLECTION':
+                if is_mesh and identifier != 'materials':
+                    continue
+                hasher.update(f"{identifier}[{len(value)}];".encode())
+                for item in value:
+                    self._hash_reference(identifier, item, hasher, depth, seen)
+    
+    def _hash_reference(self, identifier, value, hasher, depth, seen):
+        if value is None:
+            hasher.update(f"{identifier}=None;".encode())
+        elif isinstance(value, bpy.types.ID):
+            hasher.update(f"{identifier}->{self.digest(value)};".encode())
+        elif depth < MAX_DEPTH and value.as_pointer() not in seen:
+            hasher.update(f"{identifier}{{".encode())
+            self.hash_struct(value, hasher, depth + 1, seen)
+            hasher.update(b"}")
+        else:
+            hasher.update(f"{identifier}~{getattr(value, 'name', '')};".encode())
+    
+    def _hash_special(self, id_block, hasher):
+        """Bulk data the RNA walk skips"""
+        if isinstance(id_block, bpy.types.Mesh):
+            for collection_name, attribute, dtype, width in MESH_ARRAYS:
+                collection = getattr(id_block, collection_name)
+                data = np.empty(len(collection) * width, dtype=dtype)
+                collection.foreach_get(attribute, data)
+                hasher.update(data.tobytes())
+        elif isinstance(id_block, bpy.types.Image):
+            # File-backed images change on disk, not in RNA
+            if id_block.packed_file:
+                if self.content:
+                    hasher.update(hashlib.sha1(id_block.packed_file.data).digest())
+                else:
+                    hasher.update(f"packed:{id_block.packed_file.size}".encode())
+            elif id_block.source in {'FILE', 'SEQUENCE', 'MOVIE'}:
+                path = bpy.path.abspath(id_block.filepath, library=id_block.library)
+                if not os.path.exists(path):
+                    if self.content:
+                        hasher.update(f"missing:{id_block.filepath}".encode())
+                elif self.content:
+                    hasher.update(f"file:{file_hash(path)}".encode())
+                else:
+                    stat = os.stat(path)
+                    hasher.update(f"file:{stat.st_size}:{stat.st_mtime_ns}".encode())
+
+def hash_values(values):
+    """Digest of a flat list of sampled values"""
+    return hashlib.sha1(";".join(_value(v) for v in values).encode()).hexdigest()
\ No newline at end of file
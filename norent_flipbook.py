@@ -0,0 +1,344 @@
+import bpy
+import gpu
+import zlib
+from collections import OrderedDict
+import numpy as np
+from bpy.types import Operator, PropertyGroup
+from bpy.props import BoolProperty, FloatProperty, IntProperty, PointerProperty
+from bpy.app.handlers import persistent
+from gpu_extras.presets import draw_texture_2d
+
+from .render_cache import rendered_names, is_rendered
+
+# Flipbooks per scene name
+_flipbooks = {}
+# True while a capture changes frames, so its own updates aren't edits
+_capturing = False
+
+class NorentFlipbook(PropertyGroup):
+    scale: FloatProperty(
+        name="Scale",
+        description="Flipbook resolution relative to the render resolution",
+        default=0.5,
+        min=0.1,
+        max=1.0
+    )
+    
+    memory_limit: IntProperty(
+        name="Memory Limit (MB)",
+        description="RAM the flipbook may use before least recently used frames are dropped",
+        default=1024,
+        min=16,
+        max=65536
+    )
+    
+    compress: BoolProperty(
+        name="Compress",
+        description="Keep frames zlib-compressed in RAM (slower capture, several times more frames)",
+        default=True
+    )
+
+class Flipbook:
+    """Viewport-rendered frames held in RAM with an LRU memory cap"""
+    
+    def __init__(self, width, height, compress, limit_bytes):
+        self.width = width
+        self.height = height
+        self.compress = compress
+        self.limit_bytes = limit_bytes
+        self.frames = OrderedDict()  # frame -> stored bytes, least recently used first
+        self.visible = {}            # frame -> names of objects rendered on it
+        self.dirty = set()
+        self.nbytes = 0
+        self.evicted = 0
+    
+    def store(self, frame, pixels, visible):
+        self.discard(frame)
+        data = pixels.tobytes()
+        if self.compress:
+            data = zlib.compress(data, 1)
+        self.frames[frame] = data
+        self.visible[frame] = visible
+        self.nbytes += len(data)
+        self.dirty.discard(frame)
+        while self.nbytes > self.limit_bytes and len(self.frames) > 1:
+            oldest = next(iter(self.frames))
+            self.discard(oldest)
+            self.evicted += 1
+    
+    def discard(self, frame):
+        data = self.frames.pop(frame, None)
+        if data is not None:
+            self.nbytes -= len(data)
+    
+    def load(self, frame):
+        """RGBA uint8 pixels of a cached frame, or None"""
+        data = self.frames.get(frame)
+        if data is None:
+            return None
+        self.frames.move_to_end(frame)
+        if self.compress:
+            data = zlib.decompress(data)
+        return np.frombuffer(data, dtype=np.uint8).reshape(self.height, self.width, 4)
+    
+    def needs_capture(self, frame):
+        return frame not in self.frames or frame in self.dirty
+    
+    def invalidate(self, names=None):
+        """Mark frames showing any of the named objects (all frames for None) for recapture"""
+        for frame, visible in self.visible.items():
+            if names is None or visible & names:
+                self.dirty.add(frame)
+
+def flipbook_size(scene):
+    render = scene.render
+    scale = render.resolution_percentage / 100 * scene.norent_flipbook.scale
+    return max(1, int(render.resolution_x * scale)), max(1, int(render.resolution_y * scale))
+
+def get_flipbook(scene):
+    """The scene's flipbook, recreated when its size or storage settings change"""
+    settings = scene.norent_flipbook
+    width, height = flipbook_size(scene)
+    limit = settings.memory_limit * 1024 * 1024
+    flipbook = _flipbooks.get(scene.name)
+    if flipbook is None or (flipbook.width, flipbook.height, flipbook.compress) != (width, height, settings.compress):
+        flipbook = _flipbooks[scene.name] = Flipbook(width, height, settings.compress, limit)
+    flipbook.limit_bytes = limit
+    return flipbook
+
+def find_view3d(context):
+    """A 3D viewport (space, WINDOW region) to draw camera views with"""
+    for area in context.screen.areas:
+        if area.type == 'VIEW_3D':
+            region = next((r for r in area.regions if r.type == 'WINDOW'), None)
+            if region:
+                return area.spaces.active, region
+    return None, None
+
+def capture(context, frames, progress=None):
+    """Viewport-render frames that are missing or invalidated; returns (captured, reused)"""
+    global _capturing
+    scene = context.scene
+    space, region = find_view3d(context)
+    if space is None or scene.camera is None:
+        raise RuntimeError("Flipbook capture needs a 3D viewport and a scene camera")
+    
+    flipbook = get_flipbook(scene)
+    todo = [frame for frame in frames if flipbook.needs_capture(frame)]
+    if not todo:
+        return 0, len(frames)
+    
+    width, height = flipbook.width, flipbook.height
+    offscreen = gpu.types.GPUOffScreen(width, height)
+    original = scene.frame_current
+    _capturing = True
+    try:
+        for i, frame in enumerate(todo):
+            scene.frame_set(frame)
+            depsgraph = context.evaluated_depsgraph_get()
+            camera = scene.camera
+            view_matrix = camera.matrix_world.inverted()
+            projection_matrix = camera.calc_matrix_camera(depsgraph, x=width, y=height)
+            offscreen.draw_view3d(
+                scene, context.view_layer, space, region,
+                view_matrix, projection_matrix, do_color_management=True
+            )
+            buffer = offscreen.texture_color.read()
+            buffer.dimensions = width * height * 4
+            pixels = np.array(buffer)
+            if pixels.dtype.kind == 'f':
+                pixels = (np.clip(pixels, 0.0, 1.0) * 255.0 + 0.5)
+            pixels = pixels.astype(np.uint8)
+            
+            in_layers = rendered_names(scene)
+            visible = {obj.name for obj in scene.objects if obj.name in in_layers and is_rendered(obj)}
+            flipbook.store(frame, pixels, visible)
+            if progress:
+                progress(i + 1, len(todo))
+    finally:
+        offscreen.free()
+        scene.frame_set(original)
+        _capturing = False
+    return len(todo), len(frames) - len(todo)
+
+def flipbook_status(scene):
+    """Short status line for the UI"""
+    flipbook = _flipbooks.get(scene.name)
+    if not flipbook or not flipbook.frames:
+        return "Empty"
+    text = f"{len(flipbook.frames)} frames, {flipbook.nbytes / 1024 ** 2:.0f} MB"
+    if flipbook.dirty:
+        text += f", {len(flipbook.dirty & set(flipbook.frames))} stale"
+    return text
+
+def _edited_objects(scene, depsgraph):
+    """Names of objects an edit touched; None when it may affect every frame"""
+    names = set()
+    for update in depsgraph.updates:
+        original = getattr(update.id, "original", update.id)
+        if isinstance(original, bpy.types.Scene):
+            continue  # Fires for selection and frame changes too
+        if isinstance(original, bpy.types.Object):
+            names.add(original.name)
+        elif isinstance(original, (bpy.types.World, bpy.types.Image)):
+            return None
+        else:
+            # Data, materials, node trees and actions: find the objects using them
+            for obj in scene.objects:
+                anim = obj.animation_data
+                if (obj.data == original or (anim and anim.action == original)
+                        or any(slot.material == original or (slot.material and slot.material.node_tree == original)
+                               for slot in obj.material_slots)):
+                    names.add(obj.name)
+    return names
+
+@persistent
+def flipbook_depsgraph_update_post(scene, depsgraph):
+    if _capturing:
+        return
+    flipbook = _flipbooks.get(scene.name)
+    if not flipbook or not flipbook.frames:
+        return
+    names = _edited_objects(scene, depsgraph)
+    if names is None or names:
+        flipbook.invalidate(names)
+
+@persistent
+def flipbook_load_post(dummy):
+    _flipbooks.clear()
+
+class NORENT_OT_FlipbookCapture(Operator):
+    """Viewport-render the frame range into the RAM flipbook"""
+    bl_idname = "norent.flipbook_capture"
+    bl_label = "Capture Flipbook"
+    bl_description = "Viewport-render missing or edited frames into the in-memory flipbook"
+    
+    def execute(self, context):
+        scene = context.scene
+        frames = range(scene.frame_start, scene.frame_end + 1, max(scene.frame_step, 1))
+        wm = context.window_manager
+        wm.progress_begin(0, len(frames))
+        try:
+            captured, reused = capture(context, frames, lambda done, total: wm.progress_update(done))
+        except RuntimeError as error:
+            self.report({'ERROR'}, str(error))
+            return {'CANCELLED'}
+        finally:
+            wm.progress_end()
+        
+        flipbook = _flipbooks[scene.name]
+        self.report({'INFO'}, f"Flipbook: {captured} frames captured, {reused} reused | {flipbook_status(scene)}")
+        return {'FINISHED'}
+
+class NORENT_OT_FlipbookPlay(Operator):
+    """Play the RAM flipbook at scene fps"""
+    bl_idname = "norent.flipbook_play"
+    bl_label = "Play Flipbook"
+    bl_description = "Play the in-memory flipbook over the viewport at the scene frame rate (Esc to stop)"
+    
+    _timer = None
+    _handle = None
+    
+    def invoke(self, context, event):
+        scene = context.scene
+        frames = list(range(scene.frame_start, scene.frame_end + 1, max(scene.frame_step, 1)))
+        try:
+            # Bring edited frames up to date first
+            capture(context, frames)
+        except RuntimeError as error:
+            self.report({'ERROR'}, str(error))
+            return {'CANCELLED'}
+        
+        self.flipbook = _flipbooks[scene.name]
+        self.frames = [frame for frame in frames if frame in self.flipbook.frames]
+        if not self.frames:
+            self.report({'WARNING'}, "Flipbook is empty")
+            return {'CANCELLED'}
+        self.index = 0
+        self.texture = None
+        self.texture_frame = None
+        
+        fps = scene.render.fps / scene.render.fps_base
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(max(scene.frame_step, 1) / fps, window=context.window)
+        self._handle = bpy.types.SpaceView3D.draw_handler_add(self.draw, (), 'WINDOW', 'POST_PIXEL')
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+    
+    def modal(self, context, event):
+        if event.type in {'ESC', 'RIGHTMOUSE'}:
+            self.stop(context)
+            return {'CANCELLED'}
+        if event.type == 'TIMER':
+            self.index = (self.index + 1) % len(self.frames)
+            for area in context.screen.areas:
+                if area.type == 'VIEW_3D':
+                    area.tag_redraw()
+            context.workspace.status_text_set(f"NORENT Flipbook: frame {self.frames[self.index]} | Esc to stop")
+        return {'PASS_THROUGH'}
+    
+    def draw(self):
+        frame = self.frames[self.index]
+        if frame != self.texture_frame:
+            pixels = self.flipbook.load(frame)
+            if pixels is None:
+                return
+            data = gpu.types.Buffer('FLOAT', pixels.size, (pixels.astype(np.float32) / 255.0).ravel())
+            self.texture = gpu.types.GPUTexture((self.flipbook.width, self.flipbook.height), format='RGBA8', data=data)
+            self.texture_frame = frame
+        
+        # Fit the frame inside the viewport, keeping its aspect
+        region = bpy.context.region
+        fit = min(region.width / self.flipbook.width, region.height / self.flipbook.height)
+        width, height = self.flipbook.width * fit, self.flipbook.height * fit
+        draw_texture_2d(self.texture, ((region.width - width) / 2, (region.height - height) / 2), width, height)
+    
+    def stop(self, context):
+        context.window_manager.event_timer_remove(self._timer)
+        bpy.types.SpaceView3D.draw_handler_remove(self._handle, 'WINDOW')
+        context.workspace.status_text_set(None)
+        for area in context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+class NORENT_OT_FlipbookClear(Operator):
+    """Free the RAM flipbook"""
+    bl_idname = "norent.flipbook_clear"
+    bl_label = "Clear Flipbook"
+    bl_description = "Drop every cached flipbook frame"
+    
+    def execute(self, context):
+        _flipbooks.pop(context.scene.name, None)
+        self.report({'INFO'}, "Flipbook cleared")
+        return {'FINISHED'}
+
+# Registration
+classes = [
+    NorentFlipbook,
+    NORENT_OT_FlipbookCapture,
+    NORENT_OT_FlipbookPlay,
+    NORENT_OT_FlipbookClear,
+]
+
+handlers = [
+    (bpy.app.handlers.depsgraph_update_post, flipbook_depsgraph_update_post),
+    (bpy.app.handlers.load_post, flipbook_load_post),
+]
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    
+    bpy.types.Scene.norent_flipbook = PointerProperty(type=NorentFlipbook)
+    for handler_list, handler in handlers:
+        handler_list.append(handler)
+
+def unregister():
+    for handler_list, handler in handlers:
+        handler_list.remove(handler)
+    _flipbooks.clear()
+    
+    del bpy.types.Scene.norent_flipbook
+    
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
\ No newline at end of file
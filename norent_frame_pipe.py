@@ -0,0 +1,290 @@
+import bpy
+import json
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from queue import Queue
+import numpy as np
+
+# Runs both inside the add-on and as a --python script in a headless Blender,
+# so it must not use relative imports.
+
+# Printed once per frame; the same line Blender's movie writer prints
+APPEND_FORMAT = "Append frame {}"
+# Final statistics line read back by the parent process
+STATS_PREFIX = "NORENT_STREAM "
+
+STREAM_H264 = [
+    "-vf", "crop=trunc(iw/2)*2:trunc(ih/2)*2",
+    "-c:v", "libx264", "-preset", "veryfast", "-crf", "20", "-pix_fmt", "yuv420p",
+]
+
+# OCIO colorspace that bakes each view transform for an sRGB display
+DISPLAY_COLORSPACES = {
+    'Standard': 'sRGB',
+    'Filmic': 'Filmic sRGB',
+    'AgX': 'AgX Base sRGB',
+    'Khronos PBR Neutral': 'Khronos PBR Neutral sRGB',
+}
+# Scene-linear colorspace name in Blender 4.x configs, then 3.x
+SCENE_LINEAR = ('Linear Rec.709', 'Linear')
+
+def stream_unsupported(scene):
+    """Why a scene's colour management can't be rebuilt in the compositor, or None.
+    
+    viewer_setup() converts the scene-linear composite to the display view
+    with compositor nodes; looks and curves have no node equivalent.
+    """
+    view = scene.view_settings
+    if scene.display_settings.display_device != 'sRGB':
+        return f"display device {scene.display_settings.display_device}"
+    if view.view_transform not in DISPLAY_COLORSPACES:
+        return f"{view.view_transform} view transform"
+    if view.look != 'None':
+        return f"look {view.look}"
+    if view.use_curve_mapping:
+        return "color curves"
+    return None
+
+def _set_colorspace(node, attr, names):
+    for name in names:
+        try:
+            setattr(node, attr, name)
+            return
+        except TypeError:
+            continue
+    raise RuntimeError(f"Colorspace {names[0]} is not in this OpenColorIO config")
+
+def display_nodes(scene, tree, source, added):
+    """Chain exposure, view transform and gamma after source; returns the display-referred socket"""
+    view = scene.view_settings
+    socket = source
+    if view.exposure != 0.0:
+        exposure = tree.nodes.new('CompositorNodeExposure')
+        added.append(exposure)
+        exposure.inputs[1].default_value = view.exposure
+        tree.links.new(socket, exposure.inputs[0])
+        socket = exposure.outputs[0]
+    
+    convert = tree.nodes.new('CompositorNodeConvertColorSpace')
+    added.append(convert)
+    _set_colorspace(convert, "from_color_space", SCENE_LINEAR)
+    _set_colorspace(convert, "to_color_space", (DISPLAY_COLORSPACES[view.view_transform],))
+    tree.links.new(socket, convert.inputs[0])
+    socket = convert.outputs[0]
+    
+    if view.gamma != 1.0:
+        gamma = tree.nodes.new('CompositorNodeGamma')
+        added.append(gamma)
+        gamma.inputs[1].default_value = 1.0 / view.gamma
+        tree.links.new(socket, gamma.inputs[0])
+        socket = gamma.outputs[0]
+    return socket
+
+def viewer_setup(scene):
+    """Route the display-referred composite into a Viewer node so its pixels can be read; returns a restore callback"""
+    saved = (scene.use_nodes, scene.render.use_compositing)
+    scene.use_nodes = True
+    scene.render.use_compositing = True
+    tree = scene.node_tree
+    added = []
+    
+    viewer = next((node for node in tree.nodes if node.type == 'VIEWER'), None)
+    original = viewer.inputs[0].links[0].from_socket if viewer and viewer.inputs[0].is_linked else None
+    source = original
+    if source is None:
+        composite = next((node for node in tree.nodes if node.type == 'COMPOSITE'), None)
+        if composite and composite.inputs[0].is_linked:
+            source = composite.inputs[0].links[0].from_socket
+        else:
+            layers = next((node for node in tree.nodes if node.type == 'R_LAYERS'), None)
+            if layers is None:
+                layers = tree.nodes.new('CompositorNodeRLayers')
+                added.append(layers)
+            source = layers.outputs['Image']
+    if viewer is None:
+        viewer = tree.nodes.new('CompositorNodeViewer')
+        added.append(viewer)
+    
+    def restore():
+        for node in reversed(added):
+            tree.nodes.remove(node)
+        if original is not None:
+            tree.links.new(original, viewer.inputs[0])
+        scene.use_nodes, scene.render.use_compositing = saved
+    
+    try:
+        tree.links.new(display_nodes(scene, tree, source, added), viewer.inputs[0])
+    except RuntimeError:
+        restore()
+        raise
+    tree.nodes.active = viewer
+    return restore
+
+class FramePipe:
+    """Feed raw RGB frames to a long-lived ffmpeg process from a writer thread.
+    
+    push() blocks once max_queued frames are waiting, so a slow encoder
+    throttles rendering instead of growing memory; each such wait is
+    counted as a back-pressure stall.
+    """
+    
+    def __init__(self, ffmpeg, output_path, width, height, fps, codec_args=None, max_queued=4):
+        self.command = [
+            ffmpeg, "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{width}x{height}", "-framerate", f"{fps:.6g}",
+            "-i", "-",
+        ] + list(codec_args or STREAM_H264) + [output_path]
+        self.queue = Queue(maxsize=max_queued)
+        self.stderr = tempfile.TemporaryFile()
+        self.process = subprocess.Popen(self.command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=self.stderr)
+        self.frames = 0
+        self.bytes = 0
+        self.stalls = 0
+        self.stall_time = 0.0
+        self.write_time = 0.0
+        self.error = None
+        self.start_time = time.perf_counter()
+        self.end_time = None
+        self.writer = threading.Thread(target=self._write, daemon=True)
+        self.writer.start()
+    
+    def _write(self):
+        while True:
+            data = self.queue.get()
+            if data is None:
+                break
+            if self.error:
+                continue  # Keep draining so push() never deadlocks
+            start = time.perf_counter()
+            try:
+                self.process.stdin.write(data)
+            except (BrokenPipeError, OSError) as error:
+                self.error = error
+                continue
+            self.write_time += time.perf_counter() - start
+            self.frames += 1
+            self.bytes += len(data)
+        try:
+            self.process.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+    
+    def push(self, data):
+        if self.error:
+            raise RuntimeError(f"ffmpeg stopped accepting frames: {self.stderr_text() or self.error}")
+        if self.queue.full():
+            start = time.perf_counter()
+            self.queue.put(data)
+            self.stalls += 1
+            self.stall_time += time.perf_counter() - start
+        else:
+            self.queue.put(data)
+    
+    def close(self):
+        """Flush queued frames and wait for ffmpeg; returns the statistics"""
+        self.queue.put(None)
+        self.writer.join()
+        returncode = self.process.wait()
+        self.end_time = time.perf_counter()
+        if returncode != 0 and not self.error:
+            self.error = RuntimeError(self.stderr_text() or f"ffmpeg exited with {returncode}")
+        self.stderr.close()
+        return self.stats()
+    
+    def abort(self):
+        self.error = self.error or RuntimeError("cancelled")
+        self.process.kill()
+        self.queue.put(None)
+        self.writer.join()
+        self.stderr.close()
+    
+    def stderr_text(self):
+        self.stderr.seek(0)
+        return self.stderr.read().decode(errors='replace').strip()
+    
+    def stats(self):
+        elapsed = (self.end_time or time.perf_counter()) - self.start_time
+        return {
+            "frames": self.frames,
+            "seconds": elapsed,
+            "fps": self.frames / elapsed if elapsed > 0 else 0.0,
+            "megabytes_per_second": self.bytes / 1e6 / self.write_time if self.write_time > 0 else 0.0,
+            "stalls": self.stalls,
+            "stall_seconds": self.stall_time,
+            "error": str(self.error) if self.error else None,
+        }
+
+def stream_render(scene, output_path, frames, fps, ffmpeg, codec_args=None, max_queued=4, on_frame=None):
+    """Render frames one by one and pipe each composite straight into ffmpeg.
+    
+    The Viewer node must already be set up (see viewer_setup), so its pixels
+    are display-referred; callers check stream_unsupported() first.
+    """
+    buffer = None
+    pipe = None
+    render_time = 0.0
+    try:
+        for frame in frames:
+            start = time.perf_counter()
+            scene.frame_set(frame)
+            bpy.ops.render.render()
+            render_time += time.perf_counter() - start
+            
+            image = bpy.data.images['Viewer Node']
+            width, height = image.size
+            if buffer is None:
+                buffer = np.empty(width * height * 4, dtype=np.float32)
+                pipe = FramePipe(ffmpeg, output_path, width, height, fps, codec_args, max_queued)
+            image.pixels.foreach_get(buffer)
+            
+            # Bottom-up float RGBA to top-down 8-bit RGB
+            rgb = buffer.reshape(height, width, 4)[::-1, :, :3]
+            pixels = (np.clip(rgb, 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8)
+            try:
+                pipe.push(pixels.tobytes())
+            except RuntimeError:
+                break  # ffmpeg gave up; close() reports why
+            if on_frame:
+                on_frame(frame)
+    except BaseException:
+        if pipe:
+            pipe.abort()
+        raise
+    
+    if pipe is None:
+        return {"frames": 0, "seconds": 0.0, "fps": 0.0, "megabytes_per_second": 0.0,
+                "stalls": 0, "stall_seconds": 0.0, "render_seconds": 0.0, "error": "no frames"}
+    stats = pipe.close()
+    stats["render_seconds"] = render_time
+    return stats
+
+def format_stats(stats):
+    return (
+        f"{stats['frames']} frames streamed at {stats['fps']:.1f} fps "
+        f"({stats['megabytes_per_second']:.0f} MB/s to ffmpeg), "
+        f"{stats['stalls']} encoder stalls ({stats['stall_seconds']:.1f}s)"
+    )
+
+def worker_args(output_path, frames, fps, ffmpeg, codec_args=None):
+    """Command line tail that runs this module as a headless streaming worker"""
+    options = {"output": output_path, "frames": list(frames), "fps": fps, "ffmpeg": ffmpeg, "codec_args": codec_args}
+    return ["--python", __file__, "--", json.dumps(options)]
+
+def main():
+    options = json.loads(sys.argv[sys.argv.index("--") + 1])
+    scene = bpy.context.scene
+    viewer_setup(scene)
+    stats = stream_render(
+        scene, options["output"], options["frames"], options["fps"], options["ffmpeg"], options["codec_args"],
+        on_frame=lambda frame: print(APPEND_FORMAT.format(frame), flush=True)
+    )
+    print(STATS_PREFIX + json.dumps(stats), flush=True)
+    if stats["error"]:
+        print(f"Error: {stats['error']}", flush=True)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,418 @@
+import bpy
+import os
+import struct
+import threading
+import time
+import numpy as np
+
+# Quality presets: render scale, palette size, palette mode and dither strength
+GIF_QUALITY = {
+    'HIGH': {"scale": 1.0, "colors": 256, "palette": 'PER_FRAME', "dither": 0.5},
+    'MEDIUM': {"scale": 0.75, "colors": 128, "palette": 'GLOBAL', "dither": 0.75},
+    'LOW': {"scale": 0.5, "colors": 64, "palette": 'GLOBAL', "dither": 1.0},
+}
+
+# Palette lookup resolution (bits per channel)
+LUT_BITS = 6
+# Pixels sampled per frame when building a global palette
+SAMPLES_PER_FRAME = 4096
+
+BAYER_8 = np.array([
+    [0, 32, 8, 40, 2, 34, 10, 42],
+    [48, 16, 56, 24, 50, 18, 58, 26],
+    [12, 44, 4, 36, 14, 46, 6, 38],
+    [60, 28, 52, 20, 62, 30, 54, 22],
+    [3, 35, 11, 43, 1, 33, 9, 41],
+    [51, 19, 59, 27, 49, 17, 57, 25],
+    [15, 47, 7, 39, 13, 45, 5, 37],
+    [63, 31, 55, 23, 61, 29, 53, 21],
+], dtype=np.float32) / 64.0 - 0.5
+
+def load_frame(path, buffer=None):
+    """Decode an image file to a top-down uint8 RGB array (alpha composited over black)"""
+    image = bpy.data.images.load(path, check_existing=False)
+    try:
+        width, height = image.size
+        size = width * height * 4
+        if buffer is None or buffer.size != size:
+            buffer = np.empty(size, dtype=np.float32)
+        image.pixels.foreach_get(buffer)
+    finally:
+        bpy.data.images.remove(image)
+    
+    rgba = buffer.reshape(height, width, 4)[::-1]
+    rgb = rgba[..., :3] * rgba[..., 3:4]
+    return (np.clip(rgb, 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8), buffer
+
+def median_cut(pixels, colors):
+    """Vectorized median-cut palette from an (N, 3) uint8 sample"""
+    boxes = [pixels]
+    while len(boxes) < colors:
+        # Split the box with the widest channel range at its median
+        ranges = [int(np.ptp(box, axis=0).max()) if len(box) > 1 else -1 for box in boxes]
+        index = int(np.argmax(ranges))
+        if ranges[index] <= 0:
+            break
+        box = boxes.pop(index)
+        channel = int(np.argmax(np.ptp(box, axis=0)))
+        half = len(box) // 2
+        order = np.argpartition(box[:, channel], half)
+        boxes.append(box[order[:half]])
+        boxes.append(box[order[half:]])
+    return np.array([box.mean(axis=0) for box in boxes], dtype=np.float32)
+
+def refine_palette(pixels, palette, iterations=3):
+    """A few k-means steps to pull the median-cut palette onto the sample"""
+    samples = pixels.astype(np.float32)
+    for _ in range(iterations):
+        labels = nearest(samples, palette)
+        counts = np.bincount(labels, minlength=len(palette))
+        for channel in range(3):
+            sums = np.bincount(labels, weights=samples[:, channel], minlength=len(palette))
+            palette[:, channel] = np.where(counts > 0, sums / np.maximum(counts, 1), palette[:, channel])
+    return palette
+
+def nearest(colors, palette, chunk=16384):
+    """Index of the nearest palette entry for each color, in bounded-memory chunks"""
+    result = np.empty(len(colors), dtype=np.int32)
+    palette = palette.astype(np.float32)
+    palette_norm = (palette ** 2).sum(axis=1)
+    for start in range(0, len(colors), chunk):
+        block = colors[start:start + chunk].astype(np.float32)
+        distance = palette_norm[None, :] - 2.0 * block @ palette.T
+        result[start:start + chunk] = distance.argmin(axis=1)
+    return result
+
+def build_palette(sample, colors):
+    palette = median_cut(sample, colors)
+    return refine_palette(sample, palette)
+
+def palette_lut(palette):
+    """Map every LUT_BITS-per-channel color to its nearest palette index"""
+    levels = 1 << LUT_BITS
+    step = 256 // levels
+    axis = np.arange(levels, dtype=np.float32) * step + step / 2
+    grid = np.stack(np.meshgrid(axis, axis, axis, indexing='ij'), axis=-1).reshape(-1, 3)
+    return nearest(grid, palette).astype(np.uint8).reshape(levels, levels, levels)
+
+def quantize(frame, palette, lut, dither, origin=(0, 0)):
+    """Ordered-dither and map an RGB frame to palette indices in bulk.
+    
+    origin is the (top, left) of frame within the full image, so the Bayer
+    pattern of a changed region lines up with the frames beneath it.
+    """
+    height, width, _ = frame.shape
+    pixels = frame.astype(np.float32)
+    if dither > 0:
+        spread = dither * 255.0 / np.cbrt(len(palette))
+        top, left = origin
+        rows = (np.arange(height) + top) % 8
+        columns = (np.arange(width) + left) % 8
+        tiles = BAYER_8[rows[:, None], columns[None, :]]
+        pixels += (tiles * spread)[..., None]
+    shift = 8 - LUT_BITS
+    pixels = np.clip(pixels, 0, 255).astype(np.uint8) >> shift
+    return lut[pixels[..., 0], pixels[..., 1], pixels[..., 2]]
+
+def lzw_encode(indices, min_code_size):
+    """GIF-flavoured LZW compression of a flat bytes-like of palette indices"""
+    clear_code = 1 << min_code_size
+    end_code = clear_code + 1
+    out = bytearray()
+    bits = 0
+    bit_count = 0
+    
+    code_size = min_code_size + 1
+    next_code = end_code + 1
+    table = {}
+    
+    bits |= clear_code << bit_count
+    bit_count += code_size
+    
+    data = memoryview(bytes(indices))
+    prefix = data[0]
+    for byte in data[1:]:
+        key = (prefix << 8) | byte
+        code = table.get(key)
+        if code is not None:
+            prefix = code
+            continue
+        
+        bits |= prefix << bit_count
+        bit_count += code_size
+        while bit_count >= 8:
+            out.append(bits & 0xFF)
+            bits >>= 8
+            bit_count -= 8
+        
+        if next_code < 4096:
+            table[key] = next_code
+            next_code += 1
+            if next_code > (1 << code_size) and code_size < 12:
+                code_size += 1
+        else:
+            # Table full: start over
+            bits |= clear_code << bit_count
+            bit_count += code_size
+            table.clear()
+            code_size = min_code_size + 1
+            next_code = end_code + 1
+        prefix = byte
+    
+    bits |= prefix << bit_count
+    bit_count += code_size
+    # The decoder adds one more entry on the last code and may widen before the end code
+    if next_code == (1 << code_size) and code_size < 12:
+        code_size += 1
+    bits |= end_code << bit_count
+    bit_count += code_size
+    while bit_count > 0:
+        out.append(bits & 0xFF)
+        bits >>= 8
+        bit_count -= 8
+    return bytes(out)
+
+def _sub_blocks(data):
+    out = bytearray()
+    for start in range(0, len(data), 255):
+        block = data[start:start + 255]
+        out.append(len(block))
+        out += block
+    out.append(0)
+    return bytes(out)
+
+def _color_table(palette):
+    """Palette bytes padded to a power of two, plus the table size field"""
+    size_bits = max(1, int(np.ceil(np.log2(max(len(palette), 2)))))
+    table = np.zeros((1 << size_bits, 3), dtype=np.uint8)
+    table[:len(palette)] = np.clip(palette + 0.5, 0, 255).astype(np.uint8)
+    return table.tobytes(), size_bits - 1
+
+class GifWriter:
+    """Minimal streaming GIF89a writer"""
+    
+    def __init__(self, path, width, height, global_palette=None, loop=0):
+        self.file = open(path, 'wb')
+        self.file.write(b"GIF89a")
+        flags = 0
+        table = b""
+        if global_palette is not None:
+            table, size_field = _color_table(global_palette)
+            flags = 0x80 | 0x70 | size_field
+        self.file.write(struct.pack("<HHBBB", width, height, flags, 0, 0))
+        self.file.write(table)
+        # Loop forever (NETSCAPE2.0 application extension)
+        self.file.write(b"\x21\xFF\x0BNETSCAPE2.0\x03\x01" + struct.pack("<H", loop) + b"\x00")
+        self.frames = 0
+    
+    def add_frame(self, indices, delay_cs, rect=None, palette=None):
+        """Write one frame of palette indices; rect = (left, top) of the sub-image"""
+        height, width = indices.shape
+        left, top = rect or (0, 0)
+        
+        # Graphic control extension: keep the previous frame under this one
+        self.file.write(b"\x21\xF9\x04" + struct.pack("<BHBB", 0x04, max(int(delay_cs), 1), 0, 0))
+        
+        flags = 0
+        table = b""
+        colors = 256
+        if palette is not None:
+            table, size_field = _color_table(palette)
+            flags = 0x80 | size_field
+            colors = len(palette)
+        self.file.write(b"\x2C" + struct.pack("<HHHHB", left, top, width, height, flags))
+        self.file.write(table)
+        
+        min_code_size = max(2, int(np.ceil(np.log2(max(colors, 2)))))
+        self.file.write(bytes([min_code_size]))
+        self.file.write(_sub_blocks(lzw_encode(np.ascontiguousarray(indices, dtype=np.uint8), min_code_size)))
+        self.frames += 1
+    
+    def close(self):
+        self.file.write(b"\x3B")
+        self.file.close()
+
+def changed_rect(previous, frame):
+    """Bounding box (top, bottom, left, right) of pixels that differ, or None"""
+    diff = np.any(previous != frame, axis=2)
+    rows = np.flatnonzero(diff.any(axis=1))
+    if not len(rows):
+        return None
+    cols = np.flatnonzero(diff.any(axis=0))
+    return rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+
+def sample_pixels(frames, per_frame=SAMPLES_PER_FRAME, seed=0):
+    """Random pixel sample across staged frames for a global palette"""
+    rng = np.random.default_rng(seed)
+    count, height, width, _ = frames.shape
+    samples = []
+    for i in range(count):
+        flat = frames[i].reshape(-1, 3)
+        samples.append(flat[rng.integers(0, len(flat), min(per_frame, len(flat)))])
+    return np.concatenate(samples)
+
+def encode_staged(frames, output_path, quality, fps, progress=None, cancelled=None):
+    """Encode staged uint8 frames (F, H, W, 3) to a GIF. Returns encode stats."""
+    settings = GIF_QUALITY[quality]
+    count, height, width, _ = frames.shape
+    per_frame = settings["palette"] == 'PER_FRAME'
+    
+    global_palette = None
+    lut = None
+    if not per_frame:
+        global_palette = build_palette(sample_pixels(frames), settings["colors"])
+        lut = palette_lut(global_palette)
+    
+    writer = GifWriter(output_path, width, height, global_palette)
+    stats = {"frames": count, "written": 0, "merged": 0}
+    
+    # Timestamps in centiseconds, so rounding never drifts
+    def timestamp(i):
+        return int(round(i * 100.0 / fps))
+    
+    pending = None  # (indices, rect, palette, first frame index)
+    previous = None
+    for i in range(count):
+        if cancelled and cancelled():
+            break
+        frame = np.asarray(frames[i])
+        
+        rect = (0, height, 0, width) if previous is None else changed_rect(previous, frame)
+        if rect is None:
+            # Identical to the previous frame: extend its duration instead
+            stats["merged"] += 1
+            continue
+        
+        if pending:
+            indices, offset, palette, first = pending
+            writer.add_frame(indices, timestamp(i) - timestamp(first), offset, palette)
+            stats["written"] += 1
+        
+        top, bottom, left, right = rect
+        region = frame[top:bottom, left:right]
+        palette = None
+        frame_lut = lut
+        if per_frame:
+            flat = region.reshape(-1, 3)
+            step = max(1, len(flat) // (SAMPLES_PER_FRAME * 16))
+            palette = build_palette(flat[::step], settings["colors"])
+            frame_lut = palette_lut(palette)
+        indices = quantize(region, palette if per_frame else global_palette, frame_lut, settings["dither"], (top, left))
+        pending = (indices, (left, top), palette, i)
+        previous = frame
+        
+        if progress:
+            progress(i + 1, count)
+    
+    if pending:
+        indices, offset, palette, first = pending
+        writer.add_frame(indices, timestamp(count) - timestamp(first), offset, palette)
+        stats["written"] += 1
+    writer.close()
+    return stats
+
+def stage_path(frame_paths):
+    return os.path.join(os.path.dirname(frame_paths[0]), "frames_rgb.npy")
+
+class GifEncodeJob:
+    """Stage rendered frames into a memory-mapped buffer, then encode on a thread.
+    
+    Decoding needs bpy and runs a time slice per poll() on the main thread;
+    quantization and LZW run on a worker thread so the UI stays responsive.
+    Exposes the RenderJob interface used by BackgroundRenderMixin.
+    """
+    
+    def __init__(self, frame_paths, output_path, quality, fps):
+        self.frame_paths = sorted(frame_paths)
+        self.output_path = output_path
+        self.quality = quality
+        self.fps = fps
+        self.label = "GIF Encode"
+        self.total_frames = len(self.frame_paths)
+        self.frames_done = 0
+        self.staged = 0
+        self.frames = None
+        self.buffer = None
+        self.thread = None
+        self.stats = None
+        self.error = None
+        self.log = []
+        self.start_time = None
+        self.end_time = None
+        self._cancel = False
+    
+    def start(self):
+        self.start_time = time.perf_counter()
+        return self
+    
+    def _stage(self, budget=0.2):
+        deadline = time.perf_counter() + budget
+        while self.staged < self.total_frames and time.perf_counter() < deadline:
+            frame, self.buffer = load_frame(self.frame_paths[self.staged], self.buffer)
+            if self.frames is None:
+                shape = (self.total_frames,) + frame.shape
+                self.frames = np.lib.format.open_memmap(stage_path(self.frame_paths), mode='w+', dtype=np.uint8, shape=shape)
+            self.frames[self.staged] = frame
+            self.staged += 1
+    
+    def _encode(self):
+        try:
+            self.stats = encode_staged(
+                self.frames, self.output_path, self.quality, self.fps,
+                progress=self._progress, cancelled=lambda: self._cancel
+            )
+        except Exception as error:
+            self.error = error
+            self.log.append(str(error))
+    
+    def _progress(self, done, total):
+        self.frames_done = done
+    
+    def poll(self):
+        if self.staged < self.total_frames:
+            self._stage()
+            return True
+        if self.thread is None:
+            self.frames.flush()
+            self.thread = threading.Thread(target=self._encode, daemon=True)
+            self.thread.start()
+        if self.thread.is_alive():
+            return True
+        if self.end_time is None:
+            self.end_time = time.perf_counter()
+        return False
+    
+    def run(self):
+        """Blocking encode for background mode"""
+        self.start()
+        while self.poll():
+            if self.thread:
+                self.thread.join()
+        return self
+    
+    @property
+    def succeeded(self):
+        return self.error is None and not self._cancel
+    
+    @property
+    def elapsed(self):
+        return (self.end_time or time.perf_counter()) - (self.start_time or time.perf_counter())
+    
+    eta = None
+    
+    def status_text(self):
+        if self.staged < self.total_frames:
+            return f"NORENT GIF: decoding {self.staged}/{self.total_frames} frames | Esc to cancel"
+        return f"NORENT GIF: encoding {self.frames_done}/{self.total_frames} frames | Esc to cancel"
+    
+    def cancel(self):
+        self._cancel = True
+        if self.thread:
+            self.thread.join()
+    
+    def cleanup(self):
+        if self.frames is not None:
+            path = self.frames.filename
+            self.frames = None
+            if path and os.path.exists(path):
+                os.remove(path)
\ No newline at end of file
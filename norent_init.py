@@ -17,9 +17,22 @@ from bpy.props import BoolProperty, StringProperty, EnumProperty
 # Import our modules
 from . import panel_ui
 from . import text_fx
+from . import rig_builder
 from . import camera_rigs
+from . import camera_shots
+from . import driver_audit
+from . import transform_cache
 from . import easing
 from . import utils
+from . import delivery
+from . import flipbook
+from . import overlay
+from . import shader_warmup
+from . import telemetry
+from . import render_queue
+from . import template_catalog
+from . import template_link
+from . import dedup
 
 # Add-on preferences
 class NorentPreferences(AddonPreferences):
@@ -69,6 +82,17 @@ class NorentSceneProperties(PropertyGroup):
         ],
         default='REEL'
     )
+    
+    quality_tier: EnumProperty(
+        name="Quality",
+        description="Render quality tier applied on top of the scene's own settings",
+        items=[
+            ('DRAFT', "Draft", "1/8 samples, simplified subdivision and curves, no motion blur, denoised"),
+            ('REVIEW', "Review", "Half samples, lightly simplified, denoised"),
+            ('FINAL', "Final", "The scene's settings as authored")
+        ],
+        default='FINAL'
+    )
 
 # License validation operator
 class NORENT_OT_ValidateLicense(bpy.types.Operator):
@@ -147,9 +171,22 @@ def register():
     # Register modules
     panel_ui.register()
     text_fx.register()
+    rig_builder.register()
     camera_rigs.register()
+    camera_shots.register()
+    driver_audit.register()
+    transform_cache.register()
     easing.register()
     utils.register()
+    delivery.register()
+    flipbook.register()
+    overlay.register()
+    shader_warmup.register()
+    telemetry.register()
+    render_queue.register()
+    template_catalog.register()
+    template_link.register()
+    dedup.register()
     
     # Add scene properties
     bpy.types.Scene.norent = bpy.props.PointerProperty(type=NorentSceneProperties)
@@ -159,9 +196,22 @@ def register():
 
 def unregister():
     # Unregister modules
+    dedup.unregister()
+    template_link.unregister()
+    template_catalog.unregister()
+    render_queue.unregister()
+    telemetry.unregister()
+    shader_warmup.unregister()
+    overlay.unregister()
+    flipbook.unregister()
+    delivery.unregister()
     utils.unregister()
     easing.unregister()
+    transform_cache.unregister()
+    driver_audit.unregister()
+    camera_shots.unregister()
     camera_rigs.unregister()
+    rig_builder.unregister()
     text_fx.unregister()
     panel_ui.unregister()
     
@@ -0,0 +1,403 @@
+# Crash-resumable render queue shared by every NORENT session on this machine.
+# Jobs live in SQLite; a supervisor process (this file run as a script with
+# plain Python) claims them by priority and drives one headless Blender per
+# job up to the worker limit. Frames a worker reports saved are checkpointed,
+# so a job cut off by a crash resumes at the frames still missing. It runs
+# outside Blender, so it must not import bpy or use relative imports.
+import json
+import os
+import re
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+from queue import Queue, Empty
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    label TEXT NOT NULL,
+    blender TEXT NOT NULL,
+    blend TEXT NOT NULL,
+    scene TEXT NOT NULL,
+    frames TEXT NOT NULL,
+    frames_dir TEXT NOT NULL,
+    encode TEXT,
+    priority INTEGER NOT NULL DEFAULT 0,
+    threads INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'QUEUED',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    pid INTEGER,
+    created REAL NOT NULL,
+    started REAL,
+    finished REAL,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    job INTEGER NOT NULL,
+    frame INTEGER NOT NULL,
+    PRIMARY KEY (job, frame)
+);
+CREATE TABLE IF NOT EXISTS supervisor (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    pid INTEGER,
+    heartbeat REAL,
+    max_workers INTEGER NOT NULL DEFAULT 1
+);
+INSERT OR IGNORE INTO supervisor (id) VALUES (1);
+"""
+
+# Job states; RUNNING and ENCODING hold a worker slot
+QUEUED, RUNNING, ENCODING, DONE, FAILED, CANCELLED = "QUEUED", "RUNNING", "ENCODING", "DONE", "FAILED", "CANCELLED"
+ACTIVE = (RUNNING, ENCODING)
+
+HEARTBEAT_INTERVAL = 2.0
+HEARTBEAT_TIMEOUT = 15.0
+POLL_INTERVAL = 0.5
+IDLE_EXIT = 30.0
+
+SAVED_LINE = re.compile(r"^Saved: '(.+)'")
+FRAME_NUMBER = re.compile(r"(\d+)\.\w+$")
+
+def pid_alive(pid):
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+def pid_command(pid):
+    """Command line of a running process, or None where it can't be read"""
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as source:
+            return source.read().decode(errors="replace").split("\0")
+    except OSError:
+        return None
+
+def is_job_worker(pid, job):
+    """True only if pid is still this job's Blender or ffmpeg.
+    
+    After a crash or reboot the pid may have been reused by an unrelated
+    process, so it is matched against the job's snapshot and frames folder.
+    """
+    if not pid_alive(pid):
+        return False
+    command = pid_command(pid)
+    if not command:
+        return False
+    inside = job["frames_dir"].rstrip(os.sep) + os.sep
+    return job["blend"] in command or any(arg.startswith(inside) for arg in command)
+
+def frame_ranges(frames):
+    """Blender -f argument for a frame list, with runs collapsed: 1-10,12,20-24"""
+    frames = sorted(frames)
+    parts = []
+    start = previous = frames[0]
+    for frame in frames[1:] + [None]:
+        if frame is not None and frame == previous + 1:
+            previous = frame
+            continue
+        parts.append(str(start) if start == previous else f"{start}-{previous}")
+        start = previous = frame
+    return ",".join(parts)
+
+class JobQueue:
+    """Job rows, checkpoints and supervisor state in one SQLite file"""
+    
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+    
+    def close(self):
+        self.db.close()
+    
+    def add(self, label, blender, blend, scene, frames, frames_dir, encode=None, priority=0, threads=0, max_attempts=3):
+        cursor = self.db.execute(
+            "INSERT INTO jobs (label, blender, blend, scene, frames, frames_dir, encode, priority, threads, max_attempts, created) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (label, blender, blend, scene, json.dumps(list(frames)), frames_dir,
+             json.dumps(encode) if encode else None, priority, threads, max_attempts, time.time())
+        )
+        return cursor.lastrowid
+    
+    def job(self, job_id):
+        return self.db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+    
+    def jobs(self):
+        """Every job with its checkpointed frame count, in run order"""
+        return self.db.execute(
+            "SELECT jobs.*, (SELECT COUNT(*) FROM checkpoints WHERE job = jobs.id) AS done FROM jobs "
+            "ORDER BY status IN ('DONE', 'FAILED', 'CANCELLED'), priority DESC, id"
+        ).fetchall()
+    
+    def update(self, job_id, **values):
+        assignments = ", ".join(f"{column} = ?" for column in values)
+        self.db.execute(f"UPDATE jobs SET {assignments} WHERE id = ?", (*values.values(), job_id))
+    
+    def claim(self):
+        """Atomically move the highest-priority queued job to RUNNING"""
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            row = self.db.execute(
+                "SELECT * FROM jobs WHERE status = ? ORDER BY priority DESC, id LIMIT 1", (QUEUED,)
+            ).fetchone()
+            if row:
+                self.db.execute(
+                    "UPDATE jobs SET status = ?, started = COALESCE(started, ?) WHERE id = ?", (RUNNING, time.time(), row["id"])
+                )
+            self.db.execute("COMMIT")
+        except Exception:
+            self.db.execute("ROLLBACK")
+            raise
+        return self.job(row["id"]) if row else None
+    
+    def count(self, *statuses):
+        marks = ", ".join("?" for _ in statuses)
+        return self.db.execute(f"SELECT COUNT(*) FROM jobs WHERE status IN ({marks})", statuses).fetchone()[0]
+    
+    def checkpoint(self, job_id, frame):
+        self.db.execute("INSERT OR IGNORE INTO checkpoints (job, frame) VALUES (?, ?)", (job_id, frame))
+    
+    def done_frames(self, job_id):
+        return {row[0] for row in self.db.execute("SELECT frame FROM checkpoints WHERE job = ?", (job_id,))}
+    
+    def cancel(self, job_id):
+        self.db.execute("UPDATE jobs SET status = ? WHERE id = ? AND status IN (?, ?, ?)", (CANCELLED, job_id, QUEUED, *ACTIVE))
+    
+    def retry(self, job_id):
+        self.db.execute(
+            "UPDATE jobs SET status = ?, attempts = 0, error = NULL WHERE id = ? AND status IN (?, ?)",
+            (QUEUED, job_id, FAILED, CANCELLED)
+        )
+    
+    def remove(self, job_id):
+        self.db.execute("DELETE FROM checkpoints WHERE job = ?", (job_id,))
+        self.db.execute("DELETE FROM jobs WHERE id = ? AND status NOT IN (?, ?)", (job_id, *ACTIVE))
+    
+    @property
+    def max_workers(self):
+        return self.db.execute("SELECT max_workers FROM supervisor").fetchone()[0]
+    
+    @max_workers.setter
+    def max_workers(self, value):
+        self.db.execute("UPDATE supervisor SET max_workers = ?", (max(1, value),))
+    
+    def heartbeat(self, pid):
+        self.db.execute("UPDATE supervisor SET pid = ?, heartbeat = ?", (pid, time.time()))
+    
+    def supervisor_pid(self):
+        """pid of a live supervisor, or None"""
+        row = self.db.execute("SELECT pid, heartbeat FROM supervisor").fetchone()
+        if row["heartbeat"] and time.time() - row["heartbeat"] < HEARTBEAT_TIMEOUT and pid_alive(row["pid"]):
+            return row["pid"]
+        return None
+
+def sequence_frames(frames_dir):
+    """{frame: path} of the PNGs in a sequence directory"""
+    if not os.path.isdir(frames_dir):
+        return {}
+    found = {}
+    for name in os.listdir(frames_dir):
+        match = FRAME_NUMBER.search(name)
+        if match and name.endswith(".png"):
+            found[int(match.group(1))] = os.path.join(frames_dir, name)
+    return found
+
+def encode_args(frames_dir, fps):
+    """ffmpeg input arguments for the sequence (concat list when frames are stepped)"""
+    files = sequence_frames(frames_dir)
+    numbers = sorted(files)
+    list_path = os.path.join(frames_dir, "frames.ffconcat")
+    with open(list_path, "w") as listing:
+        listing.write("ffconcat version 1.0\n")
+        for number in numbers:
+            listing.write(f"file '{os.path.basename(files[number])}'\nduration {1 / fps:.6f}\n")
+    return ["-f", "concat", "-safe", "0", "-i", list_path, "-r", f"{fps:.6g}"]
+
+class Worker:
+    """One child process of the supervisor, with its output read on a thread"""
+    
+    def __init__(self, job_id, command, stage):
+        self.job_id = job_id
+        self.stage = stage
+        self.lines = Queue()
+        self.log = []
+        self.process = subprocess.Popen(
+            command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL,
+            universal_newlines=True, bufsize=1
+        )
+        self.reader = threading.Thread(target=self._read_output, daemon=True)
+        self.reader.start()
+    
+    def _read_output(self):
+        for line in self.process.stdout:
+            self.lines.put(line.rstrip())
+        self.process.stdout.close()
+    
+    def read(self):
+        while True:
+            try:
+                line = self.lines.get_nowait()
+            except Empty:
+                return
+            self.log.append(line)
+            del self.log[:-50]
+            yield line
+    
+    def stop(self):
+        if self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+class Supervisor:
+    """Runs queued jobs until the queue is empty (or forever with keep_alive)"""
+    
+    def __init__(self, queue, keep_alive=False):
+        self.queue = queue
+        self.keep_alive = keep_alive
+        self.workers = {}
+        self.last_heartbeat = 0.0
+    
+    def recover(self):
+        """Requeue jobs whose supervisor died; their frames on disk are kept if checkpointed"""
+        for job in self.queue.jobs():
+            if job["status"] in ACTIVE:
+                # Only stop a leftover worker we can identify; otherwise just requeue
+                if is_job_worker(job["pid"], job):
+                    try:
+                        os.kill(job["pid"], 15)
+                    except OSError:
+                        pass
+                self.queue.update(job["id"], status=QUEUED, pid=None)
+    
+    def launch(self, job):
+        """Start rendering the frames a job still lacks"""
+        frames = json.loads(job["frames"])
+        done = self.queue.done_frames(job["id"])
+        remaining = [frame for frame in frames if frame not in done]
+        # Files of frames never reported saved may be placeholders or half written
+        for frame, path in sequence_frames(job["frames_dir"]).items():
+            if frame not in done:
+                os.remove(path)
+        if not remaining:
+            self.finish_render(job)
+            return
+        
+        command = [job["blender"], "-b", job["blend"], "-Y", "-S", job["scene"]]
+        if job["threads"]:
+            command += ["-t", str(job["threads"])]
+        command += ["-f", frame_ranges(remaining)]
+        worker = Worker(job["id"], command, RUNNING)
+        self.workers[job["id"]] = worker
+        self.queue.update(job["id"], pid=worker.process.pid)
+    
+    def finish_render(self, job):
+        encode = json.loads(job["encode"]) if job["encode"] else None
+        if not encode:
+            self.queue.update(job["id"], status=DONE, finished=time.time(), pid=None, error=None)
+            return
+        command = [encode["ffmpeg"], "-y", "-loglevel", "error"] + encode_args(job["frames_dir"], encode["fps"]) + (
+            encode.get("args") or ["-c:v", "libx264", "-preset", "medium", "-crf", "18", "-pix_fmt", "yuv420p"]
+        ) + [encode["output"]]
+        worker = Worker(job["id"], command, ENCODING)
+        self.workers[job["id"]] = worker
+        self.queue.update(job["id"], status=ENCODING, pid=worker.process.pid)
+    
+    def fail(self, job, worker):
+        attempts = job["attempts"] + 1
+        status = QUEUED if attempts < job["max_attempts"] else FAILED
+        self.queue.update(job["id"], status=status, attempts=attempts, pid=None, error="\n".join(worker.log[-10:]))
+    
+    def checkpoint(self, worker):
+        for line in worker.read():
+            match = SAVED_LINE.match(line)
+            if match and worker.stage == RUNNING:
+                number = FRAME_NUMBER.search(match.group(1))
+                if number:
+                    self.queue.checkpoint(worker.job_id, int(number.group(1)))
+    
+    def step(self):
+        for job_id, worker in list(self.workers.items()):
+            self.checkpoint(worker)
+            
+            job = self.queue.job(job_id)
+            if job is None or job["status"] == CANCELLED:
+                worker.stop()
+                del self.workers[job_id]
+                continue
+            if worker.process.poll() is None:
+                continue
+            
+            worker.reader.join(timeout=5)
+            self.checkpoint(worker)  # Lines written just before exit
+            del self.workers[job_id]
+            if worker.stage == ENCODING:
+                if worker.process.returncode == 0:
+                    self.queue.update(job_id, status=DONE, finished=time.time(), pid=None, error=None)
+                else:
+                    self.fail(job, worker)
+            elif set(json.loads(job["frames"])) <= self.queue.done_frames(job_id):
+                self.finish_render(job)
+            else:
+                self.fail(job, worker)
+        
+        while len(self.workers) < self.queue.max_workers:
+            job = self.queue.claim()
+            if job is None:
+                break
+            try:
+                self.launch(job)
+            except OSError as error:
+                self.queue.update(job["id"], status=FAILED, error=str(error), pid=None)
+        
+        now = time.time()
+        if now - self.last_heartbeat > HEARTBEAT_INTERVAL:
+            self.queue.heartbeat(os.getpid())
+            self.last_heartbeat = now
+    
+    def run(self):
+        self.recover()
+        idle_since = None
+        try:
+            while True:
+                self.step()
+                if self.workers or self.queue.count(QUEUED):
+                    idle_since = None
+                elif not self.keep_alive:
+                    idle_since = idle_since or time.time()
+                    if time.time() - idle_since > IDLE_EXIT:
+                        break
+                time.sleep(POLL_INTERVAL)
+        finally:
+            for worker in self.workers.values():
+                worker.stop()
+            self.queue.db.execute("UPDATE supervisor SET pid = NULL, heartbeat = NULL")
+
+def supervisor_command(python, db_path, keep_alive=False):
+    """Command line that runs this file as the queue supervisor"""
+    return [python, __file__, db_path] + (["--keep-alive"] if keep_alive else [])
+
+def main():
+    args = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    queue = JobQueue(args[0])
+    if queue.supervisor_pid() not in (None, os.getpid()):
+        print("Another supervisor is already running", flush=True)
+        return
+    queue.heartbeat(os.getpid())
+    Supervisor(queue, keep_alive="--keep-alive" in args).run()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
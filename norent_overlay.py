@@ -0,0 +1,253 @@
+import bpy
+import numpy as np
+from mathutils import Matrix, Vector
+from bpy.types import Operator
+from bpy.props import IntProperty
+from bpy_extras.object_utils import world_to_camera_view
+
+from .render_jobs import BackgroundRenderMixin, can_run_modal, prepare_frames_dir, sequence_path, sequence_settings, format_duration
+from .render_cache import rendered_names, is_rendered
+from .utils import quality_settings
+
+# Object types that put pixels on screen
+GEOMETRY_TYPES = {'MESH', 'CURVE', 'SURFACE', 'FONT', 'META', 'GPENCIL', 'GREASEPENCIL', 'CURVES', 'POINTCLOUD', 'VOLUME'}
+BORDER_PATHS = ("render.border_min_x", "render.border_min_y", "render.border_max_x", "render.border_max_y")
+FULL_FRAME = (0.0, 0.0, 1.0, 1.0)
+
+def _expand(obj, matrix, depsgraph):
+    """(evaluated object, world matrix) pairs an object renders; None where it can't be bounded"""
+    if obj.instance_type == 'COLLECTION' and obj.instance_collection:
+        # Nested collection instances compose their matrices all the way down
+        offset = Matrix.Translation(-obj.instance_collection.instance_offset)
+        for child in obj.instance_collection.all_objects:
+            if not child.hide_render:
+                yield from _expand(child, matrix @ offset @ child.matrix_world, depsgraph)
+    elif obj.instance_type in {'VERTS', 'FACES'}:
+        yield None  # Copies follow the instancer's vertices or faces
+    elif obj.type in GEOMETRY_TYPES:
+        yield obj.evaluated_get(depsgraph), matrix
+
+def _geometry(scene, depsgraph):
+    """(evaluated object, world matrix) for everything rendered, instances expanded; None if unbounded"""
+    in_layers = rendered_names(scene)
+    for obj in scene.objects:
+        if obj.name not in in_layers or not is_rendered(obj):
+            continue
+        yield from _expand(obj, obj.matrix_world, depsgraph)
+
+def screen_rect(scene, depsgraph, margin):
+    """Normalized (min_x, min_y, max_x, max_y) covering every rendered object, or None if empty"""
+    camera = scene.camera
+    rect = None
+    for item in _geometry(scene, depsgraph):
+        if item is None:
+            return FULL_FRAME
+        obj, matrix = item
+        if len(getattr(obj, "particle_systems", ())):
+            return FULL_FRAME  # Particles reach outside the emitter's bounds
+        corners = [world_to_camera_view(scene, camera, matrix @ Vector(corner)) for corner in obj.bound_box]
+        if any(corner.z <= 0 for corner in corners):
+            return FULL_FRAME  # Straddles the camera plane; projection is unbounded
+        xs = [corner.x for corner in corners]
+        ys = [corner.y for corner in corners]
+        box = (min(xs), min(ys), max(xs), max(ys))
+        rect = box if rect is None else (
+            min(rect[0], box[0]), min(rect[1], box[1]), max(rect[2], box[2]), max(rect[3], box[3])
+        )
+    if rect is None:
+        return None
+    
+    margin_x, margin_y = margin
+    rect = (
+        max(0.0, rect[0] - margin_x), max(0.0, rect[1] - margin_y),
+        min(1.0, rect[2] + margin_x), min(1.0, rect[3] + margin_y),
+    )
+    if rect[0] >= rect[2] or rect[1] >= rect[3]:
+        return None  # Entirely off screen
+    return rect
+
+def _union(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])
+
+def frame_rects(context, frames, margin_px):
+    """Border rectangle per frame (None where nothing is on screen); the frame is restored after"""
+    scene = context.scene
+    render = scene.render
+    scale = render.resolution_percentage / 100
+    margin = (margin_px / (render.resolution_x * scale), margin_px / (render.resolution_y * scale))
+    # Motion blur smears objects towards neighbouring positions
+    offsets = (-1, 0, 1) if render.use_motion_blur else (0,)
+    
+    original = scene.frame_current
+    samples = {}
+    try:
+        for frame in sorted({f + offset for f in frames for offset in offsets}):
+            scene.frame_set(frame)
+            samples[frame] = screen_rect(scene, context.evaluated_depsgraph_get(), margin)
+    finally:
+        scene.frame_set(original)
+    
+    rects = {}
+    for frame in frames:
+        rect = None
+        for offset in offsets:
+            rect = _union(rect, samples[frame + offset])
+        rects[frame] = rect
+    return rects
+
+def coverage(rects):
+    """Average fraction of the frame inside the borders"""
+    if not rects:
+        return 0.0
+    areas = [(rect[2] - rect[0]) * (rect[3] - rect[1]) if rect else 0.0 for rect in rects.values()]
+    return sum(areas) / len(areas)
+
+def key_borders(scene, rects):
+    """Keyframe the render border per frame (constant interpolation); returns a removal callback"""
+    created_anim = scene.animation_data is None
+    if created_anim:
+        scene.animation_data_create()
+    created_action = scene.animation_data.action is None
+    if created_action:
+        scene.animation_data.action = bpy.data.actions.new(name=f"{scene.name}_NORENT_Overlay")
+    action = scene.animation_data.action
+    
+    frames = sorted(rects)
+    values = np.array([rects[frame] for frame in frames], dtype=np.float32)
+    fcurves = []
+    for axis, path in enumerate(BORDER_PATHS):
+        fcurve = action.fcurves.new(path)
+        fcurve.keyframe_points.add(len(frames))
+        co = np.empty(len(frames) * 2, dtype=np.float32)
+        co[0::2] = frames
+        co[1::2] = values[:, axis]
+        fcurve.keyframe_points.foreach_set("co", co)
+        fcurve.keyframe_points.foreach_set("interpolation", np.zeros(len(frames), dtype=np.int32))  # CONSTANT
+        fcurve.update()
+        fcurves.append(fcurve)
+    
+    def remove():
+        for fcurve in fcurves:
+            action.fcurves.remove(fcurve)
+        if created_action:
+            scene.animation_data.action = None
+            bpy.data.actions.remove(action)
+        if created_anim:
+            scene.animation_data_clear()
+    return remove
+
+def write_empty_frame(path, width, height):
+    """Fully transparent PNG for frames with nothing on screen"""
+    image = bpy.data.images.new("NORENT_Overlay_Empty", width, height, alpha=True)
+    try:
+        image.pixels.foreach_set(np.zeros(width * height * 4, dtype=np.float32))
+        image.filepath_raw = path
+        image.file_format = 'PNG'
+        image.save()
+    finally:
+        bpy.data.images.remove(image)
+
+class NORENT_OT_RenderOverlay(BackgroundRenderMixin, Operator):
+    """Render overlay layers only where they cover the frame"""
+    bl_idname = "norent.render_overlay"
+    bl_label = "Render Overlay"
+    bl_description = "Render a transparent PNG sequence, each frame limited to the region its visible objects cover"
+    
+    margin: IntProperty(
+        name="Margin (px)",
+        description="Extra pixels around the projected bounds for glow, blur and shadows",
+        default=32,
+        min=0,
+        max=512
+    )
+    
+    workers: IntProperty(
+        name="Workers",
+        description="Number of worker processes (0 = fill all cores)",
+        default=0,
+        min=0,
+        max=128
+    )
+    
+    def execute(self, context):
+        scene = context.scene
+        render = scene.render
+        if scene.camera is None:
+            self.report({'ERROR'}, "Overlay rendering needs a scene camera")
+            return {'CANCELLED'}
+        action = scene.animation_data.action if scene.animation_data else None
+        if action and any(action.fcurves.find(path) for path in BORDER_PATHS):
+            self.report({'ERROR'}, "The render border is already animated")
+            return {'CANCELLED'}
+        
+        frames = list(range(scene.frame_start, scene.frame_end + 1, max(scene.frame_step, 1)))
+        rects = frame_rects(context, frames, self.margin)
+        self.coverage = coverage(rects)
+        
+        # Frames with nothing on screen get an empty image instead of a render
+        self.frames_dir = bpy.path.abspath(render.filepath) + "_frames"
+        prepare_frames_dir(self.frames_dir)
+        scale = render.resolution_percentage / 100
+        size = (int(render.resolution_x * scale), int(render.resolution_y * scale))
+        empty = [frame for frame in frames if rects[frame] is None]
+        for frame in empty:
+            write_empty_frame(sequence_path(self.frames_dir, frame), *size)
+        rects = {frame: rect for frame, rect in rects.items() if rect is not None}
+        self.skipped = len(empty)
+        
+        # Border without crop keeps full-size frames, transparent outside the border
+        saved = (render.use_border, render.use_crop_to_border, render.film_transparent)
+        render.use_border = True
+        render.use_crop_to_border = False
+        render.film_transparent = True
+        restore_tier = quality_settings(scene)
+        remove_keys = key_borders(scene, rects) if rects else None
+        try:
+            if can_run_modal(context):
+                return self.start_parallel_render(context, "Overlay", self.workers, frames=sorted(rects))
+            
+            restore = sequence_settings(scene, self.frames_dir)
+            try:
+                for frame in sorted(rects):
+                    scene.frame_set(frame)
+                    bpy.ops.render.render(write_still=True)
+            finally:
+                restore()
+        finally:
+            if remove_keys:
+                remove_keys()
+            restore_tier()
+            render.use_border, render.use_crop_to_border, render.film_transparent = saved
+        self.report_overlay(len(rects))
+        return {'FINISHED'}
+    
+    def report_overlay(self, rendered, elapsed=None):
+        text = f"Overlay: {rendered} frames rendered over {self.coverage * 100:.0f}% of the frame on average"
+        if self.skipped:
+            text += f", {self.skipped} empty frames written without rendering"
+        if elapsed is not None:
+            text += f" in {format_duration(elapsed)}"
+        self.report({'INFO'}, text)
+    
+    def on_render_finished(self, context, job):
+        self.report_overlay(job.frames_done, job.elapsed)
+    
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+# Registration
+classes = [
+    NORENT_OT_RenderOverlay,
+]
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
\ No newline at end of file
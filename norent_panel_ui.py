@@ -2,6 +2,12 @@ import bpy
 from bpy.types import Panel, UIList, Operator
 from bpy.props import StringProperty, IntProperty
 
+from . import transform_cache
+from . import flipbook
+from . import telemetry
+from . import render_queue
+from . import template_catalog
+
 class NORENT_UL_MotionLayers(UIList):
     """Custom UIList for motion layers (AE-style layer stack)"""
     
@@ -30,6 +36,39 @@ class NORENT_UL_MotionLayers(UIList):
             layout.alignment = 'CENTER'
             layout.label(text="", icon='OBJECT_DATA')
 
+class NORENT_UL_Shots(UIList):
+    """Shot list (one row per cut)"""
+    
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname):
+        row = layout.row(align=True)
+        row.prop(item, "frame", text="", emboss=False)
+        row.prop(item, "camera", text="", icon='CAMERA_DATA')
+
+class NORENT_UL_Templates(UIList):
+    """Template catalog, filtered by name and preset from the index"""
+    
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname):
+        icon_value = template_catalog.thumbnail_icon(item)
+        row = layout.row(align=True)
+        if icon_value:
+            row.label(text=item.name, icon_value=icon_value)
+        else:
+            row.label(text=item.name, icon='FILE_BLEND')
+        details = item.preset.title() if item.preset else ""
+        if item.frame_end:
+            details += f" {item.frame_start}-{item.frame_end}"
+        row.label(text=details.strip())
+    
+    def filter_items(self, context, data, propname):
+        items = getattr(data, propname)
+        flags = bpy.types.UI_UL_list.filter_items_by_name(self.filter_name, self.bitflag_filter_item, items, "name")
+        if not flags:
+            flags = [self.bitflag_filter_item] * len(items)
+        preset = context.window_manager.norent_template_filter
+        if preset != 'ALL':
+            flags = [flag if item.preset == preset else 0 for flag, item in zip(flags, items)]
+        return flags, []
+
 class NORENT_PT_MainPanel(Panel):
     """Main NORENT Motion panel"""
     bl_label = "NORENT Motion"
@@ -155,6 +194,8 @@ class NORENT_PT_CameraRigs(Panel):
         col.operator("norent.camera_add_basic", text="Basic Rig", icon='CAMERA_DATA')
         col.operator("norent.camera_add_handheld", text="Handheld", icon='FORCE_TURBULENCE')
         col.operator("norent.camera_add_dolly", text="Dolly Track", icon='CURVE_PATH')
+        col.operator("norent.camera_spawn_rigs", text="Spawn Multiple", icon='OUTLINER_OB_CAMERA')
+        col.operator("norent.audit_drivers", text="Audit Drivers", icon='DRIVER')
         
         # Camera moves
         if context.scene.camera:
@@ -165,7 +206,81 @@ class NORENT_PT_CameraRigs(Panel):
             col = box.column(align=True)
             col.operator("norent.camera_push_in", text="Push In")
             col.operator("norent.camera_rotate", text="Rotate Around")
+            col.operator("norent.camera_orbit_bake", text="Bake Orbit")
             col.operator("norent.camera_shake", text="Add Shake")
+        
+        # Scrub cache
+        layout.separator()
+        box = layout.box()
+        box.label(text="SCRUB CACHE", icon='PREVIEW_RANGE')
+        
+        settings = context.scene.norent_transform_cache
+        box.label(text=transform_cache.cache_status(context.scene))
+        row = box.row(align=True)
+        row.operator("norent.transform_cache_bake", text="Bake", icon='REC')
+        row.operator("norent.transform_cache_clear", text="Clear", icon='X')
+        box.prop(settings, "use_cache")
+        box.prop(settings, "mmap_threshold")
+
+class NORENT_PT_Shots(Panel):
+    """Multi-camera shot list panel"""
+    bl_label = "Shot List"
+    bl_idname = "NORENT_PT_shots"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'NORENT'
+    bl_parent_id = "NORENT_PT_camera"
+    
+    def draw(self, context):
+        layout = self.layout
+        shot_list = context.scene.norent_shots
+        
+        row = layout.row()
+        row.template_list("NORENT_UL_Shots", "", shot_list, "shots", shot_list, "active_index", rows=4)
+        
+        col = row.column(align=True)
+        col.operator("norent.shot_add", text="", icon='ADD')
+        col.operator("norent.shot_remove", text="", icon='REMOVE')
+        
+        col = layout.column(align=True)
+        col.prop(shot_list, "use_shot_switching")
+        col.prop(shot_list, "disable_inactive_rigs")
+        
+        row = layout.row(align=True)
+        row.operator("norent.shots_from_markers", text="From Markers", icon='MARKER')
+        row.operator("norent.shots_to_markers", text="To Markers", icon='MARKER_HLT')
+
+class NORENT_PT_Templates(Panel):
+    """Template catalog panel"""
+    bl_label = "Templates"
+    bl_idname = "NORENT_PT_templates"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'NORENT'
+    bl_parent_id = "NORENT_PT_main"
+    
+    def draw(self, context):
+        layout = self.layout
+        wm = context.window_manager
+        
+        row = layout.row(align=True)
+        row.prop(wm, "norent_template_filter", text="")
+        row.operator("norent.template_catalog_refresh", text="", icon='FILE_REFRESH')
+        layout.template_list("NORENT_UL_Templates", "", wm, "norent_templates", wm, "norent_template_index", rows=5)
+        
+        if 0 <= wm.norent_template_index < len(wm.norent_templates):
+            item = wm.norent_templates[wm.norent_template_index]
+            layout.label(text=f"{item.objects} objects, {item.materials} materials", icon='INFO')
+            row = layout.row(align=True)
+            op = row.operator("norent.load_template", text="Append", icon='APPEND_BLEND')
+            op.filepath = item.filepath
+            op.mode = 'APPEND'
+            op = row.operator("norent.load_template", text="Link Instance", icon='LINK_BLEND')
+            op.filepath = item.filepath
+            op.mode = 'LINK'
+        layout.operator("norent.template_make_editable", text="Make Instance Editable", icon='LIBRARY_DATA_OVERRIDE')
+        layout.operator("norent.deduplicate", text="Merge Duplicate Materials", icon='MATERIAL')
+        layout.operator("norent.save_template", text="Save as Template", icon='FILE_TICK')
 
 class NORENT_PT_Render(Panel):
     """Render panel"""
@@ -186,6 +301,7 @@ class NORENT_PT_Render(Panel):
         
         col = box.column(align=True)
         col.prop(scene.norent, "render_preset", text="")
+        col.row(align=True).prop(scene.norent, "quality_tier", expand=True)
         
         # Render info
         render = scene.render
@@ -198,6 +314,11 @@ class NORENT_PT_Render(Panel):
         col.scale_y = 1.5
         col.operator("norent.render_still", text="Render Frame", icon='RENDER_STILL')
         col.operator("norent.render_animation", text="Render Animation", icon='RENDER_ANIMATION')
+        col.operator("norent.render_animation", text="Render Parallel", icon='MOD_ARRAY').parallel = True
+        col.operator("norent.render_animation", text="Render Changed Frames", icon='FILE_REFRESH').incremental = True
+        col.operator("norent.render_overlay", text="Render Overlay", icon='IMAGE_RGB_ALPHA')
+        col.operator("norent.warm_shaders", text="Warm Up Shaders", icon='SHADING_RENDERED')
+        col.operator("norent.quick_preview", text="Preview in Time Budget", icon='TIME').use_budget = True
         
         # Export options
         layout.separator()
@@ -207,6 +328,63 @@ class NORENT_PT_Render(Panel):
         col = box.column(align=True)
         col.operator("norent.export_mp4", text="Export MP4", icon='FILE_MOVIE')
         col.operator("norent.export_gif", text="Export GIF", icon='FILE_IMAGE')
+        col.operator("norent.deliver", text="Deliver All Formats", icon='PACKAGE')
+        col.operator("norent.deliver_aspects", text="Deliver All Aspects", icon='SELECT_SUBTRACT')
+        col.operator("norent.template_batch", text="Template Batch", icon='SPREADSHEET')
+        
+        # RAM flipbook
+        layout.separator()
+        box = layout.box()
+        box.label(text="FLIPBOOK", icon='IMAGE_BACKGROUND')
+        
+        settings = context.scene.norent_flipbook
+        box.label(text=flipbook.flipbook_status(context.scene))
+        row = box.row(align=True)
+        row.operator("norent.flipbook_capture", text="Capture", icon='REC')
+        row.operator("norent.flipbook_play", text="Play", icon='PLAY')
+        row.operator("norent.flipbook_clear", text="", icon='X')
+        box.prop(settings, "scale")
+        box.prop(settings, "memory_limit")
+        box.prop(settings, "compress")
+        
+        # Overnight render queue
+        layout.separator()
+        box = layout.box()
+        row = box.row()
+        row.label(text="RENDER QUEUE", icon='SEQ_STRIP_DUPLICATE')
+        row.operator("norent.queue_render", text="Queue", icon='ADD')
+        render_queue.draw_queue(box)
+        
+        # Render telemetry
+        layout.separator()
+        box = layout.box()
+        box.label(text="TELEMETRY", icon='SORTTIME')
+        
+        settings = context.scene.norent_telemetry
+        row = box.row(align=True)
+        row.prop(settings, "enabled")
+        row.operator("norent.telemetry_clear", text="", icon='TRASH')
+        box.prop(settings, "outlier_threshold")
+        
+        report = telemetry.telemetry_report(context.scene)
+        if report is None:
+            box.label(text="No telemetry recorded yet")
+            return
+        box.label(text=f"{report['frames']} frames, {report['wall']:.0f}s total, "
+                       f"depsgraph {report['depsgraph']:.1f}s, peak {report['peak_mb']:.0f} MB")
+        
+        # Frame time histogram as text bars
+        largest = max(count for _, _, count in report["histogram"])
+        col = box.column(align=True)
+        for low, high, count in report["histogram"]:
+            bar = "█" * round(20 * count / largest) if count else ""
+            col.label(text=f"{low:6.2f}-{high:6.2f}s {bar} {count}")
+        
+        for record, causes in report["outliers"][:8]:
+            text = f"Frame {record['frame']}: {record['wall']:.2f}s"
+            if causes:
+                text += " after " + ", ".join(causes[:3])
+            box.label(text=text, icon='ERROR')
 
 # Layer management operators
 class NORENT_OT_LayerAdd(Operator):
@@ -254,10 +432,14 @@ class NORENT_OT_LayerDown(Operator):
 # Registration
 classes = [
     NORENT_UL_MotionLayers,
+    NORENT_UL_Shots,
+    NORENT_UL_Templates,
     NORENT_PT_MainPanel,
     NORENT_PT_LayerStack,
     NORENT_PT_TextFX,
     NORENT_PT_CameraRigs,
+    NORENT_PT_Shots,
+    NORENT_PT_Templates,
     NORENT_PT_Render,
     NORENT_OT_LayerAdd,
     NORENT_OT_LayerRemove,
@@ -0,0 +1,166 @@
+import bpy
+import math
+import time
+
+# Candidate settings, best quality first
+SCALES = (1.0, 0.75, 0.5, 0.35, 0.25)
+STEPS = (1, 2, 3, 4, 6)
+SAMPLE_FRACTIONS = (1.0, 0.5, 0.25, 0.125)
+
+# Resolution and sample fraction used for probe renders
+PROBE_SCALES = (0.25, 0.5)
+PROBE_SAMPLES = 0.25
+
+# Seconds to launch a background Blender and load the snapshot
+STARTUP_ESTIMATE = 3.0
+
+# Custom property holding the running actual/predicted ratio
+CALIBRATION_KEY = "norent_preview_calibration"
+
+def sample_property(scene):
+    """(struct, attribute) holding the render sample count for the scene's engine"""
+    engine = scene.render.engine
+    if engine == 'CYCLES' and hasattr(scene, "cycles"):
+        return scene.cycles, "samples"
+    if engine.startswith('BLENDER_EEVEE'):
+        return scene.eevee, "taa_render_samples"
+    return None, None
+
+def preview_settings(scene, scale, step=None, sample_fraction=1.0, simplify=False):
+    """Apply preview settings relative to the current ones; returns a restore callback"""
+    render = scene.render
+    struct, attribute = sample_property(scene)
+    saved = (render.resolution_percentage, scene.frame_step, render.use_simplify, render.simplify_subdivision_render)
+    saved_samples = getattr(struct, attribute) if struct else None
+    
+    render.resolution_percentage = max(1, round(saved[0] * scale))
+    if step:
+        scene.frame_step = step
+    if struct:
+        setattr(struct, attribute, max(1, round(saved_samples * sample_fraction)))
+    if simplify:
+        render.use_simplify = True
+        render.simplify_subdivision_render = min(render.simplify_subdivision_render, 1)
+    
+    def restore():
+        render.resolution_percentage, scene.frame_step, render.use_simplify, render.simplify_subdivision_render = saved
+        if struct:
+            setattr(struct, attribute, saved_samples)
+    return restore
+
+def timed_render(scene, frame, opengl=False, **settings):
+    """Seconds to render one frame with the given preview settings"""
+    restore = preview_settings(scene, **settings)
+    scene.frame_set(frame)
+    try:
+        start = time.perf_counter()
+        if opengl:
+            bpy.ops.render.opengl()
+        else:
+            bpy.ops.render.render()
+        return time.perf_counter() - start
+    finally:
+        restore()
+
+class PreviewModel:
+    """Per-frame render cost fitted from a handful of probe renders.
+    
+    cost = (fixed + per_pixel * pixels * sample_fraction) * frame_variation,
+    times the simplify ratio when simplify is on. The first probe also
+    compiles shaders and loads textures, so it only counts as one-time cost.
+    """
+    
+    def __init__(self, scene, use_opengl=True):
+        self.scene = scene
+        original = scene.frame_current
+        frames = (scene.frame_start, (scene.frame_start + scene.frame_end) // 2, scene.frame_end)
+        start = time.perf_counter()
+        try:
+            warm_up = timed_render(scene, frames[0], scale=PROBE_SCALES[0], sample_fraction=PROBE_SAMPLES)
+            low, high = (timed_render(scene, frames[0], scale=scale, sample_fraction=PROBE_SAMPLES) for scale in PROBE_SCALES)
+            simplified = timed_render(scene, frames[0], scale=PROBE_SCALES[0], sample_fraction=PROBE_SAMPLES, simplify=True)
+            others = [timed_render(scene, frame, scale=PROBE_SCALES[0], sample_fraction=PROBE_SAMPLES) for frame in frames[1:]]
+            self.opengl_time = None
+            if use_opengl:
+                try:
+                    self.opengl_time = timed_render(scene, frames[0], opengl=True, scale=1.0)
+                except RuntimeError:
+                    pass  # No viewport to draw with
+        finally:
+            scene.frame_set(original)
+        self.probe_time = time.perf_counter() - start
+        
+        low_pixels, high_pixels = (self.pixels(scale) for scale in PROBE_SCALES)
+        self.per_pixel = max(0.0, (high - low) / ((high_pixels - low_pixels) * PROBE_SAMPLES))
+        self.fixed = max(0.0, low - self.per_pixel * low_pixels * PROBE_SAMPLES)
+        self.warm_up = max(0.0, warm_up - low)
+        self.variation = (low + sum(others)) / (1 + len(others)) / low if low > 0 else 1.0
+        self.simplify_ratio = min(1.0, simplified / low) if low > 0 else 1.0
+        self.calibration = scene.get(CALIBRATION_KEY, 1.0)
+    
+    def pixels(self, scale):
+        render = self.scene.render
+        percentage = render.resolution_percentage / 100 * scale
+        return render.resolution_x * render.resolution_y * percentage * percentage
+    
+    def frame_count(self, step):
+        return len(range(self.scene.frame_start, self.scene.frame_end + 1, step))
+    
+    def frame_cost(self, scale, sample_fraction, simplify):
+        cost = (self.fixed + self.per_pixel * self.pixels(scale) * sample_fraction) * self.variation
+        return cost * (self.simplify_ratio if simplify else 1.0)
+    
+    def predict(self, plan, background=False):
+        """Seconds to render the preview with plan"""
+        if plan["opengl"]:
+            total = self.opengl_time * self.frame_count(plan["step"])
+        else:
+            total = self.frame_cost(plan["scale"], plan["samples"], plan["simplify"]) * self.frame_count(plan["step"])
+            total += self.warm_up + (STARTUP_ESTIMATE if background else 0.0)
+        return total * self.calibration
+
+def plan_quality(plan):
+    """Higher is better: resolution matters most, then smoothness, then noise"""
+    return (
+        2.0 * math.log(plan["scale"]) - 1.5 * math.log(plan["step"])
+        + 0.5 * math.log(plan["samples"]) - (0.3 if plan["simplify"] else 0.0)
+    )
+
+def choose_plan(model, budget, background=False):
+    """Best-looking settings predicted to finish within budget seconds"""
+    has_samples = sample_property(model.scene)[0] is not None
+    candidates = [
+        {"scale": scale, "step": step, "samples": samples, "simplify": simplify, "opengl": False}
+        for scale in SCALES for step in STEPS
+        for samples in (SAMPLE_FRACTIONS if has_samples else (1.0,))
+        for simplify in (False, True)
+    ]
+    fitting = [plan for plan in candidates if model.predict(plan, background) <= budget]
+    if fitting:
+        best = max(fitting, key=plan_quality)
+    else:
+        best = min(candidates, key=lambda plan: model.predict(plan, background))
+    
+    # Viewport render is enough when the engine would need heavy compromises
+    if model.opengl_time is not None:
+        degraded = not fitting or best["scale"] < 0.5 or best["step"] > 2
+        if model.scene.render.engine == 'BLENDER_WORKBENCH' or degraded:
+            for step in STEPS:
+                plan = {"scale": 1.0, "step": step, "samples": 1.0, "simplify": False, "opengl": True}
+                if model.predict(plan) <= budget:
+                    return plan
+    return best
+
+def describe_plan(plan):
+    if plan["opengl"]:
+        return f"viewport render, every {plan['step']} frame(s)"
+    text = f"{plan['scale'] * 100:.0f}% resolution, every {plan['step']} frame(s), {plan['samples'] * 100:.0f}% samples"
+    return text + (", simplify" if plan["simplify"] else "")
+
+def record_actual(scene, predicted, actual):
+    """Blend the latest actual/predicted ratio into the scene's calibration"""
+    if predicted <= 0 or actual <= 0:
+        return
+    previous = scene.get(CALIBRATION_KEY, 1.0)
+    ratio = previous * actual / predicted
+    scene[CALIBRATION_KEY] = min(10.0, max(0.1, 0.5 * previous + 0.5 * ratio))
\ No newline at end of file
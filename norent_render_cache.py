@@ -0,0 +1,300 @@
+import bpy
+import math
+import os
+import time
+
+from .fingerprint import Fingerprinter, hash_values
+from .render_jobs import sequence_path, link_file
+
+# Cached frames live next to the renders, one PNG per content key
+CACHE_DIR_NAME = "NORENT_Frame_Cache"
+CACHE_EXTENSION = ".png"
+
+def object_ids(obj):
+    """Datablocks whose animation only matters while obj is rendered"""
+    ids = [obj]
+    if obj.data is not None:
+        ids.append(obj.data)
+        shape_keys = getattr(obj.data, "shape_keys", None)
+        if shape_keys:
+            ids.append(shape_keys)
+    for slot in obj.material_slots:
+        if slot.material:
+            ids.append(slot.material)
+            if slot.material.node_tree:
+                ids.append(slot.material.node_tree)
+    return ids
+
+def animated_paths(id_block):
+    """(data_path, array_index) of every F-curve and driver on an ID"""
+    anim = getattr(id_block, "animation_data", None)
+    if not anim:
+        return []
+    fcurves = list(anim.drivers)
+    if anim.action:
+        fcurves.extend(getattr(anim.action, "fcurves", ()))
+    return sorted({(fcurve.data_path, fcurve.array_index) for fcurve in fcurves})
+
+def resolve_value(id_block, data_path, index):
+    try:
+        value = id_block.path_resolve(data_path)
+    except ValueError:
+        return None
+    if hasattr(value, "__len__") and not isinstance(value, str):
+        return value[index] if index < len(value) else tuple(value)
+    return value
+
+def rendered_names(scene):
+    """Objects present in at least one enabled view layer"""
+    return {obj.name for view_layer in scene.view_layers if view_layer.use for obj in view_layer.objects}
+
+def is_rendered(obj):
+    if obj.hide_render:
+        return False
+    return not obj.users_collection or not all(collection.hide_render for collection in obj.users_collection)
+
+# Modifiers whose result depends on the frame itself, not just on animated values
+TIME_MODIFIERS = {'CLOTH', 'SOFT_BODY', 'FLUID', 'DYNAMIC_PAINT', 'PARTICLE_SYSTEM', 'OCEAN', 'EXPLODE', 'WAVE', 'BUILD'}
+TIME_NODES = {
+    'GeometryNodeInputSceneTime', 'GeometryNodeSimulationInput', 'GeometryNodeSimulationOutput',
+    'CompositorNodeTime', 'CompositorNodeMovieClip', 'CompositorNodeSceneTime',
+}
+
+def node_tree_time_dependent(tree, seen=None):
+    """True if a node tree reads the frame or plays an image sequence or movie"""
+    if tree is None:
+        return False
+    seen = seen if seen is not None else set()
+    if tree.name in seen:
+        return False
+    seen.add(tree.name)
+    for node in tree.nodes:
+        if node.bl_idname in TIME_NODES:
+            return True
+        image = getattr(node, "image", None)
+        if image is not None and image.source in {'SEQUENCE', 'MOVIE'}:
+            return True
+        if getattr(node, "node_tree", None) and node_tree_time_dependent(node.node_tree, seen):
+            return True
+    return False
+
+def object_time_dependent(obj):
+    """Simulations, frame-driven modifiers and animated textures never hold"""
+    if obj.rigid_body or len(getattr(obj, "particle_systems", ())):
+        return True
+    for modifier in obj.modifiers:
+        if modifier.type in TIME_MODIFIERS:
+            return True
+        if modifier.type == 'NODES' and node_tree_time_dependent(modifier.node_group):
+            return True
+    return any(slot.material and node_tree_time_dependent(slot.material.node_tree) for slot in obj.material_slots)
+
+def scene_time_dependent(scene):
+    """Scene-wide reasons every frame renders differently"""
+    if scene.render.use_stamp:
+        return True  # Burned-in frame numbers and timecodes
+    cycles = getattr(scene, "cycles", None)
+    if scene.render.engine == 'CYCLES' and cycles and cycles.use_animated_seed:
+        return True
+    if scene.use_nodes and node_tree_time_dependent(scene.node_tree):
+        return True
+    return bool(scene.world and node_tree_time_dependent(scene.world.node_tree))
+
+def foreign_frame_handlers():
+    """Frame change handlers from other add-ons or scripts, which may edit data per frame"""
+    package = __name__.rpartition(".")[0]
+    handlers = bpy.app.handlers.frame_change_pre[:] + bpy.app.handlers.frame_change_post[:]
+    return [h for h in handlers if not getattr(h, "__module__", "").startswith(package)]
+
+def settings_digest(scene, fingerprinter):
+    """Digest of everything outside the objects that shapes every frame"""
+    values = [bpy.app.version_string]
+    structs = [scene.render, scene.view_settings, scene.display_settings, scene.eevee, getattr(scene, "cycles", None)]
+    values.extend(fingerprinter.struct_digest(struct) for struct in structs if struct is not None)
+    values.extend(fingerprinter.struct_digest(view_layer, values_only=True) for view_layer in scene.view_layers)
+    values.append(fingerprinter.digest(scene.world))
+    values.append(fingerprinter.digest(scene.node_tree) if scene.use_nodes else "no_compositing")
+    return hash_values(values)
+
+class FrameSampler:
+    """Content keys for individual frames of a scene.
+    
+    A frame's key covers the render settings, the frame number, and for
+    every object rendered on that frame its content hash, world matrix and
+    animated values. Objects hidden on a frame don't affect its key, so
+    editing a lower third only invalidates the frames it appears on.
+    """
+    
+    def __init__(self, scene):
+        self.scene = scene
+        self.fingerprinter = Fingerprinter()
+        # Handlers we don't know may rewrite data on frame change; rehash per frame
+        self.rehash = bool(foreign_frame_handlers())
+        self.objects = sorted(scene.objects, key=lambda obj: obj.name)
+        self.object_paths = {
+            obj.name: [(id_block, path, index) for id_block in object_ids(obj) for path, index in animated_paths(id_block)]
+            for obj in self.objects
+        }
+        global_ids = [scene, scene.world, scene.node_tree]
+        self.global_paths = [
+            (id_block, path, index)
+            for id_block in global_ids if id_block is not None
+            for path, index in animated_paths(id_block)
+        ]
+        self.time_dependent = scene_time_dependent(scene)
+        self.time_objects = {obj.name for obj in self.objects if object_time_dependent(obj)}
+        self.static = None
+        self.settings = None
+    
+    def prepare(self):
+        """Hash static content at a fixed frame so keys don't depend on the current frame"""
+        self.scene.frame_set(self.scene.frame_start)
+        self.fingerprinter.reset()
+        self.settings = settings_digest(self.scene, self.fingerprinter)
+        self.static = {obj.name: self.fingerprinter.digest(obj) for obj in self.objects}
+    
+    def sample(self, frame):
+        """Flat list of values that determine how frame renders"""
+        if self.static is None:
+            self.prepare()
+        scene = self.scene
+        scene.frame_set(frame)
+        if self.rehash:
+            self.fingerprinter.reset()
+        
+        values = [self.settings, scene.camera.name if scene.camera else None]
+        if self.time_dependent:
+            values.append(frame)
+        values.extend(resolve_value(id_block, path, index) for id_block, path, index in self.global_paths)
+        in_layers = rendered_names(scene)
+        for obj in self.objects:
+            if obj.name not in in_layers or not is_rendered(obj):
+                continue
+            static = self.fingerprinter.digest(obj) if self.rehash else self.static[obj.name]
+            values.extend((obj.name, static, obj.matrix_world))
+            if obj.name in self.time_objects:
+                values.append(frame)
+            values.extend(resolve_value(id_block, path, index) for id_block, path, index in self.object_paths[obj.name])
+        return values
+
+def blur_margin(scene):
+    """Frames either side that bleed into a frame through motion blur"""
+    if not scene.render.use_motion_blur:
+        return 0
+    return max(1, math.ceil(scene.render.motion_blur_shutter))
+
+def analyze_frames(scene, frames):
+    """Content key per frame and runs of consecutive frames that render identically.
+    
+    One sampling pass serves both: the key adds the frame number to the
+    sampled values, the hold signature doesn't. With motion blur a frame's
+    signature also spans its shutter, so the frames at a hold's edges,
+    which blur into the motion around them, stay separate. The current
+    frame is restored afterwards.
+    """
+    frames = list(frames)
+    sampler = FrameSampler(scene)
+    margin = blur_margin(scene)
+    original = scene.frame_current
+    samples = {}
+    try:
+        for frame in sorted({f + offset for f in frames for offset in range(-margin, margin + 1)}):
+            samples[frame] = hash_values(sampler.sample(frame))
+    finally:
+        scene.frame_set(original)
+    
+    keys = {frame: hash_values([frame, samples[frame]]) for frame in frames}
+    groups = []
+    previous = None
+    for frame in frames:
+        signature = tuple(samples[frame + offset] for offset in range(-margin, margin + 1))
+        if groups and signature == previous:
+            groups[-1].append(frame)
+        else:
+            groups.append([frame])
+        previous = signature
+    return keys, groups
+
+def frame_keys(scene, frames):
+    """Content key per frame; the current frame is restored afterwards"""
+    return analyze_frames(scene, frames)[0]
+
+def plan_holds(groups, ready=()):
+    """Frames to render plus hold copies (rendered frame -> frames linked from it).
+    
+    Frames in ready already exist (e.g. cache hits); a hold containing one
+    is filled from it without rendering anything.
+    """
+    ready = set(ready)
+    to_render = []
+    holds = {}
+    for group in groups:
+        missing = [frame for frame in group if frame not in ready]
+        if not missing:
+            continue
+        source = next((frame for frame in group if frame in ready), None)
+        if source is None:
+            source = missing.pop(0)
+            to_render.append(source)
+        if missing:
+            holds[source] = missing
+    return to_render, holds
+
+def held_count(holds):
+    return sum(len(copies) for copies in holds.values())
+
+def restore_hits(keys, cache_dir, frames_dir):
+    """Link cached frames into the sequence directory; returns (hits, misses)"""
+    hits, misses = [], []
+    now = time.time()
+    for frame, key in sorted(keys.items()):
+        cached = os.path.join(cache_dir, key + CACHE_EXTENSION)
+        if os.path.exists(cached):
+            link_file(cached, sequence_path(frames_dir, frame))
+            os.utime(cached, (now, now))  # Most recently used
+            hits.append(frame)
+        else:
+            misses.append(frame)
+    return hits, misses
+
+def store_frames(keys, frames, cache_dir, frames_dir):
+    """Add freshly rendered frames to the cache"""
+    stored = 0
+    for frame in frames:
+        rendered = sequence_path(frames_dir, frame)
+        cached = os.path.join(cache_dir, keys[frame] + CACHE_EXTENSION)
+        if os.path.exists(rendered) and not os.path.exists(cached):
+            link_file(rendered, cached)
+            stored += 1
+    return stored
+
+def evict(cache_dir, limit_bytes, keep=()):
+    """Drop least recently used frames until the cache fits; returns (count, bytes) removed"""
+    entries = []
+    for name in os.listdir(cache_dir):
+        if name.endswith(CACHE_EXTENSION):
+            stat = os.stat(os.path.join(cache_dir, name))
+            entries.append((stat.st_mtime, stat.st_size, name))
+    total = sum(size for _, size, _ in entries)
+    keep = {key + CACHE_EXTENSION for key in keep}
+    removed = removed_bytes = 0
+    for _, size, name in sorted(entries):
+        if total <= limit_bytes:
+            break
+        if name in keep:
+            continue
+        os.remove(os.path.join(cache_dir, name))
+        total -= size
+        removed += 1
+        removed_bytes += size
+    return removed, removed_bytes
+
+def cache_report(stats):
+    total = stats["hits"] + stats["misses"]
+    rate = stats["hits"] / total * 100 if total else 0.0
+    text = f"{stats['hits']}/{total} frames from cache ({rate:.0f}%), {stats['misses']} missed"
+    if stats.get("held"):
+        text += f" ({stats['held']} of them linked from holds)"
+    if stats.get("evicted"):
+        text += f", {stats['evicted']} evicted"
+    return text + f" | hashing {stats['hash_time']:.1f}s"
\ No newline at end of file
@@ -0,0 +1,679 @@
+import bpy
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from queue import Queue, Empty
+
+from . import frame_pipe
+from . import template_batch
+
+# Lines printed by a background Blender render
+FRAME_LINE = re.compile(r"^Fra:(\d+)")
+SAVED_LINE = re.compile(r"^Saved: '(.+)'")
+APPEND_LINE = re.compile(r"^Append frame (\d+)")
+
+# Scene custom property carried by snapshots: directory of the file they were saved from
+SOURCE_DIR_KEY = "norent_source_dir"
+
+def source_settings():
+    """Record the open file's directory on every scene before a snapshot; returns a restore callback"""
+    directory = bpy.path.abspath("//")
+    marked = []
+    for scene in bpy.data.scenes:
+        if SOURCE_DIR_KEY not in scene:
+            scene[SOURCE_DIR_KEY] = directory
+            marked.append(scene)
+    
+    def restore():
+        for scene in marked:
+            del scene[SOURCE_DIR_KEY]
+    return restore
+
+def source_dir(scene):
+    """Directory of the original .blend, also inside a snapshot ("" while unsaved)"""
+    return scene.get(SOURCE_DIR_KEY, bpy.path.abspath("//"))
+
+def save_snapshot(tag):
+    """Save an isolated copy of the current file for a background job"""
+    snapshot_dir = tempfile.mkdtemp(prefix="norent_")
+    snapshot_path = os.path.join(snapshot_dir, f"{bpy.path.clean_name(tag)}.blend")
+    # copy=True keeps the open file untouched; relative paths are remapped
+    restore = source_settings()
+    try:
+        bpy.ops.wm.save_as_mainfile(filepath=snapshot_path, copy=True)
+    finally:
+        restore()
+    return snapshot_path
+
+def blender_command(blend_path, args):
+    """Command line for a headless Blender child process"""
+    allow_scripts = bpy.context.preferences.filepaths.use_scripts_auto_execute
+    return [bpy.app.binary_path, "-b", blend_path, "-y" if allow_scripts else "-Y"] + list(args)
+
+class RenderJob:
+    """A headless Blender process whose output is parsed for progress"""
+    
+    def __init__(self, command, total_frames, snapshot=None, label="Render"):
+        self.command = command
+        self.total_frames = max(total_frames, 1)
+        self.snapshot = snapshot
+        self.label = label
+        self.frames_done = 0
+        self.current_frame = None
+        self.saved_files = []
+        self.stream_stats = None
+        self.lines = Queue()
+        self.process = None
+        self.start_time = None
+        self.end_time = None
+        self.log = []
+    
+    def start(self):
+        self.start_time = time.perf_counter()
+        self.process = subprocess.Popen(
+            self.command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            stdin=subprocess.DEVNULL,
+            universal_newlines=True,
+            bufsize=1
+        )
+        reader = threading.Thread(target=self._read_output, daemon=True)
+        reader.start()
+        return self
+    
+    def _read_output(self):
+        for line in self.process.stdout:
+            self.lines.put(line.rstrip())
+        self.process.stdout.close()
+    
+    def poll(self):
+        """Consume new output; returns True while the process is running"""
+        while True:
+            try:
+                line = self.lines.get_nowait()
+            except Empty:
+                break
+            self.parse_line(line)
+        
+        running = self.process.poll() is None
+        if not running and self.end_time is None:
+            self.end_time = time.perf_counter()
+        return running
+    
+    def parse_line(self, line):
+        self.log.append(line)
+        del self.log[:-200]
+        
+        match = FRAME_LINE.match(line)
+        if match:
+            self.current_frame = int(match.group(1))
+            return
+        match = SAVED_LINE.match(line)
+        if match:
+            self.saved_files.append(match.group(1))
+            self.frames_done += 1
+            return
+        if APPEND_LINE.match(line):
+            self.frames_done += 1
+            return
+        if line.startswith(frame_pipe.STATS_PREFIX):
+            self.stream_stats = json.loads(line[len(frame_pipe.STATS_PREFIX):])
+    
+    @property
+    def succeeded(self):
+        return self.process is not None and self.process.returncode == 0
+    
+    @property
+    def elapsed(self):
+        if self.start_time is None:
+            return 0.0
+        return (self.end_time or time.perf_counter()) - self.start_time
+    
+    @property
+    def eta(self):
+        """Seconds left, extrapolated from the frames done so far"""
+        if not self.frames_done:
+            return None
+        return self.elapsed / self.frames_done * (self.total_frames - self.frames_done)
+    
+    def status_text(self):
+        text = f"NORENT {self.label}: {self.frames_done}/{self.total_frames} frames"
+        if self.eta is not None:
+            text += f" | ETA {format_duration(self.eta)}"
+        return text + " | Esc to cancel"
+    
+    def cancel(self):
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+    
+    def cleanup(self):
+        if self.snapshot:
+            shutil.rmtree(os.path.dirname(self.snapshot), ignore_errors=True)
+            self.snapshot = None
+
+def format_duration(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h{minutes:02d}m"
+    return f"{minutes}:{seconds:02d}"
+
+def frame_count(scene):
+    return len(range(scene.frame_start, scene.frame_end + 1, max(scene.frame_step, 1)))
+
+def stream_scene(scene, output_path, codec_args=None):
+    """Foreground render of the frame range piped straight into ffmpeg"""
+    frames = range(scene.frame_start, scene.frame_end + 1, max(scene.frame_step, 1))
+    fps = scene.render.fps / scene.render.fps_base
+    restore = frame_pipe.viewer_setup(scene)
+    try:
+        return frame_pipe.stream_render(scene, output_path, frames, fps, find_ffmpeg(), codec_args)
+    finally:
+        restore()
+
+def can_run_modal(context):
+    """Background jobs need a window to report progress in"""
+    return not bpy.app.background and context.window is not None
+
+class BackgroundRenderMixin:
+    """Run a render in a headless child process and report progress modally.
+    
+    Operators call start_background_render() from execute() after applying
+    their settings, and may override on_render_finished() for post steps;
+    returning another job from it runs that job next with the same progress UI.
+    Without a window (blender -b) the job runs to completion before returning.
+    """
+    
+    _timer = None
+    _job = None
+    
+    def start_background_render(self, context, label, args=None, total_frames=None):
+        snapshot = save_snapshot(f"{label}_{context.scene.name}")
+        command = blender_command(snapshot, ["-S", context.scene.name] + (args or ["-a"]))
+        total = total_frames or frame_count(context.scene)
+        return self.start_job(context, RenderJob(command, total, snapshot, label))
+    
+    def start_job(self, context, job):
+        """Start any job with the RenderJob interface and follow it from the modal"""
+        if not can_run_modal(context):
+            return self.run_job_blocking(context, job)
+        self._job = job.start()
+        
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.5, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+    
+    def run_job_blocking(self, context, job):
+        """Headless counterpart of the modal: poll the job (and its follow-ups) until done"""
+        while job is not None:
+            job.start()
+            try:
+                while job.poll():
+                    time.sleep(0.5)
+            finally:
+                job.cleanup()
+            if not job.succeeded:
+                self.report({'ERROR'}, f"{job.label} failed: {job.log[-1] if job.log else 'no output'}")
+                return {'CANCELLED'}
+            job = self.on_render_finished(context, job)
+        return {'FINISHED'}
+    
+    def check_stream(self, scene):
+        """Whether streaming keeps the scene's look; warns and falls back otherwise"""
+        reason = frame_pipe.stream_unsupported(scene)
+        if reason:
+            self.report({'WARNING'}, f"Streaming skipped ({reason} needs Blender's color management); rendering normally")
+        return reason is None
+    
+    def start_stream_render(self, context, label, output_path, codec_args=None):
+        """Background render whose frames are piped straight into ffmpeg, with no files in between"""
+        scene = context.scene
+        frames = range(scene.frame_start, scene.frame_end + 1, max(scene.frame_step, 1))
+        fps = scene.render.fps / scene.render.fps_base
+        args = frame_pipe.worker_args(output_path, frames, fps, find_ffmpeg(), codec_args)
+        return self.start_background_render(context, label, args=args, total_frames=len(frames))
+    
+    def modal(self, context, event):
+        job = self._job
+        if event.type == 'ESC':
+            job.cancel()
+            self.finish_background_render(context)
+            self.report({'WARNING'}, f"{job.label} cancelled after {job.frames_done} frames")
+            return {'CANCELLED'}
+        
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        
+        if job.poll():
+            context.workspace.status_text_set(job.status_text())
+            return {'PASS_THROUGH'}
+        
+        self.finish_background_render(context)
+        if not job.succeeded:
+            self.report({'ERROR'}, f"{job.label} failed: {job.log[-1] if job.log else 'no output'}")
+            return {'CANCELLED'}
+        
+        # A post step may hand back another job to run under the same modal
+        follow_up = self.on_render_finished(context, job)
+        if follow_up is not None:
+            self._job = follow_up.start()
+            self._timer = context.window_manager.event_timer_add(0.5, window=context.window)
+            return {'PASS_THROUGH'}
+        return {'FINISHED'}
+    
+    def finish_background_render(self, context):
+        context.window_manager.event_timer_remove(self._timer)
+        context.workspace.status_text_set(None)
+        self._job.cleanup()
+    
+    def start_parallel_render(self, context, label, workers=0, threads=0, encode_to=None, encode=None, frames=None, holds=None):
+        """Render the frame range as a PNG sequence across several workers, then encode.
+        
+        encode_to names a single MP4; encode is a callable taking the frames
+        directory and returning encoder commands to run side by side. Passing
+        frames renders only those into the existing sequence directory, and
+        holds maps rendered frames to the identical frames linked from them.
+        """
+        scene = context.scene
+        render = scene.render
+        auto_workers, auto_threads = default_workers(threads)
+        workers = workers or auto_workers
+        threads = threads or auto_threads
+        
+        frames_dir = bpy.path.abspath(render.filepath) + "_frames"
+        if frames is None:
+            prepare_frames_dir(frames_dir)
+            frames = range(scene.frame_start, scene.frame_end + 1, max(scene.frame_step, 1))
+        restore = sequence_settings(scene, frames_dir)
+        try:
+            snapshot = save_snapshot(f"{label}_{scene.name}")
+        finally:
+            restore()
+        
+        if encode_to:
+            scale = render.resolution_percentage / 100
+            resolution = (int(render.resolution_x * scale), int(render.resolution_y * scale))
+            fps = render.fps / render.fps_base
+            encode = lambda directory: [encode_command(directory, fps, encode_to, resolution)]
+        
+        return self.start_job(context, ParallelRender(snapshot, scene.name, frames, workers, threads, frames_dir, encode, label, holds))
+    
+    def on_render_finished(self, context, job):
+        if getattr(job, "stream_stats", None):
+            self.report({'INFO'}, f"{job.label} finished in {format_duration(job.elapsed)}: {frame_pipe.format_stats(job.stream_stats)}")
+            return
+        message = f"{job.label} finished: {job.frames_done} frames in {format_duration(job.elapsed)}"
+        if getattr(job, "held_frames", 0):
+            message += f", {job.held_frames} held frames linked instead of rendered"
+        self.report({'INFO'}, message)
+
+# Parallel rendering
+SEQUENCE_PREFIX = "frame_"
+# Marks a sequence directory as created by the add-on and safe to clear
+FRAMES_MARKER = ".norent_frames"
+FRAME_NUMBER = re.compile(r"(\d+)\.\w+$")
+
+def find_ffmpeg():
+    """Path of a local ffmpeg binary, or None"""
+    return shutil.which("ffmpeg")
+
+def default_workers(threads_per_worker=0):
+    """Worker and thread counts that fill the machine without oversubscribing it"""
+    cores = os.cpu_count() or 1
+    threads = threads_per_worker or max(1, min(4, cores))
+    return max(1, cores // threads), threads
+
+def frame_args(frames):
+    """Blender arguments that render exactly the given frames"""
+    frames = sorted(frames)
+    if frames == list(range(frames[0], frames[-1] + 1)):
+        return ["-s", str(frames[0]), "-e", str(frames[-1]), "-a"]
+    return ["-f", ",".join(str(f) for f in frames)]
+
+def split_chunks(frames, workers, chunks_per_worker=4):
+    """Split frames into contiguous chunks, several per worker for load balancing"""
+    frames = sorted(frames)
+    size = max(1, -(-len(frames) // (workers * chunks_per_worker)))
+    return [frames[i:i + size] for i in range(0, len(frames), size)]
+
+def sequence_settings(scene, frames_dir):
+    """Switch the scene to a placeholder-claimed PNG sequence; returns a restore callback"""
+    render = scene.render
+    saved = (
+        render.filepath, render.image_settings.file_format, render.image_settings.color_mode,
+        render.image_settings.compression, render.use_overwrite, render.use_placeholder,
+    )
+    render.filepath = os.path.join(frames_dir, SEQUENCE_PREFIX + "####")
+    render.image_settings.file_format = 'PNG'
+    render.image_settings.color_mode = 'RGBA'
+    render.image_settings.compression = 15
+    # Workers skip frames another worker already claimed
+    render.use_overwrite = False
+    render.use_placeholder = True
+    
+    def restore():
+        (render.filepath, render.image_settings.file_format, render.image_settings.color_mode,
+         render.image_settings.compression, render.use_overwrite, render.use_placeholder) = saved
+    return restore
+
+def prepare_frames_dir(frames_dir):
+    """Empty the sequence directory so stale frames aren't skipped as done.
+    
+    The whole folder is only removed when it is ours (marker file) or holds
+    nothing but sequence frames; otherwise just the frame_* files go, which
+    the render would overwrite anyway.
+    """
+    if os.path.isdir(frames_dir):
+        entries = os.listdir(frames_dir)
+        if FRAMES_MARKER in entries or all(name.startswith(SEQUENCE_PREFIX) for name in entries):
+            shutil.rmtree(frames_dir)
+        else:
+            for name in entries:
+                path = os.path.join(frames_dir, name)
+                if name.startswith(SEQUENCE_PREFIX) and os.path.isfile(path):
+                    os.remove(path)
+    os.makedirs(frames_dir, exist_ok=True)
+    open(os.path.join(frames_dir, FRAMES_MARKER), 'w').close()
+
+def sequence_files(frames_dir):
+    return sorted(f for f in os.listdir(frames_dir) if f.startswith(SEQUENCE_PREFIX))
+
+def sequence_path(frames_dir, frame):
+    return os.path.join(frames_dir, f"{SEQUENCE_PREFIX}{frame:04d}.png")
+
+def link_file(source, target):
+    """Hard link source to target, copying when links aren't possible"""
+    if os.path.exists(target):
+        os.remove(target)
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+def fill_holds(frames_dir, holds):
+    """Link each rendered hold frame to the frames that repeat it; returns frames filled"""
+    filled = 0
+    for frame, copies in holds.items():
+        source = sequence_path(frames_dir, frame)
+        if not os.path.exists(source):
+            continue
+        for copy in copies:
+            link_file(source, sequence_path(frames_dir, copy))
+            filled += 1
+    return filled
+
+def ffmpeg_input_args(frames_dir, fps):
+    """ffmpeg input arguments for a rendered PNG sequence"""
+    files = sequence_files(frames_dir)
+    numbers = [int(FRAME_NUMBER.search(f).group(1)) for f in files]
+    if numbers == list(range(numbers[0], numbers[0] + len(numbers))):
+        pattern = os.path.join(frames_dir, SEQUENCE_PREFIX + "%04d.png")
+        return ["-framerate", f"{fps:.6g}", "-start_number", str(numbers[0]), "-i", pattern]
+    
+    # Stepped sequences have gaps; list them explicitly
+    list_path = os.path.join(frames_dir, "frames.ffconcat")
+    with open(list_path, 'w') as f:
+        f.write("ffconcat version 1.0\n")
+        for name in files:
+            f.write(f"file '{name}'\nduration {1 / fps:.6f}\n")
+    return ["-f", "concat", "-safe", "0", "-i", list_path, "-r", f"{fps:.6g}"]
+
+def encode_command(frames_dir, fps, output_path, resolution, extra_args=None):
+    """Encode a PNG sequence to H.264 with ffmpeg, or with a headless Blender's sequencer"""
+    ffmpeg = find_ffmpeg()
+    if ffmpeg:
+        return [ffmpeg, "-y", "-loglevel", "error"] + ffmpeg_input_args(frames_dir, fps) + (
+            extra_args or ["-c:v", "libx264", "-preset", "medium", "-crf", "18", "-pix_fmt", "yuv420p"]
+        ) + [output_path]
+    
+    script = ENCODE_SCRIPT.format(
+        directory=repr(frames_dir + os.sep), files=repr(sequence_files(frames_dir)), fps=round(fps),
+        width=resolution[0], height=resolution[1], output=repr(output_path),
+    )
+    return [bpy.app.binary_path, "-b", "--factory-startup", "--python-expr", script]
+
+# Fallback encoder run inside a headless Blender when no ffmpeg binary is installed
+ENCODE_SCRIPT = """
+import bpy
+scene = bpy.data.scenes.new("NORENT_Encode")
+files = {files}
+editor = scene.sequence_editor_create()
+strip = editor.sequences.new_image("frames", {directory} + files[0], 1, 1)
+for name in files[1:]:
+    strip.elements.append(name)
+scene.frame_start = 1
+scene.frame_end = len(files)
+scene.render.fps = {fps}
+scene.render.resolution_x = {width}
+scene.render.resolution_y = {height}
+scene.render.resolution_percentage = 100
+scene.render.image_settings.file_format = 'FFMPEG'
+scene.render.ffmpeg.format = 'MPEG4'
+scene.render.ffmpeg.codec = 'H264'
+scene.render.ffmpeg.constant_rate_factor = 'HIGH'
+scene.render.use_file_extension = False
+scene.render.filepath = {output}
+bpy.ops.render.render(animation=True, scene=scene.name)
+"""
+
+class ParallelRender:
+    """Render a frame range with a pool of headless Blender workers.
+    
+    Frames are split into more chunks than workers and handed out as
+    workers free up. When the queue runs dry, idle workers are started on
+    the second half of the slowest chunk; Blender's placeholder files make
+    the two processes skip each other's frames. Exposes the same interface
+    as RenderJob so BackgroundRenderMixin can drive it.
+    """
+    
+    def __init__(self, snapshot, scene_name, frames, workers, threads, frames_dir, encode=None, label="Render", holds=None):
+        # encode: callable returning encoder commands, all run after the last frame
+        # holds: rendered frame -> frames that repeat it, linked before encoding
+        self.snapshot = snapshot
+        self.scene_name = scene_name
+        self.frames = sorted(frames)
+        self.workers = max(1, workers)
+        self.threads = max(1, threads)
+        self.frames_dir = frames_dir
+        self.encode = encode
+        self.label = label
+        self.total_frames = len(self.frames)
+        self.pending = split_chunks(self.frames, self.workers)
+        self.running = []
+        self.done_frames = set()
+        self.encoders = []
+        self.holds = holds or {}
+        self.held_frames = 0
+        self.failed = None
+        self.render_time = None
+        self.log = []
+        self.start_time = None
+        self.end_time = None
+    
+    def start(self):
+        self.start_time = time.perf_counter()
+        self._fill()
+        return self
+    
+    def _launch(self, chunk):
+        args = ["-S", self.scene_name, "-t", str(self.threads)] + frame_args(chunk)
+        job = RenderJob(blender_command(self.snapshot, args), len(chunk), label=self.label).start()
+        job.chunk = chunk
+        self.running.append(job)
+    
+    def _fill(self):
+        while self.pending and len(self.running) < self.workers:
+            self._launch(self.pending.pop(0))
+        # Rebalance stragglers once every chunk has been handed out
+        while not self.pending and len(self.running) < self.workers:
+            straggler = max(self.running, key=lambda job: len(self._remaining(job)), default=None)
+            remaining = self._remaining(straggler) if straggler else []
+            if len(remaining) < 4:
+                break
+            helper_frames = remaining[len(remaining) // 2:]
+            straggler.chunk = [f for f in straggler.chunk if f not in helper_frames]
+            self._launch(helper_frames)
+    
+    def _remaining(self, job):
+        return [f for f in job.chunk if f not in self.done_frames]
+    
+    def poll(self):
+        if self.encoders:
+            running = [encoder.poll() for encoder in self.encoders]
+            if any(running):
+                return True
+            self.end_time = time.perf_counter()
+            for encoder in self.encoders:
+                if not encoder.succeeded:
+                    self.failed = "encode"
+                    self.log.extend(encoder.log[-5:])
+            return False
+        
+        for job in list(self.running):
+            running = job.poll()
+            for path in job.saved_files:
+                match = FRAME_NUMBER.search(path)
+                if match:
+                    self.done_frames.add(int(match.group(1)))
+            job.saved_files.clear()
+            if not running:
+                self.running.remove(job)
+                if not job.succeeded:
+                    self.failed = "render"
+                    self.log.extend(job.log[-5:])
+                    self.cancel()
+                    return False
+        
+        self._fill()
+        if self.running or self.pending:
+            return True
+        
+        if self.holds and not self.held_frames:
+            self.held_frames = fill_holds(self.frames_dir, self.holds)
+        if self.encode:
+            # Built now, once the sequence is on disk; every encoder reads the same frames
+            self.render_time = time.perf_counter() - self.start_time
+            self.encoders = [
+                RenderJob(command, 1, label=f"{self.label} Encode").start()
+                for command in self.encode(self.frames_dir)
+            ]
+            if self.encoders:
+                return True
+        self.end_time = time.perf_counter()
+        return False
+    
+    @property
+    def frames_done(self):
+        return len(self.done_frames)
+    
+    @property
+    def succeeded(self):
+        return self.failed is None
+    
+    elapsed = RenderJob.elapsed
+    eta = RenderJob.eta
+    
+    def status_text(self):
+        if self.encoders:
+            busy = sum(1 for encoder in self.encoders if encoder.end_time is None)
+            return f"NORENT {self.label}: encoding {busy}/{len(self.encoders)} outputs | Esc to cancel"
+        return RenderJob.status_text(self).replace(" frames", f" frames ({len(self.running)} workers)", 1)
+    
+    def cancel(self):
+        for job in self.running:
+            job.cancel()
+        for encoder in self.encoders:
+            encoder.cancel()
+        self.pending.clear()
+    
+    def cleanup(self):
+        RenderJob.cleanup(self)
+
+class TemplateRowJob(RenderJob):
+    """A template batch worker; collects the outputs and errors of its rows"""
+    
+    def __init__(self, command, total_rows, label):
+        super().__init__(command, total_rows, label=label)
+        self.outputs = []
+        self.row_errors = []
+    
+    def parse_line(self, line):
+        super().parse_line(line)
+        if line.startswith(template_batch.ROW_PREFIX):
+            self.outputs.append(line[len(template_batch.ROW_PREFIX):].split(" ", 1)[1])
+        elif line.startswith(template_batch.ROW_ERROR_PREFIX):
+            self.row_errors.append(line[len(template_batch.ROW_ERROR_PREFIX):])
+
+class TemplateBatchJob:
+    """Template batch workers, each rendering its share of the rows.
+    
+    Progress counts rows rather than frames; rows that fail are logged
+    and skipped so one bad spreadsheet line doesn't stop the batch.
+    """
+    
+    def __init__(self, commands, total_rows, snapshot, label="Template Batch"):
+        self.jobs = [TemplateRowJob(command, total_rows, label) for command in commands]
+        self.total_frames = max(total_rows, 1)
+        self.snapshot = snapshot
+        self.label = label
+        self.log = []
+        self.start_time = None
+        self.end_time = None
+    
+    def start(self):
+        self.start_time = time.perf_counter()
+        for job in self.jobs:
+            job.start()
+        return self
+    
+    def poll(self):
+        running = [job.poll() for job in self.jobs]
+        if any(running):
+            return True
+        if self.end_time is None:
+            self.end_time = time.perf_counter()
+            for job in self.jobs:
+                self.log.extend(job.row_errors)
+                if not job.succeeded:
+                    self.log.extend(job.log[-5:])
+        return False
+    
+    @property
+    def outputs(self):
+        return [path for job in self.jobs for path in job.outputs]
+    
+    @property
+    def row_errors(self):
+        return [error for job in self.jobs for error in job.row_errors]
+    
+    @property
+    def frames_done(self):
+        return sum(len(job.outputs) + len(job.row_errors) for job in self.jobs)
+    
+    @property
+    def succeeded(self):
+        return all(job.succeeded for job in self.jobs)
+    
+    elapsed = RenderJob.elapsed
+    eta = RenderJob.eta
+    
+    def status_text(self):
+        return RenderJob.status_text(self).replace(" frames", f" rows ({len(self.jobs)} workers)", 1)
+    
+    def cancel(self):
+        for job in self.jobs:
+            job.cancel()
+    
+    def cleanup(self):
+        RenderJob.cleanup(self)
\ No newline at end of file
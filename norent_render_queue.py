@@ -0,0 +1,255 @@
+import bpy
+import json
+import os
+import subprocess
+import sys
+import time
+from bpy.types import Operator
+from bpy.props import BoolProperty, IntProperty, EnumProperty
+
+from .render_jobs import find_ffmpeg, prepare_frames_dir, sequence_settings, source_settings
+from .utils import apply_preset_resolution, quality_settings
+from .job_queue import JobQueue, supervisor_command, QUEUED, ACTIVE, FAILED, CANCELLED
+
+QUEUE_DIR_NAME = "norent_queue"
+
+_queue = None
+
+def queue_dir():
+    return bpy.utils.user_resource('DATAFILES', path=QUEUE_DIR_NAME, create=True)
+
+def get_queue():
+    """Connection to the machine-wide job database, opened once per session"""
+    global _queue
+    if _queue is None:
+        _queue = JobQueue(os.path.join(queue_dir(), "jobs.sqlite"))
+    return _queue
+
+def ensure_supervisor(queue):
+    """Start a detached supervisor unless one is alive; returns its pid"""
+    pid = queue.supervisor_pid()
+    if pid:
+        return pid
+    log = open(os.path.join(queue_dir(), "supervisor.log"), "a")
+    options = {"creationflags": 0x00000008 | 0x00000200} if os.name == "nt" else {"start_new_session": True}
+    # Detached so the queue keeps running when this Blender closes or crashes
+    process = subprocess.Popen(
+        supervisor_command(sys.executable, queue.path), stdout=log, stderr=subprocess.STDOUT,
+        stdin=subprocess.DEVNULL, **options
+    )
+    log.close()
+    return process.pid
+
+def job_progress(job):
+    total = len(json.loads(job["frames"]))
+    return f"{job['done']}/{total}"
+
+class NORENT_OT_QueueRender(Operator):
+    """Add this scene to the overnight render queue"""
+    bl_idname = "norent.queue_render"
+    bl_label = "Queue Render"
+    bl_description = "Snapshot this scene with its preset and quality tier and add it to the crash-resumable render queue"
+    
+    priority: IntProperty(
+        name="Priority",
+        description="Higher priority jobs start first",
+        default=0,
+        min=-100,
+        max=100
+    )
+    
+    encode: BoolProperty(
+        name="Encode MP4",
+        description="Encode the finished frames to MP4 with ffmpeg",
+        default=True
+    )
+    
+    threads: IntProperty(
+        name="Threads",
+        description="Render threads for the job's worker (0 = all cores)",
+        default=0,
+        min=0,
+        max=256
+    )
+    
+    max_attempts: IntProperty(
+        name="Attempts",
+        description="Times a crashed job is resumed before it is marked failed",
+        default=3,
+        min=1,
+        max=20
+    )
+    
+    start_supervisor: BoolProperty(
+        name="Start Queue",
+        description="Start the queue supervisor if it isn't running",
+        default=True
+    )
+    
+    def execute(self, context):
+        scene = context.scene
+        if not bpy.data.filepath:
+            self.report({'ERROR'}, "Save the file before queueing it")
+            return {'CANCELLED'}
+        
+        preset, tier = scene.norent.render_preset, scene.norent.quality_tier
+        output_dir = os.path.join(bpy.path.abspath("//"), "NORENT_Renders")
+        # Every job gets its own frames and MP4, so queueing again never touches an earlier job's output
+        stamp = time.strftime('%Y%m%d_%H%M%S')
+        output_base = os.path.join(output_dir, f"NORENT_{preset}_{tier}_{scene.name}_{stamp}")
+        suffix = 1
+        while os.path.exists(output_base + "_frames"):
+            suffix += 1
+            output_base = os.path.join(output_dir, f"NORENT_{preset}_{tier}_{scene.name}_{stamp}_{suffix}")
+        frames_dir = output_base + "_frames"
+        prepare_frames_dir(frames_dir)
+        
+        # The snapshot carries the preset, tier and sequence output; the open file is left as it was
+        snapshot_dir = os.path.join(queue_dir(), "blends")
+        os.makedirs(snapshot_dir, exist_ok=True)
+        snapshot = os.path.join(snapshot_dir, f"{bpy.path.clean_name(os.path.basename(output_base))}.blend")
+        saved_size = (scene.render.resolution_x, scene.render.resolution_y, scene.render.fps)
+        apply_preset_resolution(scene)
+        restore_quality = quality_settings(scene)
+        restore_sequence = sequence_settings(scene, frames_dir)
+        restore_source = source_settings()
+        # The snapshot renders at the preset's rate, not the scene's authored one
+        fps = scene.render.fps / scene.render.fps_base
+        try:
+            bpy.ops.wm.save_as_mainfile(filepath=snapshot, copy=True)
+        finally:
+            restore_source()
+            restore_sequence()
+            restore_quality()
+            scene.render.resolution_x, scene.render.resolution_y, scene.render.fps = saved_size
+        
+        encode = None
+        ffmpeg = find_ffmpeg()
+        if self.encode and ffmpeg:
+            encode = {"ffmpeg": ffmpeg, "fps": fps, "output": output_base + ".mp4"}
+        elif self.encode:
+            self.report({'WARNING'}, "ffmpeg not found; the job will leave a PNG sequence")
+        
+        queue = get_queue()
+        job_id = queue.add(
+            f"{os.path.basename(bpy.data.filepath)} · {scene.name} · {preset} {tier.title()}",
+            bpy.app.binary_path, snapshot, scene.name,
+            range(scene.frame_start, scene.frame_end + 1, max(scene.frame_step, 1)), frames_dir,
+            encode, self.priority, self.threads, self.max_attempts
+        )
+        if self.start_supervisor:
+            ensure_supervisor(queue)
+        self.report({'INFO'}, f"Queued job {job_id} ({queue.count(QUEUED)} waiting)")
+        return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+class NORENT_OT_QueueSupervisor(Operator):
+    """Start the render queue supervisor"""
+    bl_idname = "norent.queue_supervisor"
+    bl_label = "Start Render Queue"
+    bl_description = "Run queued jobs in a background process that outlives this Blender session"
+    
+    max_workers: IntProperty(
+        name="Concurrent Jobs",
+        description="Jobs rendered side by side (each is one headless Blender)",
+        default=1,
+        min=1,
+        max=32
+    )
+    
+    def execute(self, context):
+        queue = get_queue()
+        queue.max_workers = self.max_workers
+        pid = ensure_supervisor(queue)
+        self.report({'INFO'}, f"Render queue running (pid {pid}, {self.max_workers} concurrent jobs)")
+        return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        self.max_workers = get_queue().max_workers
+        return context.window_manager.invoke_props_dialog(self)
+
+class NORENT_OT_QueueJob(Operator):
+    """Change a queued job"""
+    bl_idname = "norent.queue_job"
+    bl_label = "Queue Job"
+    bl_description = "Cancel, retry, reprioritize or remove a render queue job"
+    
+    job_id: IntProperty()
+    
+    action: EnumProperty(
+        items=[
+            ('CANCEL', "Cancel", "Stop the job; finished frames are kept"),
+            ('RETRY', "Retry", "Queue a failed or cancelled job again, resuming from its checkpoints"),
+            ('RAISE', "Raise Priority", "Start this job sooner"),
+            ('LOWER', "Lower Priority", "Start this job later"),
+            ('REMOVE', "Remove", "Delete the job and its snapshot")
+        ]
+    )
+    
+    def execute(self, context):
+        queue = get_queue()
+        job = queue.job(self.job_id)
+        if job is None:
+            return {'CANCELLED'}
+        if self.action == 'CANCEL':
+            queue.cancel(self.job_id)
+        elif self.action == 'RETRY':
+            queue.retry(self.job_id)
+        elif self.action in {'RAISE', 'LOWER'}:
+            queue.update(self.job_id, priority=job["priority"] + (1 if self.action == 'RAISE' else -1))
+        elif self.action == 'REMOVE':
+            if job["status"] in ACTIVE:
+                self.report({'WARNING'}, "Cancel the job before removing it")
+                return {'CANCELLED'}
+            queue.remove(self.job_id)
+            if job["blend"].startswith(queue_dir()) and os.path.exists(job["blend"]):
+                os.remove(job["blend"])
+        return {'FINISHED'}
+
+def draw_queue(layout):
+    """Queue status and job list for the render panel"""
+    queue = get_queue()
+    pid = queue.supervisor_pid()
+    row = layout.row(align=True)
+    row.label(text=f"Running (pid {pid})" if pid else "Stopped", icon='PLAY' if pid else 'PAUSE')
+    row.operator("norent.queue_supervisor", text="", icon='PREFERENCES' if pid else 'PLAY')
+    
+    for job in queue.jobs()[:12]:
+        row = layout.row(align=True)
+        icon = {FAILED: 'ERROR', CANCELLED: 'CANCEL'}.get(job["status"], 'RENDER_ANIMATION')
+        row.label(text=f"{job['label']}  {job['status'].title()} {job_progress(job)}", icon=icon)
+        if job["status"] == QUEUED:
+            for action, action_icon in (('RAISE', 'TRIA_UP'), ('LOWER', 'TRIA_DOWN'), ('CANCEL', 'X')):
+                op = row.operator("norent.queue_job", text="", icon=action_icon)
+                op.job_id, op.action = job["id"], action
+        elif job["status"] in ACTIVE:
+            op = row.operator("norent.queue_job", text="", icon='X')
+            op.job_id, op.action = job["id"], 'CANCEL'
+        else:
+            if job["status"] in (FAILED, CANCELLED):
+                op = row.operator("norent.queue_job", text="", icon='FILE_REFRESH')
+                op.job_id, op.action = job["id"], 'RETRY'
+            op = row.operator("norent.queue_job", text="", icon='TRASH')
+            op.job_id, op.action = job["id"], 'REMOVE'
+
+# Registration
+classes = [
+    NORENT_OT_QueueRender,
+    NORENT_OT_QueueSupervisor,
+    NORENT_OT_QueueJob,
+]
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+def unregister():
+    global _queue
+    if _queue is not None:
+        _queue.close()
+        _queue = None
+    
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
\ No newline at end of file
@@ -0,0 +1,322 @@
+import bpy
+import math
+from functools import lru_cache
+from bpy.types import Operator
+from bpy.props import IntProperty, FloatProperty, EnumProperty
+
+# Declarative rig descriptors. Strings in braces are filled from build parameters.
+RIG_DESCRIPTORS = {
+    'BASIC': {
+        "params": {},
+        "objects": [
+            {
+                "key": "control",
+                "name": "NORENT_Camera_Control",
+                "type": 'EMPTY',
+                "empty_display_type": 'PLAIN_AXES',
+                "empty_display_size": 2.0,
+                "location": (0, 0, 0),
+                "props": {
+                    "orbit_distance": 10.0,
+                    "height": 5.0,
+                    "target_x": 0.0,
+                    "target_y": 0.0,
+                    "target_z": 0.0,
+                },
+            },
+            {
+                "key": "camera",
+                "name": "NORENT_Camera",
+                "type": 'CAMERA',
+                "location": (7, -7, 5),
+                "rotation_euler": (1.1, 0, 0.785),
+                "parent": "control",
+            },
+        ],
+        "camera": "camera",
+        "root": "control",
+    },
+    'HANDHELD': {
+        "base": 'BASIC',
+        "params": {"strength": 0.1, "speed": 1.0},
+        "rename": {"camera": "NORENT_Handheld_Camera"},
+        "drivers": [
+            {
+                "object": "camera",
+                "data_path": "location",
+                "index": i,
+                "expression": f"noise(frame * {{speed}} * 0.1 + {i * 10}) * {{strength}}",
+                "variables": [{"name": "frame", "id": "SCENE", "data_path": "frame_current"}],
+            }
+            for i in range(3)
+        ] + [
+            {
+                "object": "camera",
+                "data_path": "rotation_euler",
+                "index": i,
+                "expression": f"noise(frame * {{speed}} * 0.08 + {i * 15}) * {{strength}} * 0.1",
+                "variables": [{"name": "frame", "id": "SCENE", "data_path": "frame_current"}],
+            }
+            for i in range(3)
+        ],
+    },
+    'DOLLY': {
+        "params": {"track_length": 20.0},
+        "objects": [
+            {
+                "key": "track",
+                "name": "NORENT_Dolly_Track",
+                "type": 'PATH',
+                "location": (0, 0, 2),
+                "scale": ("{track_length} / 2", "{track_length} / 2", 1),
+            },
+            {
+                "key": "camera",
+                "name": "NORENT_Dolly_Camera",
+                "type": 'CAMERA',
+                "props": {"dolly_position": 0.0},
+                "constraints": [
+                    {
+                        "type": 'FOLLOW_PATH',
+                        "target": "track",
+                        "use_curve_follow": True,
+                        "use_curve_radius": False,
+                        "use_fixed_location": True,
+                    },
+                ],
+            },
+        ],
+        "drivers": [
+            {
+                "object": "camera",
+                "constraint": 0,
+                "data_path": "offset_factor",
+                "index": -1,
+                "type": 'AVERAGE',
+                "variables": [{"name": "position", "id": "camera", "data_path": '["dolly_position"]'}],
+            },
+        ],
+        "camera": "camera",
+        "root": "track",
+    },
+}
+
+RIG_TYPE_ITEMS = [
+    ('BASIC', "Basic", "Camera with control empty"),
+    ('HANDHELD', "Handheld", "Camera with noise shake"),
+    ('DOLLY', "Dolly", "Camera on a dolly track"),
+]
+
+class RigPlan:
+    """Parsed, parameter-resolved rig descriptor ready to instantiate"""
+    
+    def __init__(self, objects, drivers, camera, root):
+        self.objects = objects
+        self.drivers = drivers
+        self.camera = camera
+        self.root = root
+
+def _resolve(value, params):
+    """Substitute build parameters into a descriptor value"""
+    if isinstance(value, str) and "{" in value:
+        text = value.format(**params)
+        try:
+            return float(eval(text, {"__builtins__": {}}, {}))
+        except (SyntaxError, NameError, TypeError):
+            return text
+    if isinstance(value, (list, tuple)):
+        return tuple(_resolve(v, params) for v in value)
+    if isinstance(value, dict):
+        return {k: v.format(**params) if k == "expression" else _resolve(v, params) for k, v in value.items()}
+    return value
+
+def _flatten(rig_type):
+    """Merge a descriptor with its base descriptor"""
+    descriptor = RIG_DESCRIPTORS[rig_type]
+    base = descriptor.get("base")
+    if not base:
+        return dict(descriptor)
+    
+    merged = _flatten(base)
+    merged["params"] = {**merged.get("params", {}), **descriptor.get("params", {})}
+    merged["objects"] = [dict(obj) for obj in merged["objects"]]
+    for obj in merged["objects"]:
+        if obj["key"] in descriptor.get("rename", {}):
+            obj["name"] = descriptor["rename"][obj["key"]]
+    merged["drivers"] = merged.get("drivers", []) + descriptor.get("drivers", [])
+    return merged
+
+@lru_cache(maxsize=64)
+def parse_descriptor(rig_type, params=()):
+    """Parse a descriptor once per (rig type, parameters) and cache the plan"""
+    if rig_type not in RIG_DESCRIPTORS:
+        raise KeyError(f"Unknown rig type: {rig_type}")
+    
+    descriptor = _flatten(rig_type)
+    values = {**descriptor.get("params", {}), **dict(params)}
+    
+    keys = {obj["key"] for obj in descriptor["objects"]}
+    for obj in descriptor["objects"]:
+        if obj.get("parent") and obj["parent"] not in keys:
+            raise ValueError(f"{rig_type}: unknown parent '{obj['parent']}'")
+    
+    objects = tuple(_resolve(obj, values) for obj in descriptor["objects"])
+    drivers = tuple(_resolve(drv, values) for drv in descriptor.get("drivers", []))
+    return RigPlan(objects, drivers, descriptor.get("camera"), descriptor.get("root"))
+
+def _new_object(spec):
+    """Create one object and its data through bpy.data"""
+    kind = spec["type"]
+    if kind == 'CAMERA':
+        data = bpy.data.cameras.new(spec["name"])
+    elif kind == 'PATH':
+        data = bpy.data.curves.new(spec["name"], 'CURVE')
+        data.dimensions = '3D'
+        data.use_path = True
+        spline = data.splines.new('NURBS')
+        spline.points.add(4)
+        for i, point in enumerate(spline.points):
+            point.co = (i - 2.0, 0.0, 0.0, 1.0)
+        spline.order_u = 5
+        spline.use_endpoint_u = True
+    else:
+        data = None
+    
+    obj = bpy.data.objects.new(spec["name"], data)
+    if kind == 'EMPTY':
+        obj.empty_display_type = spec.get("empty_display_type", 'PLAIN_AXES')
+        obj.empty_display_size = spec.get("empty_display_size", 1.0)
+    for attr in ("location", "rotation_euler", "scale"):
+        if attr in spec:
+            setattr(obj, attr, spec[attr])
+    for key, value in spec.get("props", {}).items():
+        obj[key] = value
+    return obj
+
+def _add_driver(spec, created, scene):
+    """Create one driver from its descriptor"""
+    owner = created[spec["object"]]
+    if "constraint" in spec:
+        owner = owner.constraints[spec["constraint"]]
+    
+    fcurve = owner.driver_add(spec["data_path"], spec["index"]) if spec["index"] >= 0 else owner.driver_add(spec["data_path"])
+    driver = fcurve.driver
+    driver.type = spec.get("type", 'SCRIPTED')
+    if driver.type == 'SCRIPTED':
+        driver.expression = spec["expression"]
+    
+    for var_spec in spec.get("variables", []):
+        var = driver.variables.new()
+        var.name = var_spec["name"]
+        var.type = 'SINGLE_PROP'
+        if var_spec["id"] == 'SCENE':
+            var.targets[0].id_type = 'SCENE'
+            var.targets[0].id = scene
+        else:
+            var.targets[0].id = created[var_spec["id"]]
+        var.targets[0].data_path = var_spec["data_path"]
+
+def build_rig(scene, rig_type, collection=None, location=None, rotation_z=0.0, **params):
+    """Instantiate a rig through the data API (no bpy.ops, no context needed)"""
+    plan = parse_descriptor(rig_type, tuple(sorted(params.items())))
+    collection = collection or scene.collection
+    
+    created = {}
+    for spec in plan.objects:
+        obj = _new_object(spec)
+        obj["norent_rig"] = rig_type
+        created[spec["key"]] = obj
+    
+    for spec in plan.objects:
+        obj = created[spec["key"]]
+        if spec.get("parent"):
+            obj.parent = created[spec["parent"]]
+            obj.parent_type = 'OBJECT'
+        for con_spec in spec.get("constraints", []):
+            constraint = obj.constraints.new(type=con_spec["type"])
+            for key, value in con_spec.items():
+                if key == "target":
+                    constraint.target = created[value]
+                elif key != "type":
+                    setattr(constraint, key, value)
+        collection.objects.link(obj)
+    
+    for spec in plan.drivers:
+        _add_driver(spec, created, scene)
+    
+    root = created[plan.root]
+    if location is not None:
+        root.location = location
+    if rotation_z:
+        root.rotation_euler.z += rotation_z
+    return created[plan.camera], created
+
+def spawn_rigs(scene, rig_type, count, radius=15.0, collection_name="NORENT_Rigs", **params):
+    """Spawn count rigs in a ring around the origin in one batch"""
+    collection = bpy.data.collections.get(collection_name)
+    if not collection:
+        collection = bpy.data.collections.new(collection_name)
+        scene.collection.children.link(collection)
+    
+    cameras = []
+    for i in range(count):
+        angle = 2 * math.pi * i / max(count, 1)
+        location = (radius * math.cos(angle), radius * math.sin(angle), 0.0) if count > 1 else None
+        camera, _ = build_rig(scene, rig_type, collection, location, angle if count > 1 else 0.0, **params)
+        cameras.append(camera)
+    return cameras
+
+class NORENT_OT_CameraSpawnRigs(Operator):
+    """Spawn many camera rigs at once"""
+    bl_idname = "norent.camera_spawn_rigs"
+    bl_label = "Spawn Camera Rigs"
+    bl_description = "Create several camera rigs in a ring for multi-angle scenes"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    rig_type: EnumProperty(
+        name="Rig Type",
+        description="Rig to spawn",
+        items=RIG_TYPE_ITEMS,
+        default='BASIC'
+    )
+    
+    count: IntProperty(
+        name="Count",
+        description="Number of rigs",
+        default=4,
+        min=1,
+        max=500
+    )
+    
+    radius: FloatProperty(
+        name="Ring Radius",
+        description="Distance of each rig from the scene center",
+        default=15.0,
+        min=0.0,
+        max=1000.0
+    )
+    
+    def execute(self, context):
+        cameras = spawn_rigs(context.scene, self.rig_type, self.count, self.radius)
+        if not context.scene.camera:
+            context.scene.camera = cameras[0]
+        
+        self.report({'INFO'}, f"Spawned {len(cameras)} {self.rig_type.lower()} rigs")
+        return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+# Registration
+classes = [
+    NORENT_OT_CameraSpawnRigs,
+]
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+def unregister():
+    parse_descriptor.cache_clear()
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
\ No newline at end of file
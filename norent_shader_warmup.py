@@ -0,0 +1,191 @@
+import bpy
+import time
+from bpy.types import Operator
+from bpy.props import BoolProperty
+from bpy.app.handlers import persistent
+
+from .fingerprint import Fingerprinter
+from .render_cache import rendered_names, is_rendered, animated_paths
+
+WARMUP_SCENE = "NORENT_Shader_Warmup"
+WARMUP_RESOLUTION = 16
+
+# Materials compiled in this session: name -> content digest at compile time.
+# Eevee keeps compiled GPU materials until their node tree or the render
+# settings change, so an unchanged digest means the shader is still warm.
+_warm = {}
+
+def is_eevee(scene):
+    return scene.render.engine.startswith('BLENDER_EEVEE')
+
+def frame_materials(context):
+    """Materials on every object that renders somewhere in the frame range"""
+    scene = context.scene
+    in_layers = rendered_names(scene)
+    depsgraph = context.evaluated_depsgraph_get()
+    objects = []
+    for obj in scene.objects:
+        if obj.name not in in_layers:
+            continue
+        # Objects faded in by keying hide_render are hidden on the current frame
+        if not is_rendered(obj) and ('hide_render', 0) not in animated_paths(obj):
+            continue
+        objects.append(obj)
+        if obj.instance_type == 'COLLECTION' and obj.instance_collection:
+            objects.extend(obj.instance_collection.all_objects)
+    
+    materials = {}
+    for obj in objects:
+        # Evaluated slots include materials assigned by geometry nodes
+        for source in (obj, obj.evaluated_get(depsgraph)):
+            for slot in source.material_slots:
+                material = slot.material and slot.material.original
+                if material and not material.is_grease_pencil:
+                    materials[material.name_full] = material
+    if scene.world:
+        materials[scene.world.name_full] = scene.world
+    return list(materials.values())
+
+def copy_engine_settings(source, target):
+    """Copy engine options that select shader variants (SSR, soft shadows...)"""
+    target.render.engine = source.render.engine
+    for prop in source.eevee.bl_rna.properties:
+        if prop.is_readonly or prop.type in {'POINTER', 'COLLECTION'}:
+            continue
+        try:
+            setattr(target.eevee, prop.identifier, getattr(source.eevee, prop.identifier))
+        except (AttributeError, TypeError, ValueError):
+            pass
+    target.eevee.taa_render_samples = 1
+
+def create_warmup_scene(source):
+    """Tiny scene with a camera looking at one quad; returns (scene, quad)"""
+    scene = bpy.data.scenes.new(WARMUP_SCENE)
+    copy_engine_settings(source, scene)
+    scene.render.resolution_x = scene.render.resolution_y = WARMUP_RESOLUTION
+    scene.render.resolution_percentage = 100
+    scene.render.use_compositing = False
+    scene.render.use_sequencer = False
+    
+    mesh = bpy.data.meshes.new(WARMUP_SCENE)
+    mesh.from_pydata([(-1, -1, 0), (1, -1, 0), (1, 1, 0), (-1, 1, 0)], [], [(0, 1, 2, 3)])
+    mesh.materials.append(None)
+    quad = bpy.data.objects.new(WARMUP_SCENE, mesh)
+    camera = bpy.data.objects.new(WARMUP_SCENE + "_Camera", bpy.data.cameras.new(WARMUP_SCENE))
+    camera.location = (0, 0, 3)
+    scene.collection.objects.link(quad)
+    scene.collection.objects.link(camera)
+    scene.camera = camera
+    return scene, quad
+
+def remove_warmup_scene(scene, quad):
+    camera = scene.camera
+    mesh, camera_data = quad.data, camera.data
+    bpy.data.objects.remove(quad)
+    bpy.data.objects.remove(camera)
+    bpy.data.meshes.remove(mesh)
+    bpy.data.cameras.remove(camera_data)
+    bpy.data.scenes.remove(scene)
+
+def _timed_render(scene):
+    start = time.perf_counter()
+    bpy.ops.render.render(scene=scene.name)
+    return time.perf_counter() - start
+
+def warm_up(context, force=False):
+    """Compile the shaders of every material in the frame range.
+    
+    Returns [(name, seconds)] for the materials compiled, slowest first;
+    materials still warm from an earlier render in this session are skipped.
+    """
+    scene = context.scene
+    if not is_eevee(scene):
+        return []
+    fingerprinter = Fingerprinter()
+    settings = fingerprinter.struct_digest(scene.eevee, values_only=True) + scene.render.engine
+    pending = []
+    for material in frame_materials(context):
+        digest = fingerprinter.digest(material) + settings
+        if force or _warm.get(material.name_full) != digest:
+            pending.append((material, digest))
+    if not pending:
+        return []
+    
+    warmup, quad = create_warmup_scene(scene)
+    timings = []
+    try:
+        # Baseline is a render with nothing to compile; each material's cost is the excess
+        baseline = min(_timed_render(warmup), _timed_render(warmup))
+        for material, digest in pending:
+            if isinstance(material, bpy.types.World):
+                warmup.world = material
+                elapsed = _timed_render(warmup)
+                warmup.world = None
+            else:
+                quad.material_slots[0].material = material
+                elapsed = _timed_render(warmup)
+            timings.append((material.name_full, max(0.0, elapsed - baseline)))
+            _warm[material.name_full] = digest
+    finally:
+        remove_warmup_scene(warmup, quad)
+    return sorted(timings, key=lambda timing: -timing[1])
+
+def format_timings(timings, limit=3):
+    """One-line summary: total compile time and the slowest materials"""
+    total = sum(seconds for _, seconds in timings)
+    slowest = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in timings[:limit])
+    return f"Compiled {len(timings)} shaders in {total:.1f}s (slowest: {slowest})"
+
+@persistent
+def shader_warmup_load_post(dummy):
+    # A new file has new materials; nothing compiled before is reused
+    _warm.clear()
+
+class NORENT_OT_WarmShaders(Operator):
+    """Compile Eevee shaders for every material in the frame range"""
+    bl_idname = "norent.warm_shaders"
+    bl_label = "Warm Up Shaders"
+    bl_description = "Compile the shaders of every material used in the frame range so the first frame doesn't stall"
+    
+    force: BoolProperty(
+        name="Recompile All",
+        description="Also compile materials that are still warm from an earlier render",
+        default=False
+    )
+    
+    def execute(self, context):
+        if not is_eevee(context.scene):
+            self.report({'WARNING'}, "Shader warm-up only applies to Eevee")
+            return {'CANCELLED'}
+        timings = warm_up(context, self.force)
+        if not timings:
+            self.report({'INFO'}, "All shaders are already compiled")
+            return {'FINISHED'}
+        for name, seconds in timings:
+            self.report({'INFO'}, f"{name}: {seconds:.2f}s")
+        self.report({'INFO'}, format_timings(timings))
+        return {'FINISHED'}
+
+# Registration
+classes = [
+    NORENT_OT_WarmShaders,
+]
+
+handlers = [
+    (bpy.app.handlers.load_post, shader_warmup_load_post),
+]
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    
+    for handler_list, handler in handlers:
+        handler_list.append(handler)
+
+def unregister():
+    for handler_list, handler in handlers:
+        handler_list.remove(handler)
+    _warm.clear()
+    
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
\ No newline at end of file
@@ -0,0 +1,368 @@
+import bpy
+import json
+import os
+import re
+import socket
+import statistics
+import tempfile
+import time
+from collections import deque
+from bpy.types import Operator, PropertyGroup
+from bpy.props import BoolProperty, IntProperty, FloatProperty, PointerProperty
+from bpy.app.handlers import persistent
+
+from .render_cache import rendered_names, is_rendered
+from .render_jobs import source_dir
+
+TELEMETRY_DIR_NAME = "NORENT_Telemetry"
+LOG_EXTENSION = ".jsonl"
+FLUSH_EVERY = 10
+HISTOGRAM_BINS = 12
+
+# "Peak:123.45M" / "Peak Memory: 1.2G" in render stats strings
+PEAK_MEMORY = re.compile(r"Peak(?: Memory)?:\s*([\d.]+)\s*([KMG])", re.IGNORECASE)
+MEMORY_UNITS = {'K': 1 / 1024, 'M': 1.0, 'G': 1024.0}
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+class NorentTelemetry(PropertyGroup):
+    enabled: BoolProperty(
+        name="Record Telemetry",
+        description="Log per-frame render time, memory, depsgraph time and visible objects (workers too)",
+        default=False
+    )
+    
+    log_limit: IntProperty(
+        name="Log Limit",
+        description="Frames kept per log; older entries are dropped as the log wraps around",
+        default=5000,
+        min=100,
+        max=1000000
+    )
+    
+    outlier_threshold: FloatProperty(
+        name="Outlier Threshold",
+        description="Frames slower than the median by this many median absolute deviations are flagged",
+        default=4.0,
+        min=1.0,
+        max=50.0
+    )
+
+def telemetry_dir(scene):
+    """One directory for a session and its workers, next to the original .blend"""
+    return os.path.join(source_dir(scene) or tempfile.gettempdir(), TELEMETRY_DIR_NAME)
+
+def process_peak_mb():
+    """Peak resident memory of this process in MB, or None"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if os.uname().sysname == "Darwin" else peak / 1024
+
+def visible_names(scene):
+    in_layers = rendered_names(scene)
+    return {obj.name for obj in scene.objects if obj.name in in_layers and is_rendered(obj)}
+
+class TelemetryLog:
+    """Per-frame records of one render session, flushed to a size-capped JSONL file.
+    
+    Each line is one frame. The first line of a session carries the full
+    set of visible objects, later lines only what appeared or disappeared,
+    so logs stay small and still reconstruct visibility after merging.
+    """
+    
+    def __init__(self, scene):
+        self.path = os.path.join(
+            telemetry_dir(scene), f"{bpy.path.clean_name(scene.name)}_{socket.gethostname()}_{os.getpid()}{LOG_EXTENSION}"
+        )
+        self.limit = scene.norent_telemetry.log_limit
+        self.session = f"{socket.gethostname()}:{os.getpid()}:{time.time():.0f}"
+        self.pending = deque(maxlen=self.limit)
+        self.visible = None
+        self.frame_start = None
+        self.eval_start = None
+        self.eval_time = None
+        self.peak_mb = None
+    
+    def record(self, scene, wall):
+        visible = visible_names(scene)
+        record = {
+            "session": self.session,
+            "frame": scene.frame_current,
+            "wall": round(wall, 4),
+            "depsgraph": None if self.eval_time is None else round(self.eval_time, 4),
+            "peak_mb": round(self.peak_mb or process_peak_mb() or 0.0, 1),
+            "visible": len(visible),
+        }
+        if self.visible is None:
+            record["objects"] = sorted(visible)
+        else:
+            record["appeared"] = sorted(visible - self.visible)
+            record["disappeared"] = sorted(self.visible - visible)
+        self.visible = visible
+        self.eval_time = self.peak_mb = None
+        self.pending.append(record)
+        if len(self.pending) >= FLUSH_EVERY:
+            self.flush()
+    
+    def flush(self):
+        if not self.pending:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "a") as log:
+            log.writelines(json.dumps(record, separators=(",", ":")) + "\n" for record in self.pending)
+        self.pending.clear()
+        self.wrap()
+    
+    def wrap(self):
+        """Keep the file within twice the limit by dropping its oldest lines.
+        
+        The first kept line of each session whose start was dropped is
+        rewritten with the full object set, so the session still merges.
+        """
+        with open(self.path) as log:
+            lines = log.readlines()
+        if len(lines) <= 2 * self.limit:
+            return
+        
+        visible = {}
+        for line in lines[:-self.limit]:
+            try:
+                replay(visible, json.loads(line))
+            except ValueError:
+                pass
+        kept = []
+        for line in lines[-self.limit:]:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                kept.append(line)
+                continue
+            session = record["session"]
+            if session in visible and "objects" not in record:
+                record["objects"] = sorted(replay(visible, record))
+                del record["appeared"], record["disappeared"]
+                line = json.dumps(record, separators=(",", ":")) + "\n"
+            visible.pop(session, None)
+            kept.append(line)
+        with open(self.path, "w") as log:
+            log.writelines(kept)
+
+_log = None
+
+def replay(visible, record):
+    """Advance a session's visible set by one record; None if its start is unknown"""
+    session = record["session"]
+    if "objects" in record:
+        visible[session] = set(record["objects"])
+    elif session in visible:
+        visible[session] = (visible[session] | set(record["appeared"])) - set(record["disappeared"])
+    else:
+        return None
+    return visible[session]
+
+def session_time(session):
+    """Start time stamped into a session id (host:pid:time)"""
+    try:
+        return float(session.rsplit(":", 1)[1])
+    except (IndexError, ValueError):
+        return 0.0
+
+def read_log(path):
+    records = []
+    with open(path) as log:
+        for line in log:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                pass  # Torn last line of a crashed worker
+    return records
+
+def merge_logs(paths):
+    """Frame-ordered records from any number of worker logs.
+    
+    Visibility is rebuilt per session and re-diffed in frame order, so
+    appeared/disappeared are correct across worker chunk boundaries. When
+    a frame was rendered more than once the most recently started session
+    wins, whatever order the logs are read in.
+    """
+    by_frame = {}
+    for path in paths:
+        visible = {}
+        for record in read_log(path):
+            objects = replay(visible, record)
+            if objects is None:
+                continue  # Session start lost with a torn line
+            frame = record["frame"]
+            current = by_frame.get(frame)
+            if current is None or session_time(record["session"]) >= session_time(current["session"]):
+                by_frame[frame] = dict(record, objects=objects)
+    
+    merged = [by_frame[frame] for frame in sorted(by_frame)]
+    previous = set()
+    for record in merged:
+        record["appeared"] = sorted(record["objects"] - previous)
+        record["disappeared"] = sorted(previous - record["objects"])
+        previous = record.pop("objects")
+    if merged:
+        merged[0]["appeared"] = []  # Everything "appears" on the first frame
+    return merged
+
+def scene_logs(scene):
+    directory = telemetry_dir(scene)
+    if not os.path.isdir(directory):
+        return []
+    prefix = bpy.path.clean_name(scene.name) + "_"
+    return [os.path.join(directory, name) for name in os.listdir(directory)
+            if name.startswith(prefix) and name.endswith(LOG_EXTENSION)]
+
+def find_outliers(records, threshold):
+    """Records slower than median + threshold * MAD"""
+    walls = [record["wall"] for record in records]
+    if len(walls) < 3:
+        return []
+    median = statistics.median(walls)
+    spread = statistics.median(abs(wall - median) for wall in walls) or median * 0.05 or 1e-6
+    return [record for record in records if record["wall"] > median + threshold * spread]
+
+def spike_causes(records, outlier):
+    """Objects that appeared on the outlier frame or during the slow run leading up to it"""
+    index = records.index(outlier)
+    causes = set(outlier["appeared"])
+    limit = outlier["wall"] * 0.5
+    while index > 0 and records[index - 1]["wall"] > limit and not causes:
+        index -= 1
+        causes.update(records[index]["appeared"])
+    return sorted(causes)
+
+def histogram(walls, bins=HISTOGRAM_BINS):
+    """[(lower bound, upper bound, count)] over the frame times"""
+    low, high = min(walls), max(walls)
+    width = (high - low) / bins or 1.0
+    counts = [0] * bins
+    for wall in walls:
+        counts[min(bins - 1, int((wall - low) / width))] += 1
+    return [(low + i * width, low + (i + 1) * width, count) for i, count in enumerate(counts)]
+
+_report_cache = {}
+
+def telemetry_report(scene):
+    """Merged records, histogram and outliers for the scene's logs; cached until a log changes"""
+    paths = scene_logs(scene)
+    key = tuple(sorted((path, os.path.getmtime(path)) for path in paths)) + (scene.norent_telemetry.outlier_threshold,)
+    cached = _report_cache.get(scene.name)
+    if cached and cached[0] == key:
+        return cached[1]
+    records = merge_logs(paths)
+    report = None
+    if records:
+        outliers = find_outliers(records, scene.norent_telemetry.outlier_threshold)
+        report = {
+            "frames": len(records),
+            "histogram": histogram([record["wall"] for record in records]),
+            "outliers": [(record, spike_causes(records, record)) for record in outliers],
+            "peak_mb": max(record["peak_mb"] for record in records),
+            "depsgraph": sum(record["depsgraph"] or 0.0 for record in records),
+            "wall": sum(record["wall"] for record in records),
+        }
+    _report_cache[scene.name] = (key, report)
+    return report
+
+def _recording(scene):
+    settings = getattr(scene, "norent_telemetry", None)
+    return settings is not None and settings.enabled
+
+@persistent
+def telemetry_render_init(scene, depsgraph=None):
+    global _log
+    _log = TelemetryLog(scene) if _recording(scene) else None
+
+@persistent
+def telemetry_frame_change_pre(scene, depsgraph=None):
+    if _log:
+        _log.eval_start = time.perf_counter()
+
+@persistent
+def telemetry_frame_change_post(scene, depsgraph=None):
+    if _log and _log.eval_start is not None:
+        _log.eval_time = time.perf_counter() - _log.eval_start
+        _log.eval_start = None
+
+@persistent
+def telemetry_render_pre(scene, depsgraph=None):
+    if _log:
+        _log.frame_start = time.perf_counter()
+
+@persistent
+def telemetry_render_stats(stats):
+    if _log:
+        match = PEAK_MEMORY.search(stats)
+        if match:
+            value = float(match.group(1)) * MEMORY_UNITS[match.group(2).upper()]
+            _log.peak_mb = max(_log.peak_mb or 0.0, value)
+
+@persistent
+def telemetry_render_post(scene, depsgraph=None):
+    if _log and _log.frame_start is not None:
+        _log.record(scene, time.perf_counter() - _log.frame_start)
+        _log.frame_start = None
+
+@persistent
+def telemetry_render_finished(scene, depsgraph=None):
+    global _log
+    if _log:
+        _log.flush()
+        _log = None
+
+class NORENT_OT_TelemetryClear(Operator):
+    """Delete the telemetry logs of this scene"""
+    bl_idname = "norent.telemetry_clear"
+    bl_label = "Clear Telemetry"
+    bl_description = "Delete the render telemetry logs recorded for this scene"
+    
+    def execute(self, context):
+        paths = scene_logs(context.scene)
+        for path in paths:
+            os.remove(path)
+        _report_cache.pop(context.scene.name, None)
+        self.report({'INFO'}, f"Removed {len(paths)} telemetry logs")
+        return {'FINISHED'}
+
+# Registration
+classes = [
+    NorentTelemetry,
+    NORENT_OT_TelemetryClear,
+]
+
+handlers = [
+    (bpy.app.handlers.render_init, telemetry_render_init),
+    (bpy.app.handlers.frame_change_pre, telemetry_frame_change_pre),
+    (bpy.app.handlers.frame_change_post, telemetry_frame_change_post),
+    (bpy.app.handlers.render_pre, telemetry_render_pre),
+    (bpy.app.handlers.render_stats, telemetry_render_stats),
+    (bpy.app.handlers.render_post, telemetry_render_post),
+    (bpy.app.handlers.render_complete, telemetry_render_finished),
+    (bpy.app.handlers.render_cancel, telemetry_render_finished),
+]
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    
+    bpy.types.Scene.norent_telemetry = PointerProperty(type=NorentTelemetry)
+    for handler_list, handler in handlers:
+        handler_list.append(handler)
+
+def unregister():
+    for handler_list, handler in handlers:
+        handler_list.remove(handler)
+    telemetry_render_finished(None)
+    
+    del bpy.types.Scene.norent_telemetry
+    
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
\ No newline at end of file
@@ -0,0 +1,245 @@
+import bpy
+import csv
+import json
+import os
+import sys
+
+# Runs as a --python script inside each headless worker, so it must not use
+# relative imports. A worker opens the scene once, appends the template once
+# and then only rebinds text, colors and images for each of its rows.
+
+ROW_PREFIX = "NORENT_ROW "
+ROW_ERROR_PREFIX = "NORENT_ROW_ERROR "
+NAME_COLUMN = "name"
+
+def read_rows(path):
+    """Stream rows (dicts) from a CSV, JSON list or JSON Lines file"""
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, newline="", encoding="utf-8-sig") as source:
+        if extension == ".csv":
+            yield from csv.DictReader(source)
+        elif extension in {".jsonl", ".ndjson"}:
+            for line in source:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from json.load(source)
+
+def count_rows(path):
+    return sum(1 for _ in read_rows(path))
+
+def parse_column(header):
+    """'text:Title' -> ('text', 'Title', None); 'color:Brand/Emission' -> ('color', 'Brand', 'Emission')"""
+    kind, _, target = header.partition(":")
+    if not target:
+        return None
+    target, _, node = target.partition("/")
+    return kind.strip().lower(), target.strip(), node.strip() or None
+
+def srgb_to_linear(value):
+    return value / 12.92 if value <= 0.04045 else ((value + 0.055) / 1.055) ** 2.4
+
+def parse_color(text):
+    """'#ff8800', '#ff8800cc' or 'r,g,b[,a]' (0-1 floats) as linear RGBA"""
+    text = text.strip()
+    if text.startswith("#"):
+        digits = text[1:]
+        channels = [int(digits[i:i + 2], 16) / 255 for i in range(0, len(digits), 2)]
+        rgba = [srgb_to_linear(channel) for channel in channels[:3]] + channels[3:4]
+    else:
+        rgba = [float(part) for part in text.split(",")]
+    if len(rgba) not in (3, 4):
+        raise ValueError(f"Can't read color '{text}'")
+    return tuple(rgba) + ((1.0,) if len(rgba) == 3 else ())
+
+def color_socket(material, node_name=None):
+    """The input (or RGB node output) a color column drives"""
+    tree = material.node_tree
+    if tree is None:
+        return None
+    nodes = [tree.nodes[node_name]] if node_name else list(tree.nodes)
+    for node in nodes:
+        if node.type == 'BSDF_PRINCIPLED':
+            return node.inputs["Base Color"]
+        if node.type in {'EMISSION', 'BSDF_DIFFUSE'}:
+            return node.inputs["Color"]
+        if node.type == 'RGB':
+            return node.outputs[0]
+    if node_name:
+        # Any node with a color input, e.g. a group exposing "Color"
+        for socket in nodes[0].inputs:
+            if socket.type == 'RGBA':
+                return socket
+    return None
+
+class TemplateBinder:
+    """Rebinds template text, colors and images in place, row after row"""
+    
+    def __init__(self, scene, template_path=None, base_dir="", blend_dir=""):
+        self.scene = scene
+        # The worker runs a temp snapshot, so relative image cells are resolved
+        # against the rows file and '//' against the original .blend
+        self.base_dir = base_dir
+        self.blend_dir = blend_dir
+        self.names = {"objects": {}, "materials": {}}
+        self.images = {}
+        self.current_images = {}
+        # Template values of every bound target, restored before each row so a
+        # blank cell shows the template rather than whichever row ran before
+        self.defaults = {}
+        if template_path:
+            self.append(template_path)
+    
+    def append(self, path):
+        # Same data as Load Template, appended once per worker instead of once per row
+        with bpy.data.libraries.load(path) as (data_from, data_to):
+            object_names, material_names = list(data_from.objects), list(data_from.materials)
+            data_to.objects = data_from.objects
+            data_to.materials = data_from.materials
+            data_to.node_groups = data_from.node_groups
+        for obj in data_to.objects:
+            if obj:
+                self.scene.collection.objects.link(obj)
+        # Appended names may have gained a .001 suffix; rows use the template's names
+        self.names["objects"] = dict(zip(object_names, data_to.objects))
+        self.names["materials"] = dict(zip(material_names, data_to.materials))
+    
+    def lookup(self, collection, name):
+        found = self.names.get(collection, {}).get(name) or getattr(bpy.data, collection).get(name)
+        if found is None:
+            raise KeyError(f"No {collection[:-1]} named '{name}'")
+        return found
+    
+    def resolve(self, path):
+        if path.startswith("//"):
+            return os.path.normpath(os.path.join(self.blend_dir, path[2:]))
+        return os.path.normpath(os.path.join(self.base_dir, os.path.expanduser(path)))
+    
+    def load_image(self, path):
+        image = self.images.get(path)
+        if image is None:
+            image = self.images[path] = bpy.data.images.load(self.resolve(path), check_existing=True)
+        return image
+    
+    def remember(self, column):
+        """Record a target's template value the first time it is bound"""
+        if column in self.defaults:
+            return
+        kind, target, node = column
+        if kind == "text":
+            obj = self.lookup("objects", target)
+            if obj.type != 'FONT':
+                raise TypeError(f"'{target}' is not a text object")
+            self.defaults[column] = obj.data.body
+        elif kind == "color":
+            material = self.lookup("materials", target)
+            socket = color_socket(material, node)
+            self.defaults[column] = (
+                tuple(socket.default_value) if socket is not None else None, tuple(material.diffuse_color)
+            )
+        elif kind == "image":
+            self.defaults[column] = self.lookup("images", target)
+    
+    def reset(self):
+        """Put every bound target back to its template value"""
+        for (kind, target, node), value in self.defaults.items():
+            if kind == "text":
+                self.lookup("objects", target).data.body = value
+            elif kind == "color":
+                material = self.lookup("materials", target)
+                socket_color, diffuse = value
+                socket = color_socket(material, node)
+                if socket is not None and socket_color is not None:
+                    socket.default_value = socket_color
+                material.diffuse_color = diffuse
+            elif kind == "image":
+                self.set_image(target, value)
+    
+    def set_image(self, target, image):
+        current = self.current_images.get(target) or self.lookup("images", target)
+        if image != current:
+            # Every user of the template image now shows the row's image
+            current.user_remap(image)
+            self.current_images[target] = image
+    
+    def bind(self, row):
+        columns = []
+        for header, value in row.items():
+            column = parse_column(header)
+            if column is None:
+                continue
+            if column[0] not in {"text", "color", "image"}:
+                raise ValueError(f"Unknown column type '{column[0]}' in '{header}'")
+            self.remember(column)
+            columns.append((column, value))
+        self.reset()
+        
+        for (kind, target, node), value in columns:
+            if value in (None, ""):
+                continue
+            if kind == "text":
+                self.lookup("objects", target).data.body = str(value)
+            elif kind == "color":
+                material = self.lookup("materials", target)
+                color = parse_color(str(value))
+                socket = color_socket(material, node)
+                if socket is not None:
+                    socket.default_value = color
+                material.diffuse_color = color
+            elif kind == "image":
+                self.set_image(target, self.load_image(str(value)))
+
+def output_name(row, index):
+    name = str(row.get(NAME_COLUMN) or f"{index:04d}")
+    return "".join(c if c.isalnum() or c in "._- " else "_" for c in name).strip() or f"{index:04d}"
+
+def setup_output(scene, mode):
+    render = scene.render
+    render.use_persistent_data = True
+    render.use_file_extension = False
+    if mode == 'ANIMATION':
+        render.image_settings.file_format = 'FFMPEG'
+        render.ffmpeg.format = 'MPEG4'
+        render.ffmpeg.codec = 'H264'
+        render.ffmpeg.constant_rate_factor = 'HIGH'
+    else:
+        render.image_settings.file_format = 'PNG'
+        render.image_settings.color_mode = 'RGBA'
+
+def render_row(scene, row, index, spec):
+    base = os.path.join(spec["output_dir"], output_name(row, index))
+    if spec["mode"] == 'ANIMATION':
+        scene.render.filepath = base + ".mp4"
+        bpy.ops.render.render(animation=True)
+        return scene.render.filepath
+    if spec.get("frame") is not None:
+        scene.frame_set(spec["frame"])
+    bpy.ops.render.render()
+    bpy.data.images["Render Result"].save_render(base + ".png", scene=scene)
+    return base + ".png"
+
+def worker_args(spec):
+    """Command line tail that runs this module as batch worker spec["worker"] of spec["workers"]"""
+    return ["--python", __file__, "--", json.dumps(spec)]
+
+def main():
+    spec = json.loads(sys.argv[sys.argv.index("--") + 1])
+    scene = bpy.context.scene
+    binder = TemplateBinder(scene, spec.get("template"), spec.get("base_dir", ""), spec.get("blend_dir", ""))
+    setup_output(scene, spec["mode"])
+    os.makedirs(spec["output_dir"], exist_ok=True)
+    
+    # Every worker streams the whole file and takes its share of the rows
+    for index, row in enumerate(read_rows(spec["rows"])):
+        if index % spec["workers"] != spec["worker"]:
+            continue
+        try:
+            binder.bind(row)
+            path = render_row(scene, row, index, spec)
+        except Exception as error:
+            print(f"{ROW_ERROR_PREFIX}{index} {type(error).__name__}: {error}", flush=True)
+            continue
+        print(f"{ROW_PREFIX}{index} {path}", flush=True)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
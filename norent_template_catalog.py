@@ -0,0 +1,407 @@
+import bpy
+import bpy.utils.previews
+import gzip
+import io
+import json
+import os
+import re
+import struct
+import zlib
+from bpy.types import Operator, PropertyGroup
+from bpy.props import StringProperty, IntProperty, EnumProperty, BoolProperty, CollectionProperty
+
+from . import utils
+from .fingerprint import file_hash
+
+# The index and thumbnails live in the user config folder; the add-on's own
+# templates folder may be read-only on system installs
+CACHE_DIR_NAME = "norent_catalog"
+INDEX_NAME = ".norent_catalog.json"
+THUMBNAIL_DIR = ".norent_thumbnails"
+INDEX_VERSION = 1
+
+# ID block codes worth listing in the inventory
+ID_CODES = {
+    b"OB": "objects", b"MA": "materials", b"NT": "node_groups", b"IM": "images", b"SC": "scenes",
+    b"GR": "collections", b"AC": "actions", b"ME": "meshes", b"CU": "curves", b"VF": "fonts", b"WO": "worlds",
+}
+
+# DNA type names -> struct format characters
+DNA_FORMATS = {
+    "char": "b", "uchar": "B", "int8_t": "b", "uint8_t": "B", "short": "h", "ushort": "H",
+    "int16_t": "h", "uint16_t": "H", "int": "i", "uint": "I", "int32_t": "i", "uint32_t": "I",
+    "float": "f", "double": "d", "int64_t": "q", "uint64_t": "Q",
+}
+ARRAY_SIZE = re.compile(r"\[(\d+)\]")
+
+class BlendReader:
+    """Reads block headers, SDNA and a few fields of a .blend without loading it into Blender"""
+    
+    def __init__(self, path):
+        with open(path, "rb") as source:
+            magic = source.read(4)
+        if magic[:2] == b"\x1f\x8b":
+            self.file = io.BytesIO(gzip.open(path).read())
+        elif magic == b"\x28\xb5\x2f\xfd":
+            raise ValueError("zstd-compressed file")
+        else:
+            self.file = open(path, "rb")
+        try:
+            self._read_header()
+            self._read_blocks()
+        except Exception:
+            self.file.close()
+            raise
+    
+    def close(self):
+        self.file.close()
+    
+    def _read_header(self):
+        header = self.file.read(12)
+        if header[:7] != b"BLENDER":
+            raise ValueError("not a .blend file")
+        if header[7:8] in (b"_", b"-"):
+            # Legacy header: BLENDER_v293 / BLENDER-v402
+            self.pointer_size = 4 if header[7:8] == b"_" else 8
+            self.endian = "<" if header[8:9] == b"v" else ">"
+            self.version = int(header[9:12])
+            pointer = "I" if self.pointer_size == 4 else "Q"
+            self.bhead = struct.Struct(self.endian + "4si" + pointer + "ii")
+            self.bhead_fields = ("code", "length", "old", "sdna", "count")
+        else:
+            # Versioned header: BLENDER17-01v0500 with 64-bit block lengths
+            size = int(header[7:9])
+            header += self.file.read(size - 12)
+            self.pointer_size = 8
+            self.endian = "<" if header[12:13] == b"v" else ">"
+            self.version = int(header[13:17])
+            self.bhead = struct.Struct(self.endian + "4siQqq")
+            self.bhead_fields = ("code", "sdna", "old", "length", "count")
+    
+    def _read_blocks(self):
+        self.blocks = []
+        while True:
+            raw = self.file.read(self.bhead.size)
+            if len(raw) < self.bhead.size:
+                break
+            block = dict(zip(self.bhead_fields, self.bhead.unpack(raw)))
+            block["offset"] = self.file.tell()
+            if block["code"] == b"ENDB":
+                break
+            self.blocks.append(block)
+            self.file.seek(block["length"], io.SEEK_CUR)
+        dna = next((block for block in self.blocks if block["code"] == b"DNA1"), None)
+        if dna is None:
+            raise ValueError("no SDNA block")
+        self._read_sdna(self.read(dna))
+    
+    def read(self, block, size=None):
+        self.file.seek(block["offset"])
+        return self.file.read(block["length"] if size is None else min(size, block["length"]))
+    
+    def _read_sdna(self, data):
+        position = 8  # "SDNA" "NAME"
+        
+        def strings(count):
+            nonlocal position
+            values = []
+            for _ in range(count):
+                end = data.index(b"\0", position)
+                values.append(data[position:end].decode("latin-1"))
+                position = end + 1
+            return values
+        
+        def align():
+            nonlocal position
+            position = (position + 3) & ~3
+        
+        (count,) = struct.unpack_from(self.endian + "i", data, position)
+        position += 4
+        names = strings(count)
+        align()
+        (count,) = struct.unpack_from(self.endian + "i", data, position + 4)
+        position += 8
+        self.types = strings(count)
+        align()
+        self.type_sizes = struct.unpack_from(self.endian + f"{count}h", data, position + 4)
+        position += 4 + 2 * count
+        align()
+        (count,) = struct.unpack_from(self.endian + "i", data, position + 4)
+        position += 8
+        
+        # struct name -> {field: (offset, type name, is pointer, array length)}
+        self.structs = []
+        self.struct_fields = {}
+        for _ in range(count):
+            type_index, field_count = struct.unpack_from(self.endian + "hh", data, position)
+            position += 4
+            fields = {}
+            offset = 0
+            for _ in range(field_count):
+                field_type, field_name = struct.unpack_from(self.endian + "hh", data, position)
+                position += 4
+                name = names[field_name]
+                length = 1
+                for size in ARRAY_SIZE.findall(name):
+                    length *= int(size)
+                pointer = "*" in name
+                size = self.pointer_size if pointer else self.type_sizes[field_type]
+                identifier = ARRAY_SIZE.sub("", name).strip("*()")
+                fields[identifier] = (offset, self.types[field_type], pointer, length)
+                offset += size * length
+            self.structs.append(self.types[type_index])
+            self.struct_fields[self.types[type_index]] = fields
+    
+    def field(self, struct_name, path):
+        """(offset, type, is pointer, array length) of a dotted field path inside a struct"""
+        offset = 0
+        for part in path.split("."):
+            field_offset, type_name, pointer, length = self.struct_fields[struct_name][part]
+            offset += field_offset
+            struct_name = type_name
+        return offset, type_name, pointer, length
+    
+    def value(self, data, struct_name, path):
+        offset, type_name, pointer, length = self.field(struct_name, path)
+        if type_name == "char" and length > 1:
+            return data[offset:offset + length].split(b"\0", 1)[0].decode("utf-8", "replace")
+        return struct.unpack_from(self.endian + DNA_FORMATS[type_name], data, offset)[0]
+    
+    def inventory(self):
+        """{kind: [names]} of the IDs stored in the file"""
+        name_offset, _, _, name_length = self.field("ID", "name")
+        found = {}
+        for block in self.blocks:
+            kind = ID_CODES.get(block["code"][:2])
+            if kind and block["code"][2:] == b"\0\0":
+                raw = self.read(block, name_offset + name_length)
+                name = raw[name_offset + 2:].split(b"\0", 1)[0].decode("utf-8", "replace")
+                found.setdefault(kind, []).append(name)
+        return found
+    
+    def scene_settings(self):
+        """Frame range, resolution and fps of the first scene"""
+        block = next((block for block in self.blocks if block["code"] == b"SC\0\0"), None)
+        if block is None:
+            return None
+        data = self.read(block)
+        return {
+            "frame_start": self.value(data, "Scene", "r.sfra"),
+            "frame_end": self.value(data, "Scene", "r.efra"),
+            "resolution": [self.value(data, "Scene", "r.xsch"), self.value(data, "Scene", "r.ysch")],
+            "fps": self.value(data, "Scene", "r.frs_sec"),
+        }
+    
+    def thumbnail(self):
+        """(width, height, top-down RGBA bytes) of the embedded file preview, or None"""
+        block = next((block for block in self.blocks if block["code"] == b"TEST"), None)
+        if block is None:
+            return None
+        data = self.read(block)
+        width, height = struct.unpack_from(self.endian + "ii", data, 0)
+        if width <= 0 or height <= 0 or len(data) < 8 + width * height * 4:
+            return None
+        stride = width * 4
+        rows = [data[8 + row * stride:8 + (row + 1) * stride] for row in range(height)]
+        return width, height, b"".join(reversed(rows))
+
+def png_bytes(width, height, rgba):
+    """Minimal RGBA PNG encoder for thumbnails"""
+    def chunk(kind, payload):
+        return struct.pack(">I", len(payload)) + kind + payload + struct.pack(">I", zlib.crc32(kind + payload))
+    stride = width * 4
+    raw = b"".join(b"\0" + rgba[row * stride:(row + 1) * stride] for row in range(height))
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(raw, 6)) + chunk(b"IEND", b""))
+
+def preset_for(resolution, fps):
+    for preset, (width, height, preset_fps) in utils.RENDER_PRESETS.items():
+        if [width, height] == list(resolution) and preset_fps == fps:
+            return preset
+    return 'CUSTOM'
+
+def linked_inventory(path):
+    """Fallback inventory through Blender's library reader (e.g. zstd-compressed files)"""
+    with bpy.data.libraries.load(path) as (data_from, data_to):
+        return {kind: list(getattr(data_from, kind)) for kind in set(ID_CODES.values()) if getattr(data_from, kind, None)}
+
+def scan_template(path, thumbnail_dir):
+    """Index entry for one template file"""
+    stat = os.stat(path)
+    name = os.path.splitext(os.path.basename(path))[0]
+    entry = {
+        "name": name, "file": os.path.basename(path), "mtime": stat.st_mtime, "size": stat.st_size,
+        "hash": file_hash(path), "inventory": {}, "frame_start": None, "frame_end": None,
+        "preset": None, "thumbnail": None,
+    }
+    try:
+        reader = BlendReader(path)
+    except (ValueError, KeyError, struct.error):
+        entry["inventory"] = linked_inventory(path)
+        return entry
+    try:
+        entry["inventory"] = reader.inventory()
+        settings = reader.scene_settings()
+        if settings:
+            entry.update(frame_start=settings["frame_start"], frame_end=settings["frame_end"],
+                         preset=preset_for(settings["resolution"], settings["fps"]))
+        thumbnail = reader.thumbnail()
+        if thumbnail:
+            thumbnail_name = f"{name}.png"
+            try:
+                os.makedirs(thumbnail_dir, exist_ok=True)
+                with open(os.path.join(thumbnail_dir, thumbnail_name), "wb") as image:
+                    image.write(png_bytes(*thumbnail))
+                entry["thumbnail"] = thumbnail_name
+            except OSError:
+                pass  # No writable cache; list it without a thumbnail
+    except (KeyError, struct.error):
+        pass  # Unusual DNA; keep what was read
+    finally:
+        reader.close()
+    return entry
+
+def templates_dir():
+    return os.path.join(os.path.dirname(os.path.realpath(__file__)), "templates")
+
+def cache_dir():
+    return bpy.utils.user_resource('CONFIG', path=CACHE_DIR_NAME)
+
+# Last index per cache folder, used when it can't be written to disk
+_memory_index = {}
+
+def load_index(cache):
+    try:
+        with open(os.path.join(cache, INDEX_NAME)) as index_file:
+            index = json.load(index_file)
+    except (OSError, ValueError):
+        return {}
+    return index.get("templates", {}) if index.get("version") == INDEX_VERSION else {}
+
+def update_index(directory, cache, force=False):
+    """Re-scan templates whose mtime or size changed; returns (entries, rescanned count)"""
+    entries = load_index(cache) or _memory_index.get(cache, {})
+    files = sorted(name for name in os.listdir(directory) if name.endswith(".blend")) if os.path.isdir(directory) else []
+    thumbnail_dir = os.path.join(cache, THUMBNAIL_DIR)
+    updated = {}
+    rescanned = 0
+    for name in files:
+        path = os.path.join(directory, name)
+        stat = os.stat(path)
+        entry = entries.get(name)
+        if not force and entry and entry["mtime"] == stat.st_mtime and entry["size"] == stat.st_size:
+            updated[name] = entry
+            continue
+        if not force and entry and entry["hash"] == file_hash(path):
+            # Touched or copied but unchanged
+            updated[name] = dict(entry, mtime=stat.st_mtime)
+            continue
+        updated[name] = scan_template(path, thumbnail_dir)
+        rescanned += 1
+    
+    _memory_index[cache] = updated
+    if updated != entries or not os.path.exists(os.path.join(cache, INDEX_NAME)):
+        try:
+            os.makedirs(cache, exist_ok=True)
+            with open(os.path.join(cache, INDEX_NAME), "w") as index_file:
+                json.dump({"version": INDEX_VERSION, "templates": updated}, index_file, indent=1)
+        except OSError:
+            pass  # Read-only config; the in-memory index still saves rescans this session
+    return updated, rescanned
+
+# Thumbnail icons, loaded on first draw
+_previews = None
+
+def thumbnail_icon(item):
+    if not item.thumbnail or _previews is None:
+        return 0
+    preview = _previews.get(item.thumbnail)
+    if preview is None:
+        preview = _previews.load(item.thumbnail, item.thumbnail, 'IMAGE')
+    return preview.icon_id
+
+def fill_catalog(catalog, entries, directory, cache):
+    catalog.clear()
+    for name, entry in sorted(entries.items(), key=lambda pair: pair[1]["name"].lower()):
+        item = catalog.add()
+        item.name = entry["name"]
+        item.filepath = os.path.join(directory, name)
+        item.preset = entry["preset"] or ""
+        item.frame_start = entry["frame_start"] or 0
+        item.frame_end = entry["frame_end"] or 0
+        item.objects = len(entry["inventory"].get("objects", ()))
+        item.materials = len(entry["inventory"].get("materials", ()))
+        item.thumbnail = os.path.join(cache, THUMBNAIL_DIR, entry["thumbnail"]) if entry["thumbnail"] else ""
+
+def refresh_catalog(window_manager, force=False):
+    directory, cache = templates_dir(), cache_dir()
+    entries, rescanned = update_index(directory, cache, force)
+    fill_catalog(window_manager.norent_templates, entries, directory, cache)
+    return len(entries), rescanned
+
+class NorentTemplateItem(PropertyGroup):
+    filepath: StringProperty(subtype='FILE_PATH')
+    preset: StringProperty()
+    frame_start: IntProperty()
+    frame_end: IntProperty()
+    objects: IntProperty()
+    materials: IntProperty()
+    thumbnail: StringProperty(subtype='FILE_PATH')
+
+class NORENT_OT_TemplateCatalogRefresh(Operator):
+    """Re-index the templates directory"""
+    bl_idname = "norent.template_catalog_refresh"
+    bl_label = "Refresh Templates"
+    bl_description = "Scan templates whose files changed since the last index and update the catalog"
+    
+    force: BoolProperty(
+        name="Rescan All",
+        description="Re-read every template instead of only changed ones",
+        default=False
+    )
+    
+    def execute(self, context):
+        if _previews is not None:
+            _previews.clear()
+        total, rescanned = refresh_catalog(context.window_manager, self.force)
+        self.report({'INFO'}, f"{total} templates ({rescanned} re-indexed)")
+        return {'FINISHED'}
+
+def _refresh_on_startup():
+    refresh_catalog(bpy.context.window_manager)
+    return None
+
+# Registration
+classes = [
+    NorentTemplateItem,
+    NORENT_OT_TemplateCatalogRefresh,
+]
+
+def register():
+    global _previews
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    
+    bpy.types.WindowManager.norent_templates = CollectionProperty(type=NorentTemplateItem)
+    bpy.types.WindowManager.norent_template_index = IntProperty()
+    bpy.types.WindowManager.norent_template_filter = EnumProperty(
+        name="Preset",
+        description="Only list templates made for this preset",
+        items=[('ALL', "All Presets", "")] + [(preset, preset.title(), "") for preset in utils.RENDER_PRESETS] + [('CUSTOM', "Custom", "")]
+    )
+    _previews = bpy.utils.previews.new()
+    bpy.app.timers.register(_refresh_on_startup, first_interval=0.5)
+
+def unregister():
+    global _previews
+    if bpy.app.timers.is_registered(_refresh_on_startup):
+        bpy.app.timers.unregister(_refresh_on_startup)
+    bpy.utils.previews.remove(_previews)
+    _previews = None
+    
+    del bpy.types.WindowManager.norent_template_filter
+    del bpy.types.WindowManager.norent_template_index
+    del bpy.types.WindowManager.norent_templates
+    
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
\ No newline at end of file
@@ -0,0 +1,209 @@
+import bpy
+import os
+import time
+from bpy.types import Operator
+from bpy.props import BoolProperty
+
+# Local collection that wraps a linked template; it is only ever instanced,
+# never linked into a scene, so every insert shares one copy of the library
+TEMPLATE_KEY = "norent_template"
+
+SHARED_TYPES = ('objects', 'meshes', 'curves', 'materials', 'node_groups', 'images')
+
+def datablock_counts():
+    """Local datablocks per type; linked data doesn't grow with each insert"""
+    return {
+        attr: sum(1 for block in getattr(bpy.data, attr) if not block.library)
+        for attr in SHARED_TYPES
+    }
+
+def template_wrapper(path):
+    """Wrapper collection of an already linked template, if any"""
+    path = os.path.normpath(bpy.path.abspath(path))
+    for collection in bpy.data.collections:
+        if not collection.library and collection.get(TEMPLATE_KEY) == path:
+            return collection
+    return None
+
+def link_template(path):
+    """Link a template .blend once and return the collection to instance"""
+    wrapper = template_wrapper(path)
+    if wrapper:
+        return wrapper
+    
+    path = os.path.normpath(bpy.path.abspath(path))
+    with bpy.data.libraries.load(path, link=True) as (data_from, data_to):
+        data_to.collections = data_from.collections
+        if not data_from.collections:
+            data_to.objects = data_from.objects
+    
+    wrapper = bpy.data.collections.new("NORENT_" + os.path.splitext(os.path.basename(path))[0])
+    wrapper[TEMPLATE_KEY] = path
+    collections = [c for c in data_to.collections if c]
+    if collections:
+        # Only the top-level collections; their children come along
+        children = {child for c in collections for child in c.children_recursive}
+        for collection in collections:
+            if collection not in children:
+                wrapper.children.link(collection)
+    else:
+        # Instancing only draws the collection's own objects, children included
+        for obj in data_to.objects:
+            if obj:
+                wrapper.objects.link(obj)
+    return wrapper
+
+def template_instances(wrapper):
+    return [obj for obj in bpy.data.objects
+            if obj.instance_type == 'COLLECTION' and obj.instance_collection == wrapper]
+
+def instance_template(context, path):
+    """Add a collection instance of a template at the 3D cursor.
+    
+    Returns (instance, seconds, added) where added is the number of local
+    datablocks created per type; after the first insert that is just the empty.
+    """
+    before = datablock_counts()
+    start = time.perf_counter()
+    wrapper = link_template(path)
+    
+    instance = bpy.data.objects.new(wrapper.name, None)
+    instance.instance_type = 'COLLECTION'
+    instance.instance_collection = wrapper
+    instance.location = context.scene.cursor.location
+    context.collection.objects.link(instance)
+    
+    for obj in context.selected_objects:
+        obj.select_set(False)
+    instance.select_set(True)
+    context.view_layer.objects.active = instance
+    
+    elapsed = time.perf_counter() - start
+    after = datablock_counts()
+    added = {attr: after[attr] - before[attr] for attr in SHARED_TYPES if after[attr] != before[attr]}
+    return instance, elapsed, added
+
+def shared_summary(wrapper):
+    """Linked datablocks behind a wrapper, counted once however many instances use it"""
+    library = None
+    for obj in wrapper.all_objects:
+        if obj.library:
+            library = obj.library
+            break
+    if not library:
+        return ""
+    counts = []
+    for attr in ('meshes', 'materials', 'node_groups', 'images'):
+        count = sum(1 for block in getattr(bpy.data, attr) if block.library == library)
+        if count:
+            counts.append(f"{count} {attr.replace('_', ' ')}")
+    return ", ".join(counts)
+
+def format_added(added):
+    if not added:
+        return "no new datablocks"
+    return ", ".join(f"{count} {attr.replace('_', ' ')}" for attr, count in added.items())
+
+def make_editable(context, instance, text=True, colors=True):
+    """Replace one template instance with library overrides.
+    
+    Objects are overridden so they can move; only text curves and materials
+    (when asked) get local copies, meshes stay linked to the library.
+    Returns the overridden objects.
+    """
+    wrapper = instance.instance_collection
+    matrix = instance.matrix_world.copy()
+    roots = list(wrapper.children) or [obj for obj in wrapper.objects if not obj.parent]
+    
+    overrides = []
+    for root in roots:
+        override = root.override_hierarchy_create(context.scene, context.view_layer)
+        if not override:
+            continue
+        if isinstance(override, bpy.types.Collection):
+            overrides.extend(override.all_objects)
+        else:
+            overrides.append(override)
+    
+    copied = {}
+    for obj in overrides:
+        # Only the hierarchy root is user-editable by default; the rest are
+        # system overrides whose properties are read-only. Object data keeps
+        # its system override.
+        if obj.override_library and obj.override_library.is_system_override:
+            obj.override_library.is_system_override = False
+        if not obj.parent:
+            obj.matrix_world = matrix @ obj.matrix_world
+        if text and obj.type == 'FONT' and obj.data.library:
+            # Body text is not overridable; a local curve is small
+            obj.data = obj.data.copy()
+        if colors:
+            for slot in obj.material_slots:
+                material = slot.material
+                if not material or not material.library:
+                    continue
+                if slot.link == 'DATA' and obj.data.library:
+                    slot.link = 'OBJECT'
+                if material.name_full not in copied:
+                    copied[material.name_full] = material.copy()
+                slot.material = copied[material.name_full]
+    
+    bpy.data.objects.remove(instance)
+    return overrides
+
+class NORENT_OT_TemplateMakeEditable(Operator):
+    """Turn a linked template instance into editable overrides"""
+    bl_idname = "norent.template_make_editable"
+    bl_label = "Make Template Editable"
+    bl_description = "Override the active template instance so its text and colors can be edited; meshes stay shared with the library"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    text: BoolProperty(
+        name="Edit Text",
+        description="Give text objects a local curve so the body can be changed",
+        default=True
+    )
+    
+    colors: BoolProperty(
+        name="Edit Colors",
+        description="Give this instance local copies of its materials",
+        default=True
+    )
+    
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return (obj is not None and obj.instance_type == 'COLLECTION'
+                and obj.instance_collection is not None
+                and TEMPLATE_KEY in obj.instance_collection)
+    
+    def execute(self, context):
+        instance = context.active_object
+        before = datablock_counts()
+        start = time.perf_counter()
+        overrides = make_editable(context, instance, self.text, self.colors)
+        if not overrides:
+            self.report({'ERROR'}, "Could not override the template instance")
+            return {'CANCELLED'}
+        elapsed = time.perf_counter() - start
+        after = datablock_counts()
+        added = {attr: after[attr] - before[attr] for attr in SHARED_TYPES if after[attr] != before[attr]}
+        
+        self.report({'INFO'}, f"Overrode {len(overrides)} objects in {elapsed * 1000:.0f} ms ({format_added(added)})")
+        return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+# Registration
+classes = [
+    NORENT_OT_TemplateMakeEditable,
+]
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
\ No newline at end of file
@@ -0,0 +1,320 @@
+import bpy
+import os
+import numpy as np
+from mathutils import Matrix
+from bpy.types import Operator, PropertyGroup
+from bpy.props import BoolProperty, IntProperty, PointerProperty
+from bpy.app.handlers import persistent
+
+from .camera_rigs import rig_objects, mute_rig_object, unmute_all
+
+CACHE_OWNER = "transform_cache"
+
+# Baked caches per scene name:
+# {"names": [...], "start": int, "matrices": (frames, objects, 2, 4, 4) array, "path": str or None}
+# Slot 0 holds the evaluated world matrix, slot 1 the local matrix that reproduces it.
+_caches = {}
+# True while the playback handler writes cached transforms
+_applying = False
+
+def _engage(self, context):
+    scene = context.scene
+    if self.use_cache and scene.name in _caches:
+        engage_cache(scene)
+    else:
+        release_cache(scene)
+
+class NorentTransformCache(PropertyGroup):
+    use_cache: BoolProperty(
+        name="Use Scrub Cache",
+        description="Play NORENT rigs back from baked world matrices instead of re-evaluating them",
+        default=False,
+        update=_engage
+    )
+    
+    mmap_threshold: IntProperty(
+        name="Memory-Map Above",
+        description="Store the cache as a memory-mapped .npy next to the .blend above this many frames",
+        default=3000,
+        min=1
+    )
+
+def collect_rig_objects(scene):
+    """Every object of every NORENT rig in the scene, parents before children"""
+    members = []
+    for obj in scene.objects:
+        if obj.get("norent_rig") is not None:
+            for member in rig_objects(obj):
+                if member not in members and member.name in scene.objects:
+                    members.append(member)
+    
+    def depth(obj):
+        level = 0
+        while obj.parent:
+            obj = obj.parent
+            level += 1
+        return level
+    return sorted(members, key=depth)
+
+def cache_path(scene):
+    """Location of the memory-mapped cache, or None for unsaved files"""
+    if not bpy.data.filepath:
+        return None
+    cache_dir = os.path.join(bpy.path.abspath("//"), "NORENT_Cache")
+    if not os.path.exists(cache_dir):
+        os.makedirs(cache_dir)
+    return os.path.join(cache_dir, f"{bpy.path.clean_name(scene.name)}_transforms.npy")
+
+def bake_cache(scene):
+    """Evaluate the rigs once per frame and store their matrices"""
+    invalidate_cache(scene)
+    objects = collect_rig_objects(scene)
+    if not objects:
+        return None
+    
+    start, end = scene.frame_start, scene.frame_end
+    shape = (end - start + 1, len(objects), 2, 4, 4)
+    path = cache_path(scene) if shape[0] > scene.norent_transform_cache.mmap_threshold else None
+    if path:
+        matrices = np.lib.format.open_memmap(path, mode='w+', dtype=np.float32, shape=shape)
+    else:
+        matrices = np.empty(shape, dtype=np.float32)
+    
+    original_frame = scene.frame_current
+    for f in range(shape[0]):
+        scene.frame_set(start + f)
+        for i, obj in enumerate(objects):
+            world = obj.matrix_world
+            if obj.parent:
+                local = (obj.parent.matrix_world @ obj.matrix_parent_inverse).inverted_safe() @ world
+            else:
+                local = world
+            matrices[f, i, 0] = world
+            matrices[f, i, 1] = local
+    scene.frame_set(original_frame)
+    
+    if path:
+        matrices.flush()
+        del matrices
+        matrices = np.load(path, mmap_mode='r')
+    
+    _caches[scene.name] = {
+        "names": [obj.name for obj in objects],
+        "actions": {obj.animation_data.action.name for obj in objects
+                    if obj.animation_data and obj.animation_data.action},
+        "start": start,
+        "matrices": matrices,
+        "path": path,
+    }
+    return _caches[scene.name]
+
+def detach_animation(obj):
+    """Take an object's action and NLA off so keyframes can't overwrite matrix_basis.
+    
+    Returns what reattach_animation needs, or None when nothing was animated.
+    """
+    anim = obj.animation_data
+    if not anim or (not anim.action and not anim.use_nla):
+        return None
+    # Actions can be shared between objects, so detach instead of muting F-curves
+    state = {"action": anim.action, "slot": getattr(anim, "action_slot", None), "use_nla": anim.use_nla}
+    anim.action = None
+    anim.use_nla = False
+    return state
+
+def reattach_animation(obj, state):
+    anim = obj.animation_data or obj.animation_data_create()
+    anim.action = state["action"]
+    if state["slot"] is not None and anim.action:
+        anim.action_slot = state["slot"]
+    anim.use_nla = state["use_nla"]
+
+def engage_cache(scene):
+    """Mute the rig chain and its keyframes so only cached transforms are applied"""
+    cache = _caches.get(scene.name)
+    if not cache or cache.get("basis"):
+        return
+    # Keep the authored transforms; playback overwrites matrix_basis
+    cache["basis"] = {}
+    cache["animation"] = {}
+    for name in cache["names"]:
+        obj = bpy.data.objects.get(name)
+        if obj:
+            cache["basis"][name] = obj.matrix_basis.copy()
+            mute_rig_object(obj, CACHE_OWNER)
+            state = detach_animation(obj)
+            if state:
+                cache["animation"][name] = state
+    apply_cached_frame(scene, scene.frame_current)
+
+def release_cache(scene, keep=()):
+    """Give the rigs back to live evaluation, restoring authored transforms except keep"""
+    global _applying
+    cache = _caches.get(scene.name)
+    if not cache or not cache.get("basis"):
+        return
+    _applying = True
+    for name, basis in cache.pop("basis").items():
+        obj = bpy.data.objects.get(name)
+        if obj and name not in keep:
+            obj.matrix_basis = basis
+    for name, state in cache.pop("animation", {}).items():
+        obj = bpy.data.objects.get(name)
+        if obj:
+            reattach_animation(obj, state)
+    unmute_all(CACHE_OWNER)
+
+def invalidate_cache(scene, edited=()):
+    """Drop a cache after its rigs were edited, keeping the edited transforms"""
+    release_cache(scene, keep=edited)
+    cache = _caches.pop(scene.name, None)
+    if cache:
+        cache["matrices"] = None
+
+def apply_cached_frame(scene, frame):
+    """Write the cached local matrices for frame onto the rig objects"""
+    global _applying
+    cache = _caches.get(scene.name)
+    if not cache:
+        return
+    matrices = cache["matrices"]
+    f = min(max(frame - cache["start"], 0), len(matrices) - 1)
+    
+    _applying = True
+    for i, name in enumerate(cache["names"]):
+        obj = bpy.data.objects.get(name)
+        if obj:
+            obj.matrix_basis = Matrix(matrices[f, i, 1].tolist())
+
+def _engaged(scene):
+    settings = getattr(scene, "norent_transform_cache", None)
+    return settings is not None and settings.use_cache and scene.name in _caches
+
+@persistent
+def cache_frame_change_pre(scene, depsgraph=None):
+    if _engaged(scene):
+        apply_cached_frame(scene, scene.frame_current)
+
+@persistent
+def cache_frame_change_post(scene, depsgraph=None):
+    global _applying
+    _applying = False
+
+@persistent
+def cache_depsgraph_update_post(scene, depsgraph):
+    global _applying
+    if _applying:
+        # This update round was caused by the cache itself
+        _applying = False
+        return
+    cache = _caches.get(scene.name)
+    if not cache:
+        return
+    
+    names = set(cache["names"])
+    edited = set()
+    for update in depsgraph.updates:
+        original = getattr(update.id, "original", update.id)
+        if isinstance(original, bpy.types.Object) and original.name in names:
+            edited.add(original.name)
+        elif isinstance(original, bpy.types.Action) and original.name in cache["actions"]:
+            edited.add(None)
+    if edited:
+        invalidate_cache(scene, edited)
+
+@persistent
+def cache_save_pre(dummy):
+    # Never save rigs muted
+    for scene_name in list(_caches):
+        scene = bpy.data.scenes.get(scene_name)
+        if scene:
+            release_cache(scene)
+
+@persistent
+def cache_save_post(dummy):
+    for scene_name in list(_caches):
+        scene = bpy.data.scenes.get(scene_name)
+        if scene and scene.norent_transform_cache.use_cache:
+            engage_cache(scene)
+
+@persistent
+def cache_load_post(dummy):
+    _caches.clear()
+
+class NORENT_OT_TransformCacheBake(Operator):
+    """Bake NORENT rig transforms for smooth scrubbing"""
+    bl_idname = "norent.transform_cache_bake"
+    bl_label = "Bake Scrub Cache"
+    bl_description = "Evaluate all NORENT rigs once per frame and scrub from the stored matrices"
+    
+    def execute(self, context):
+        scene = context.scene
+        cache = bake_cache(scene)
+        if not cache:
+            self.report({'WARNING'}, "No NORENT rigs in scene")
+            return {'CANCELLED'}
+        
+        # The update callback engages the cache
+        scene.norent_transform_cache.use_cache = True
+        
+        storage = os.path.basename(cache["path"]) if cache["path"] else "RAM"
+        self.report({'INFO'}, f"Cached {len(cache['names'])} rig objects over {len(cache['matrices'])} frames ({storage})")
+        return {'FINISHED'}
+
+class NORENT_OT_TransformCacheClear(Operator):
+    """Clear the rig scrub cache"""
+    bl_idname = "norent.transform_cache_clear"
+    bl_label = "Clear Scrub Cache"
+    bl_description = "Return NORENT rigs to live evaluation"
+    
+    def execute(self, context):
+        scene = context.scene
+        invalidate_cache(scene)
+        scene.norent_transform_cache.use_cache = False
+        
+        self.report({'INFO'}, "Scrub cache cleared")
+        return {'FINISHED'}
+
+def cache_status(scene):
+    """Short status line for the UI"""
+    cache = _caches.get(scene.name)
+    if not cache:
+        return "Not baked"
+    storage = "mmap" if cache["path"] else "RAM"
+    return f"{len(cache['names'])} objects, {len(cache['matrices'])} frames ({storage})"
+
+# Registration
+classes = [
+    NorentTransformCache,
+    NORENT_OT_TransformCacheBake,
+    NORENT_OT_TransformCacheClear,
+]
+
+handlers = [
+    (bpy.app.handlers.frame_change_pre, cache_frame_change_pre),
+    (bpy.app.handlers.frame_change_post, cache_frame_change_post),
+    (bpy.app.handlers.depsgraph_update_post, cache_depsgraph_update_post),
+    (bpy.app.handlers.save_pre, cache_save_pre),
+    (bpy.app.handlers.save_post, cache_save_post),
+    (bpy.app.handlers.load_post, cache_load_post),
+]
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    
+    bpy.types.Scene.norent_transform_cache = PointerProperty(type=NorentTransformCache)
+    for handler_list, handler in handlers:
+        handler_list.append(handler)
+
+def unregister():
+    for handler_list, handler in handlers:
+        handler_list.remove(handler)
+    for scene in bpy.data.scenes:
+        release_cache(scene)
+    _caches.clear()
+    
+    del bpy.types.Scene.norent_transform_cache
+    
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
\ No newline at end of file
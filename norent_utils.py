@@ -1,9 +1,126 @@
 import bpy
 import os
+import subprocess
+import time
 from bpy.types import Operator
-from bpy.props import StringProperty, EnumProperty, BoolProperty
+from bpy.props import StringProperty, EnumProperty, BoolProperty, IntProperty, FloatProperty
 from mathutils import Vector
 
+from .render_jobs import BackgroundRenderMixin, can_run_modal, prepare_frames_dir, sequence_files, SEQUENCE_PREFIX
+from .render_jobs import find_ffmpeg, stream_scene, encode_command, sequence_settings
+from .render_cache import CACHE_DIR_NAME, analyze_frames, plan_holds, held_count, restore_hits, store_frames, evict, cache_report
+from .render_jobs import fill_holds, format_duration, default_workers, save_snapshot, blender_command, TemplateBatchJob
+from .preview_budget import PreviewModel, choose_plan, describe_plan, preview_settings, record_actual, sample_property
+from .frame_pipe import format_stats
+from .gif import GIF_QUALITY, GifEncodeJob
+from . import shader_warmup
+from . import template_batch
+from . import template_catalog
+from . import template_link
+from . import dedup
+
+# Resolution and fps for each render preset
+RENDER_PRESETS = {
+    'REEL': (1080, 1920, 30),
+    'SQUARE': (1080, 1080, 30),
+    'STORY': (1080, 1920, 30),
+    'LANDSCAPE': (1920, 1080, 30),
+}
+
+def apply_preset_resolution(scene):
+    """Apply the NORENT preset's resolution and fps (CUSTOM keeps current settings)"""
+    preset = RENDER_PRESETS.get(scene.norent.render_preset)
+    if preset:
+        scene.render.resolution_x, scene.render.resolution_y, scene.render.fps = preset
+
+def apply_render_preset(scene, animation=False):
+    """Apply the preset resolution plus PNG (stills) or H.264 MP4 (animations) output"""
+    apply_preset_resolution(scene)
+    render = scene.render
+    if animation:
+        render.image_settings.file_format = 'FFMPEG'
+        render.ffmpeg.format = 'MPEG4'
+        render.ffmpeg.codec = 'H264'
+        render.ffmpeg.constant_rate_factor = 'HIGH'
+    else:
+        render.image_settings.file_format = 'PNG'
+        render.image_settings.color_mode = 'RGBA'
+
+# Quality tiers, relative to the scene as authored. None leaves a setting
+# untouched; FINAL renders exactly what the artist set up.
+QUALITY_TIERS = {
+    'DRAFT': {
+        "samples": 0.125,
+        "simplify_subdivision": 0,
+        "simplify_particles": 0.25,
+        "persistent_data": True,
+        "curve_resolution": 0.25,
+        "motion_blur": False,
+        "denoise": True,
+    },
+    'REVIEW': {
+        "samples": 0.5,
+        "simplify_subdivision": 2,
+        "simplify_particles": 0.5,
+        "persistent_data": True,
+        "curve_resolution": 0.5,
+        "motion_blur": None,
+        "denoise": True,
+    },
+    'FINAL': {
+        "samples": 1.0,
+        "simplify_subdivision": None,
+        "simplify_particles": None,
+        "persistent_data": None,
+        "curve_resolution": 1.0,
+        "motion_blur": None,
+        "denoise": None,
+    },
+}
+
+def scene_curves(scene):
+    """Curve and text datablocks of objects in the scene"""
+    return list({obj.data for obj in scene.objects if obj.type in {'CURVE', 'FONT'} and obj.data.users})
+
+def quality_settings(scene, tier=None):
+    """Apply a quality tier (default: the scene's) on top of the authored settings; returns a restore callback"""
+    settings = QUALITY_TIERS[tier or scene.norent.quality_tier]
+    render = scene.render
+    cycles = getattr(scene, "cycles", None) if render.engine == 'CYCLES' else None
+    undo = []
+    
+    def assign(struct, attribute, value):
+        undo.append((struct, attribute, getattr(struct, attribute)))
+        setattr(struct, attribute, value)
+    
+    struct, attribute = sample_property(scene)
+    if struct and settings["samples"] != 1.0:
+        assign(struct, attribute, max(1, round(getattr(struct, attribute) * settings["samples"])))
+    if settings["simplify_subdivision"] is not None:
+        assign(render, "use_simplify", True)
+        assign(render, "simplify_subdivision_render", min(render.simplify_subdivision_render, settings["simplify_subdivision"]))
+        assign(render, "simplify_child_particles_render", render.simplify_child_particles_render * settings["simplify_particles"])
+    if settings["persistent_data"] is not None:
+        assign(render, "use_persistent_data", settings["persistent_data"])
+    if settings["motion_blur"] is not None:
+        assign(render, "use_motion_blur", settings["motion_blur"])
+        if hasattr(scene.eevee, "use_motion_blur"):
+            # Eevee kept its own toggle before 4.2
+            assign(scene.eevee, "use_motion_blur", settings["motion_blur"])
+    if settings["denoise"] is not None and cycles:
+        assign(cycles, "use_denoising", settings["denoise"])
+    if settings["curve_resolution"] != 1.0:
+        factor = settings["curve_resolution"]
+        for curve in scene_curves(scene):
+            # render_resolution_u of 0 falls back to the viewport resolution
+            assign(curve, "render_resolution_u", max(1, round((curve.render_resolution_u or curve.resolution_u) * factor)))
+            assign(curve, "bevel_resolution", round(curve.bevel_resolution * factor))
+    
+    def restore():
+        for struct, attribute, value in reversed(undo):
+            setattr(struct, attribute, value)
+    return restore
+
 class NORENT_OT_RenderStill(Operator):
     """Render current frame with preset settings"""
     bl_idname = "norent.render_still"
@@ -11,89 +128,193 @@ class NORENT_OT_RenderStill(Operator):
     bl_description = "Render current frame with NORENT settings"
     
     def execute(self, context):
+        scene = context.scene
+        
         # Apply render preset
-        self.apply_render_preset(context)
+        apply_render_preset(scene)
         
-        # Render
-        bpy.ops.render.render(use_viewport=True)
+        # Render at the scene's quality tier
+        restore = quality_settings(scene)
+        try:
+            bpy.ops.render.render(use_viewport=True)
+        finally:
+            restore()
         
-        self.report({'INFO'}, "Still frame rendered")
+        self.report({'INFO'}, f"Still frame rendered ({scene.norent.quality_tier.title()})")
         return {'FINISHED'}
-    
-    def apply_render_preset(self, context):
-        """Apply render settings based on preset"""
-        scene = context.scene
-        render = scene.render
-        preset = scene.norent.render_preset
-        
-        if preset == 'REEL':
-            render.resolution_x = 1080
-            render.resolution_y = 1920
-            render.fps = 30
-        elif preset == 'SQUARE':
-            render.resolution_x = 1080
-            render.resolution_y = 1080
-            render.fps = 30
-        elif preset == 'STORY':
-            render.resolution_x = 1080
-            render.resolution_y = 1920
-            render.fps = 30
-        elif preset == 'LANDSCAPE':
-            render.resolution_x = 1920
-            render.resolution_y = 1080
-            render.fps = 30
-        
-        # Set output format
-        render.image_settings.file_format = 'PNG'
-        render.image_settings.color_mode = 'RGBA'
 
-class NORENT_OT_RenderAnimation(Operator):
+class NORENT_OT_RenderAnimation(BackgroundRenderMixin, Operator):
     """Render animation with preset settings"""
     bl_idname = "norent.render_animation"
     bl_label = "Render Animation"
     bl_description = "Render full animation with NORENT settings"
     
+    background: BoolProperty(
+        name="Background",
+        description="Render in a separate Blender process and keep working meanwhile",
+        default=True
+    )
+    
+    parallel: BoolProperty(
+        name="Parallel",
+        description="Split the frame range across several headless Blender workers",
+        default=False
+    )
+    
+    workers: IntProperty(
+        name="Workers",
+        description="Number of worker processes (0 = fill all cores)",
+        default=0,
+        min=0,
+        max=128
+    )
+    
+    threads_per_worker: IntProperty(
+        name="Threads per Worker",
+        description="Render threads for each worker (0 = automatic)",
+        default=0,
+        min=0,
+        max=256
+    )
+    
+    incremental: BoolProperty(
+        name="Incremental",
+        description="Reuse cached frames whose inputs haven't changed and only render the rest",
+        default=False
+    )
+    
+    cache_limit: FloatProperty(
+        name="Cache Limit (GB)",
+        description="Size of the frame cache before least recently used frames are evicted",
+        default=10.0,
+        min=0.1,
+        max=1000.0
+    )
+    
+    render_holds_once: BoolProperty(
+        name="Render Holds Once",
+        description="Render frames where nothing changes once and link the copies (parallel and incremental renders)",
+        default=True
+    )
+    
+    warm_shaders: BoolProperty(
+        name="Warm Up Shaders",
+        description="Compile Eevee materials before the first frame (in-process renders; skipped for shaders still warm this session)",
+        default=True
+    )
+    
     def execute(self, context):
         # Apply render preset
-        self.apply_render_preset(context)
+        apply_render_preset(context.scene, animation=True)
         
         # Set output path
         self.set_output_path(context)
         
+        # Background renders snapshot the file before start returns, so the tier can be undone right after
+        restore = quality_settings(context.scene)
+        try:
+            return self.render(context)
+        finally:
+            restore()
+    
+    def render(self, context):
+        # Worker processes compile their own shaders; only warm this session when it renders
+        in_process = not can_run_modal(context) or not (self.incremental or self.parallel or self.background)
+        if self.warm_shaders and in_process:
+            timings = shader_warmup.warm_up(context)
+            if timings:
+                self.report({'INFO'}, shader_warmup.format_timings(timings))
+        
+        if self.incremental:
+            return self.render_incremental(context)
+        
+        if self.parallel and can_run_modal(context):
+            scene = context.scene
+            encode_to = bpy.path.abspath(scene.render.filepath) + ".mp4"
+            frames = holds = None
+            if self.render_holds_once:
+                prepare_frames_dir(bpy.path.abspath(scene.render.filepath) + "_frames")
+                _, groups = analyze_frames(scene, range(scene.frame_start, scene.frame_end + 1, max(scene.frame_step, 1)))
+                frames, holds = plan_holds(groups)
+            return self.start_parallel_render(
+                context, "Animation", self.workers, self.threads_per_worker, encode_to, frames=frames, holds=holds
+            )
+        
+        if self.background and can_run_modal(context):
+            return self.start_background_render(context, "Animation")
+        
         # Render animation
         bpy.ops.render.render(animation=True)
         
         self.report({'INFO'}, "Animation render started")
         return {'FINISHED'}
     
-    def apply_render_preset(self, context):
-        """Apply render settings based on preset"""
+    def render_incremental(self, context):
+        """Render only frames whose content key has no cached output, then encode"""
         scene = context.scene
         render = scene.render
-        preset = scene.norent.render_preset
+        output_base = bpy.path.abspath(render.filepath)
+        self.encode_to = output_base + ".mp4"
+        self.frames_dir = output_base + "_frames"
+        self.cache_dir = os.path.join(os.path.dirname(output_base), CACHE_DIR_NAME)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        prepare_frames_dir(self.frames_dir)
+        
+        start = time.perf_counter()
+        frames = range(scene.frame_start, scene.frame_end + 1, max(scene.frame_step, 1))
+        self.frame_keys, groups = analyze_frames(scene, frames)
+        hits, self.misses = restore_hits(self.frame_keys, self.cache_dir, self.frames_dir)
+        if not self.render_holds_once:
+            groups = [[frame] for frame in frames]
+        to_render, holds = plan_holds(groups, ready=hits)
+        self.cache_stats = {
+            "hits": len(hits), "misses": len(self.misses), "held": held_count(holds),
+            "hash_time": time.perf_counter() - start,
+        }
         
-        if preset == 'REEL':
-            render.resolution_x = 1080
-            render.resolution_y = 1920
-            render.fps = 30
-        elif preset == 'SQUARE':
-            render.resolution_x = 1080
-            render.resolution_y = 1080
-            render.fps = 30
-        elif preset == 'STORY':
-            render.resolution_x = 1080
-            render.resolution_y = 1920
-            render.fps = 30
-        elif preset == 'LANDSCAPE':
-            render.resolution_x = 1920
-            render.resolution_y = 1080
-            render.fps = 30
-        
-        # Set output format for animation
-        render.image_settings.file_format = 'FFMPEG'
-        render.ffmpeg.format = 'MPEG4'
-        render.ffmpeg.codec = 'H264'
-        render.ffmpeg.constant_rate_factor = 'HIGH'
+        if can_run_modal(context):
+            return self.start_parallel_render(
+                context, "Incremental", self.workers, self.threads_per_worker, self.encode_to,
+                frames=to_render, holds=holds
+            )
+        
+        # Foreground: render the misses one by one into the sequence
+        restore = sequence_settings(scene, self.frames_dir)
+        original_frame = scene.frame_current
+        try:
+            for frame in to_render:
+                scene.frame_set(frame)
+                bpy.ops.render.render(write_still=True)
+        finally:
+            restore()
+            scene.frame_set(original_frame)
+        fill_holds(self.frames_dir, holds)
+        
+        scale = render.resolution_percentage / 100
+        resolution = (int(render.resolution_x * scale), int(render.resolution_y * scale))
+        result = subprocess.run(
+            encode_command(self.frames_dir, render.fps / render.fps_base, self.encode_to, resolution),
+            capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            detail = result.stderr.strip().splitlines()[-1:] or [f"exit code {result.returncode}"]
+            self.report({'ERROR'}, f"ffmpeg failed to encode {os.path.basename(self.encode_to)}: {detail[0]}")
+            return {'CANCELLED'}
+        self.finish_incremental()
+        return {'FINISHED'}
+    
+    def finish_incremental(self):
+        store_frames(self.frame_keys, self.misses, self.cache_dir, self.frames_dir)
+        self.cache_stats["evicted"], _ = evict(
+            self.cache_dir, self.cache_limit * 1024 ** 3, keep=self.frame_keys.values()
+        )
+        self.report({'INFO'}, f"Rendered {os.path.basename(self.encode_to)}: {cache_report(self.cache_stats)}")
+    
+    def on_render_finished(self, context, job):
+        if self.incremental:
+            self.finish_incremental()
+            return
+        super().on_render_finished(context, job)
     
     def set_output_path(self, context):
         """Set appropriate output path"""
@@ -109,15 +330,38 @@ class NORENT_OT_RenderAnimation(Operator):
         filename = f"NORENT_{preset}_{scene.name}"
         scene.render.filepath = os.path.join(output_dir, filename)
 
-class NORENT_OT_ExportMP4(Operator):
+class NORENT_OT_ExportMP4(BackgroundRenderMixin, Operator):
     """Export animation as MP4"""
     bl_idname = "norent.export_mp4"
     bl_label = "Export MP4"
     bl_description = "Export animation as MP4 file"
     
+    background: BoolProperty(
+        name="Background",
+        description="Render in a separate Blender process and keep working meanwhile",
+        default=True
+    )
+    
+    stream: BoolProperty(
+        name="Stream to ffmpeg",
+        description="Pipe each rendered frame straight into a local ffmpeg process instead of Blender's movie writer",
+        default=False
+    )
+    
     def execute(self, context):
+        # Background renders snapshot the file before start returns, so the tier can be undone right after
+        restore = quality_settings(context.scene)
+        try:
+            return self.export(context)
+        finally:
+            restore()
+    
+    def export(self, context):
         scene = context.scene
         render = scene.render
+        if self.stream and not find_ffmpeg():
+            self.report({'ERROR'}, "ffmpeg not found on PATH")
+            return {'CANCELLED'}
         
         # Store original settings
         original_format = render.image_settings.file_format
@@ -139,18 +383,33 @@ class NORENT_OT_ExportMP4(Operator):
         filename = f"NORENT_{preset}_{scene.name}.mp4"
         render.filepath = os.path.join(output_dir, filename)
         
-        # Render
-        bpy.ops.render.render(animation=True)
+        # Render (the background job renders a snapshot of these settings)
+        result = {'FINISHED'}
+        stats = None
+        stream = self.stream and self.check_stream(scene)
+        if self.background and can_run_modal(context):
+            if stream:
+                result = self.start_stream_render(context, "MP4 Export", render.filepath)
+            else:
+                result = self.start_background_render(context, "MP4 Export")
+        elif stream:
+            stats = stream_scene(scene, render.filepath)
+        else:
+            bpy.ops.render.render(animation=True)
         
         # Restore original settings
         render.image_settings.file_format = original_format
         render.ffmpeg.format = original_ffmpeg_format
         render.ffmpeg.codec = original_codec
         
-        self.report({'INFO'}, f"MP4 exported to {filename}")
-        return {'FINISHED'}
+        if stats and stats["error"]:
+            self.report({'ERROR'}, f"Streaming export failed: {stats['error']}")
+            return {'CANCELLED'}
+        if result == {'FINISHED'}:
+            self.report({'INFO'}, f"MP4 exported to {filename}" + (f" | {format_stats(stats)}" if stats else ""))
+        return result
 
-class NORENT_OT_ExportGIF(Operator):
+class NORENT_OT_ExportGIF(BackgroundRenderMixin, Operator):
     """Export animation as GIF"""
     bl_idname = "norent.export_gif"
     bl_label = "Export GIF"
@@ -167,51 +426,114 @@ class NORENT_OT_ExportGIF(Operator):
         default='MEDIUM'
     )
     
+    background: BoolProperty(
+        name="Background",
+        description="Render in a separate Blender process and keep working meanwhile",
+        default=True
+    )
+    
     def execute(self, context):
+        # Background renders snapshot the file before start returns, so the tier can be undone right after
+        restore = quality_settings(context.scene)
+        try:
+            return self.export(context)
+        finally:
+            restore()
+    
+    def export(self, context):
         scene = context.scene
         render = scene.render
         
         # Store original settings
         original_format = render.image_settings.file_format
+        original_color_mode = render.image_settings.color_mode
         original_res_x = render.resolution_x
         original_res_y = render.resolution_y
+        original_filepath = render.filepath
         
         # Set GIF-appropriate settings
-        if self.quality == 'HIGH':
-            scale = 1.0
-        elif self.quality == 'MEDIUM':
-            scale = 0.75
-        else:  # LOW
-            scale = 0.5
-        
+        scale = GIF_QUALITY[self.quality]["scale"]
         render.resolution_x = int(original_res_x * scale)
         render.resolution_y = int(original_res_y * scale)
         render.image_settings.file_format = 'PNG'
+        render.image_settings.color_mode = 'RGBA'
         
         # Set output path for frames
-        output_dir = os.path.join(bpy.path.abspath("//"), "NORENT_GIF_Frames")
+        self.frames_dir = os.path.join(bpy.path.abspath("//"), "NORENT_GIF_Frames")
+        prepare_frames_dir(self.frames_dir)
+        render.filepath = os.path.join(self.frames_dir, SEQUENCE_PREFIX)
+        
+        output_dir = os.path.join(bpy.path.abspath("//"), "NORENT_Exports")
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
-        
-        render.filepath = os.path.join(output_dir, "frame_")
-        
-        # Render frames
-        bpy.ops.render.render(animation=True)
-        
-        # Note: Actual GIF creation would require external tool like ffmpeg
-        # This is a placeholder for the frame export process
-        
-        # Restore original settings
-        render.image_settings.file_format = original_format
-        render.resolution_x = original_res_x
-        render.resolution_y = original_res_y
-        
-        self.report({'INFO'}, f"GIF frames exported ({self.quality} quality)")
+        self.output_path = os.path.join(output_dir, f"NORENT_{scene.norent.render_preset}_{scene.name}.gif")
+        # Each written frame covers frame_step scene frames
+        self.gif_fps = render.fps / render.fps_base / max(scene.frame_step, 1)
+        
+        # Render frames, then encode them (chained after a background render)
+        try:
+            if self.background and can_run_modal(context):
+                return self.start_background_render(context, "GIF Export")
+            bpy.ops.render.render(animation=True)
+        finally:
+            # Restore original settings
+            render.image_settings.file_format = original_format
+            render.image_settings.color_mode = original_color_mode
+            render.resolution_x = original_res_x
+            render.resolution_y = original_res_y
+            render.filepath = original_filepath
+        
+        job = self.gif_job()
+        if job is None:
+            self.report({'ERROR'}, "No frames were rendered")
+            return {'CANCELLED'}
+        try:
+            job.run()
+        finally:
+            job.cleanup()
+        if not job.succeeded:
+            self.report({'ERROR'}, f"GIF encode failed: {job.error}")
+            return {'CANCELLED'}
+        self.report_gif(job)
         return {'FINISHED'}
     
+    def gif_job(self):
+        files = [os.path.join(self.frames_dir, f) for f in sequence_files(self.frames_dir)]
+        if not files:
+            return None
+        return GifEncodeJob(files, self.output_path, self.quality, self.gif_fps)
+    
+    def report_gif(self, job):
+        stats = job.stats
+        size = os.path.getsize(self.output_path) / 1024
+        self.report(
+            {'INFO'},
+            f"GIF exported to {os.path.basename(self.output_path)} ({size:.0f} KB, "
+            f"{stats['written']} frames, {stats['merged']} duplicates merged)"
+        )
+    
+    def on_render_finished(self, context, job):
+        if isinstance(job, GifEncodeJob):
+            self.report_gif(job)
+            return None
+        return self.gif_job()
+    
     def invoke(self, context, event):
         return context.window_manager.invoke_props_dialog(self)
 
+# Template files shipped in the add-on's templates directory
+TEMPLATE_FILES = {
+    'LOWER_THIRD': "lower_third.blend",
+    'LYRIC_VIDEO': "lyric_video.blend",
+    'INTRO_SPLASH': "intro_splash.blend",
+    'TRANSITION': "transition_pack.blend",
+    'LOGO_REVEAL': "logo_reveal.blend"
+}
+
+def template_file_path(template_name):
+    addon_dir = os.path.dirname(os.path.realpath(__file__))
+    return os.path.join(addon_dir, "templates", TEMPLATE_FILES[template_name])
+
 class NORENT_OT_LoadTemplate(Operator):
     """Load animation template"""
     bl_idname = "norent.load_template"
@@ -237,26 +559,39 @@ class NORENT_OT_LoadTemplate(Operator):
         default=False
     )
     
+    filepath: StringProperty(
+        name="Template File",
+        description="Template .blend from the catalog (overrides Template)",
+        subtype='FILE_PATH',
+        options={'SKIP_SAVE'}
+    )
+    
+    mode: EnumProperty(
+        name="Mode",
+        description="Copy the template into this file or instance it from the library",
+        items=[
+            ('APPEND', "Append", "Copy the template's objects and materials into this file"),
+            ('LINK', "Link Instance", "Link the template once and add a collection instance; repeated inserts share its data")
+        ],
+        default='APPEND'
+    )
+    
+    deduplicate: BoolProperty(
+        name="Merge Duplicates",
+        description="Reuse materials, node groups and images already in the file when their content is identical",
+        default=True
+    )
+    
     def execute(self, context):
-        # Get addon directory
-        addon_dir = os.path.dirname(os.path.realpath(__file__))
-        templates_dir = os.path.join(addon_dir, "templates")
-        
-        # Template file mapping
-        template_files = {
-            'LOWER_THIRD': "lower_third.blend",
-            'LYRIC_VIDEO': "lyric_video.blend",
-            'INTRO_SPLASH': "intro_splash.blend",
-            'TRANSITION': "transition_pack.blend",
-            'LOGO_REVEAL': "logo_reveal.blend"
-        }
-        
-        template_file = template_files.get(self.template_name)
-        if not template_file:
-            self.report({'ERROR'}, "Template not found")
-            return {'CANCELLED'}
-        
-        template_path = os.path.join(templates_dir, template_file)
+        if self.filepath:
+            template_path = bpy.path.abspath(self.filepath)
+            template_file = os.path.basename(template_path)
+        else:
+            template_file = TEMPLATE_FILES.get(self.template_name)
+            if not template_file:
+                self.report({'ERROR'}, "Template not found")
+                return {'CANCELLED'}
+            template_path = template_file_path(self.template_name)
         
         if not os.path.exists(template_path):
             self.report({'ERROR'}, f"Template file not found: {template_file}")
@@ -267,7 +602,11 @@ class NORENT_OT_LoadTemplate(Operator):
             bpy.ops.object.select_all(action='SELECT')
             bpy.ops.object.delete()
         
+        if self.mode == 'LINK':
+            return self.link_template(context, template_path)
+        
         # Append template objects
+        before = dedup.snapshot()
         with bpy.data.libraries.load(template_path) as (data_from, data_to):
             data_to.objects = data_from.objects
             data_to.materials = data_from.materials
@@ -278,7 +617,22 @@ class NORENT_OT_LoadTemplate(Operator):
             if obj:
                 context.collection.objects.link(obj)
         
-        self.report({'INFO'}, f"Template '{self.template_name}' loaded")
+        if self.deduplicate:
+            removed = dedup.deduplicate(dedup.added_since(before))
+            self.report({'INFO'}, dedup.format_removed(removed))
+        
+        self.report({'INFO'}, f"Template '{os.path.splitext(template_file)[0] if self.filepath else self.template_name}' loaded")
+        return {'FINISHED'}
+    
+    def link_template(self, context, template_path):
+        instance, elapsed, added = template_link.instance_template(context, template_path)
+        wrapper = instance.instance_collection
+        count = len(template_link.template_instances(wrapper))
+        shared = template_link.shared_summary(wrapper)
+        
+        self.report({'INFO'}, f"Linked instance {count} of '{wrapper.name}' in {elapsed * 1000:.0f} ms, added {template_link.format_added(added)}")
+        if shared:
+            self.report({'INFO'}, f"Shared by {count} instances: {shared}")
         return {'FINISHED'}
     
     def invoke(self, context, event):
@@ -313,12 +667,122 @@ class NORENT_OT_SaveTemplate(Operator):
         # Save current file as template
         bpy.ops.wm.save_as_mainfile(filepath=template_path, copy=True)
         
+        # Index it right away so the catalog lists it
+        template_catalog.refresh_catalog(context.window_manager)
+        
         self.report({'INFO'}, f"Template saved as '{template_file}'")
         return {'FINISHED'}
     
     def invoke(self, context, event):
         return context.window_manager.invoke_props_dialog(self)
 
+class NORENT_OT_TemplateBatch(BackgroundRenderMixin, Operator):
+    """Render one template variant per row of a spreadsheet"""
+    bl_idname = "norent.template_batch"
+    bl_label = "Template Batch"
+    bl_description = "Fill a template from CSV/JSON rows (text:, color:, image: columns) and render every variant in parallel"
+    
+    data_path: StringProperty(
+        name="Rows",
+        description="CSV, JSON or JSON Lines file; columns like text:Title, color:Brand, image:Logo and name",
+        subtype='FILE_PATH'
+    )
+    
+    template_name: EnumProperty(
+        name="Template",
+        description="Template appended once per worker",
+        items=[
+            ('NONE', "Current Scene", "The scene already contains the template"),
+            ('LOWER_THIRD', "Lower Third", "Lower third text overlay"),
+            ('LYRIC_VIDEO', "Lyric Video", "Lyric video template"),
+            ('INTRO_SPLASH', "Intro Splash", "Brand intro template"),
+            ('TRANSITION', "Transition", "Scene transition pack"),
+            ('LOGO_REVEAL', "Logo Reveal", "Logo animation template")
+        ],
+        default='NONE'
+    )
+    
+    mode: EnumProperty(
+        name="Output",
+        items=[
+            ('STILL', "Still", "One PNG of the current frame per row"),
+            ('ANIMATION', "Animation", "One MP4 of the frame range per row")
+        ],
+        default='STILL'
+    )
+    
+    workers: IntProperty(
+        name="Workers",
+        description="Number of worker processes (0 = fill all cores)",
+        default=0,
+        min=0,
+        max=128
+    )
+    
+    threads_per_worker: IntProperty(
+        name="Threads per Worker",
+        description="Render threads for each worker (0 = automatic)",
+        default=0,
+        min=0,
+        max=256
+    )
+    
+    def execute(self, context):
+        scene = context.scene
+        rows_path = bpy.path.abspath(self.data_path)
+        if not os.path.isfile(rows_path):
+            self.report({'ERROR'}, "Choose a CSV or JSON file with the rows")
+            return {'CANCELLED'}
+        try:
+            total = template_batch.count_rows(rows_path)
+        except (ValueError, UnicodeDecodeError) as error:
+            self.report({'ERROR'}, f"Can't read rows: {error}")
+            return {'CANCELLED'}
+        if not total:
+            self.report({'WARNING'}, "No rows to render")
+            return {'CANCELLED'}
+        
+        template = None
+        if self.template_name != 'NONE':
+            template = template_file_path(self.template_name)
+            if not os.path.exists(template):
+                self.report({'ERROR'}, f"Template file not found: {TEMPLATE_FILES[self.template_name]}")
+                return {'CANCELLED'}
+        
+        apply_preset_resolution(scene)
+        output_dir = os.path.join(
+            bpy.path.abspath("//"), "NORENT_Renders", bpy.path.clean_name(os.path.splitext(os.path.basename(rows_path))[0])
+        )
+        workers, threads = default_workers(self.threads_per_worker)
+        workers = min(self.workers or workers, total)
+        spec = {
+            "rows": rows_path, "template": template, "mode": self.mode, "frame": scene.frame_current,
+            "output_dir": output_dir, "workers": workers,
+            "base_dir": os.path.dirname(rows_path), "blend_dir": bpy.path.abspath("//"),
+        }
+        
+        restore = quality_settings(scene)
+        try:
+            snapshot = save_snapshot(f"Template_Batch_{scene.name}")
+        finally:
+            restore()
+        commands = [
+            blender_command(snapshot, ["-S", scene.name, "-t", str(threads)] + template_batch.worker_args(dict(spec, worker=k)))
+            for k in range(workers)
+        ]
+        job = TemplateBatchJob(commands, total, snapshot)
+        self.output_dir = output_dir
+        return self.start_job(context, job)
+    
+    def on_render_finished(self, context, job):
+        text = f"Template batch: {len(job.outputs)} variants in {format_duration(job.elapsed)} -> {self.output_dir}"
+        if job.row_errors:
+            text += f"; {len(job.row_errors)} rows failed (first: {job.row_errors[0]})"
+        self.report({'WARNING'} if job.row_errors else {'INFO'}, text)
+    
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
 class NORENT_OT_OptimizeScene(Operator):
     """Optimize scene for motion graphics"""
     bl_idname = "norent.optimize_scene"
@@ -357,7 +821,7 @@ class NORENT_OT_OptimizeScene(Operator):
         self.report({'INFO'}, "Scene optimized for motion graphics")
         return {'FINISHED'}
 
-class NORENT_OT_QuickPreview(Operator):
+class NORENT_OT_QuickPreview(BackgroundRenderMixin, Operator):
     """Quick viewport render preview"""
     bl_idname = "norent.quick_preview"
     bl_label = "Quick Preview"
@@ -375,8 +839,52 @@ class NORENT_OT_QuickPreview(Operator):
         default='2'
     )
     
+    background: BoolProperty(
+        name="Background",
+        description="Render in a separate Blender process and keep working meanwhile",
+        default=True
+    )
+    
+    stream: BoolProperty(
+        name="Stream to ffmpeg",
+        description="Pipe each rendered frame straight into a local ffmpeg process instead of Blender's movie writer",
+        default=False
+    )
+    
+    use_budget: BoolProperty(
+        name="Time Budget",
+        description="Probe a few frames, then pick resolution, frame step, samples and simplify to finish within the budget",
+        default=False
+    )
+    
+    time_budget: FloatProperty(
+        name="Budget (s)",
+        description="Seconds the preview may take, probe renders included",
+        default=30.0,
+        min=5.0,
+        max=3600.0
+    )
+    
+    allow_viewport: BoolProperty(
+        name="Allow Viewport Render",
+        description="Use a viewport (OpenGL) render when the engine would need heavy compromises to fit the budget",
+        default=True
+    )
+    
     def execute(self, context):
         scene = context.scene
+        if self.stream and not find_ffmpeg():
+            self.report({'ERROR'}, "ffmpeg not found on PATH")
+            return {'CANCELLED'}
+        
+        # Plan settings that fit the time budget
+        plan = None
+        if self.use_budget:
+            background = self.background and can_run_modal(context)
+            model = PreviewModel(scene, use_opengl=self.allow_viewport and can_run_modal(context))
+            plan = choose_plan(model, self.time_budget - model.probe_time, background)
+            self.predicted = model.predict(plan, background)
+            self.plan_text = describe_plan(plan)
         
         # Store original settings
         original_step = scene.frame_step
@@ -384,10 +892,14 @@ class NORENT_OT_QuickPreview(Operator):
         original_res_x = scene.render.resolution_x
         original_res_y = scene.render.resolution_y
         
-        # Set preview settings
-        scene.frame_step = int(self.frame_step)
-        scene.render.resolution_x = int(original_res_x * 0.5)  # Half resolution for speed
-        scene.render.resolution_y = int(original_res_y * 0.5)
+        # Set preview settings; a budget plan picks its own samples and simplify
+        if plan:
+            restore_plan = preview_settings(scene, plan["scale"], plan["step"], plan["samples"], plan["simplify"])
+        else:
+            restore_plan = quality_settings(scene)
+            scene.frame_step = int(self.frame_step)
+            scene.render.resolution_x = int(original_res_x * 0.5)  # Half resolution for speed
+            scene.render.resolution_y = int(original_res_y * 0.5)
         scene.render.image_settings.file_format = 'FFMPEG'
         scene.render.ffmpeg.format = 'MPEG4'
         scene.render.ffmpeg.codec = 'H264'
@@ -401,16 +913,56 @@ class NORENT_OT_QuickPreview(Operator):
         scene.render.filepath = os.path.join(output_dir, filename)
         
         # Render preview
-        bpy.ops.render.render(animation=True)
+        result = {'FINISHED'}
+        stats = None
+        stream_path = scene.render.filepath + ".mp4"
+        start = time.perf_counter()
+        stream = self.stream and not (plan and plan["opengl"]) and self.check_stream(scene)
+        if plan and plan["opengl"]:
+            bpy.ops.render.opengl(animation=True)
+        elif self.background and can_run_modal(context):
+            if stream:
+                result = self.start_stream_render(context, "Preview", stream_path)
+            else:
+                result = self.start_background_render(context, "Preview")
+        elif stream:
+            stats = stream_scene(scene, stream_path)
+        else:
+            bpy.ops.render.render(animation=True)
         
         # Restore original settings
+        restore_plan()
         scene.frame_step = original_step
         scene.render.resolution_x = original_res_x
         scene.render.resolution_y = original_res_y
         scene.render.image_settings.file_format = original_format
         
-        self.report({'INFO'}, f"Quick preview rendered (step: {self.frame_step})")
-        return {'FINISHED'}
+        if stats and stats["error"]:
+            self.report({'ERROR'}, f"Streaming preview failed: {stats['error']}")
+            return {'CANCELLED'}
+        if result == {'FINISHED'} and plan:
+            self.report_budget(scene, time.perf_counter() - start)
+        elif result == {'FINISHED'}:
+            self.report({'INFO'}, f"Quick preview rendered (step: {self.frame_step})" + (f" | {format_stats(stats)}" if stats else ""))
+        elif plan:
+            self.report({'INFO'}, f"Preview plan: {self.plan_text}, predicted {format_duration(self.predicted)}")
+        return result
+    
+    def report_budget(self, scene, actual):
+        """Predicted vs. actual time; the error calibrates the next prediction"""
+        record_actual(scene, self.predicted, actual)
+        error = (actual - self.predicted) / self.predicted * 100 if self.predicted else 0.0
+        self.report(
+            {'INFO'},
+            f"Preview ({self.plan_text}): predicted {format_duration(self.predicted)}, "
+            f"actual {format_duration(actual)} ({error:+.0f}%)"
+        )
+    
+    def on_render_finished(self, context, job):
+        if self.use_budget:
+            self.report_budget(context.scene, job.elapsed)
+            return
+        super().on_render_finished(context, job)
     
     def invoke(self, context, event):
         return context.window_manager.invoke_props_dialog(self)
@@ -657,6 +1209,7 @@ classes = [
     NORENT_OT_ExportGIF,
     NORENT_OT_LoadTemplate,
     NORENT_OT_SaveTemplate,
+    NORENT_OT_TemplateBatch,
     NORENT_OT_OptimizeScene,
     NORENT_OT_QuickPreview,
     NORENT_OT_CleanupScene,